@@ -4,6 +4,8 @@ Request schemas for memory API.
 Defines Pydantic models for API request validation.
 """
 
+from uuid import UUID
+
 from pydantic import BaseModel, Field
 
 
@@ -37,6 +39,42 @@ class CreateMemoryRequest(BaseModel):
     }
 
 
+class BulkMemoryItem(BaseModel):
+    """Single memory in a bulk create request."""
+
+    fact: str = Field(..., description="The memory fact or statement", min_length=1)
+    source_type: str = Field(
+        ..., description="Source of memory (conversation, extraction, manual)", max_length=50
+    )
+    topic: str | None = Field(None, description="Optional topic category", max_length=200)
+    embedding: list[float] | None = Field(None, description="Optional vector embedding")
+    confidence: float | None = Field(None, description="Confidence score (0-1)", ge=0.0, le=1.0)
+    importance: float | None = Field(None, description="Importance score (0-1)", ge=0.0, le=1.0)
+    source_id: UUID | None = Field(None, description="Optional source ID reference")
+    ttl_days: int | None = Field(None, description="Time to live in days", gt=0, le=730)
+
+
+class BulkCreateMemoriesRequest(BaseModel):
+    """Request model for creating several memories in one scope."""
+
+    scope: dict = Field(..., description="Memory scope shared by all items")
+    items: list[BulkMemoryItem] = Field(
+        ..., description="Memories to create", min_length=1, max_length=500
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "scope": {"user_id": "user_123"},
+                "items": [
+                    {"fact": "User prefers dark mode", "source_type": "consolidated"},
+                    {"fact": "User works in Python", "source_type": "consolidated"},
+                ],
+            }
+        }
+    }
+
+
 class UpdateMemoryRequest(BaseModel):
     """Request model for updating a memory."""
 
@@ -66,6 +66,13 @@ class MemoryListResponse(BaseModel):
     }
 
 
+class BulkCreateMemoriesResponse(BaseModel):
+    """Response model for bulk memory creation."""
+
+    memories: list[MemoryResponse] = Field(..., description="Created memories, in request order")
+    created: int = Field(..., description="Number of memories created")
+
+
 class DeleteResponse(BaseModel):
     """Response model for delete operations."""
 
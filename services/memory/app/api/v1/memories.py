@@ -10,11 +10,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from services.memory.app.api.schemas.requests import (
+    BulkCreateMemoriesRequest,
     CreateMemoryRequest,
     SearchMemoriesRequest,
     UpdateMemoryRequest,
 )
 from services.memory.app.api.schemas.responses import (
+    BulkCreateMemoriesResponse,
     DeleteResponse,
     MemoryListResponse,
     MemoryResponse,
@@ -53,6 +55,28 @@ async def create_memory(
     return MemoryResponse.model_validate(memory)
 
 
+@router.post(
+    "/memories/bulk",
+    response_model=BulkCreateMemoriesResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several memories in one scope",
+)
+async def create_memories_bulk(
+    request: BulkCreateMemoriesRequest,
+    service: Annotated[MemoryService, Depends(get_memory_service)],
+) -> BulkCreateMemoriesResponse:
+    """Create all memories in a single transaction; either every item is created or none."""
+    memories = await service.create_memories(
+        scope=request.scope,
+        items=[item.model_dump() for item in request.items],
+    )
+    await service.db.commit()
+    return BulkCreateMemoriesResponse(
+        memories=[MemoryResponse.model_validate(m) for m in memories],
+        created=len(memories),
+    )
+
+
 @router.get(
     "/memories/{memory_id}",
     response_model=MemoryResponse,
@@ -5,9 +5,10 @@ Provides CRUD operations and queries for Memory model.
 """
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.memory.app.db.models import Memory
@@ -67,6 +68,25 @@ class MemoryRepository(BaseRepository[Memory]):
             expires_at=expires_at,
         )
 
+    async def create_memories(self, records: list[dict[str, Any]]) -> list[Memory]:
+        """
+        Create several memories with a single multi-row INSERT.
+
+        Args:
+            records: Memory field values, one dict per memory (same keys in each)
+
+        Returns:
+            Created memory instances, in input order
+        """
+        if not records:
+            return []
+
+        result = await self.db.scalars(
+            insert(Memory).returning(Memory, sort_by_parameter_order=True),
+            records,
+        )
+        return list(result.all())
+
     async def get_by_scope(
         self,
         scope: dict,
@@ -5,6 +5,7 @@ Manages memory creation, updates, and lifecycle with confidence tracking.
 """
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -72,13 +73,7 @@ class MemoryService:
             importance = self.settings.default_importance
 
         # Calculate expiration if TTL provided
-        expires_at = None
-        if ttl_days is not None:
-            # Cap at max TTL
-            ttl_days = min(ttl_days, self.settings.max_memory_ttl_days)
-            expires_at = datetime.now(UTC) + timedelta(days=ttl_days)
-        elif self.settings.default_memory_ttl_days > 0:
-            expires_at = datetime.now(UTC) + timedelta(days=self.settings.default_memory_ttl_days)
+        expires_at = self._calculate_expires_at(ttl_days)
 
         # Create the memory
         memory = await self.memory_repo.create_memory(
@@ -95,6 +90,59 @@ class MemoryService:
 
         return memory
 
+    async def create_memories(self, scope: dict, items: list[dict[str, Any]]) -> list[Memory]:
+        """
+        Create several memories in one scope with a single insert.
+
+        Args:
+            scope: User/session scope shared by all memories
+            items: Memory fields per item (fact, source_type and optional topic,
+                embedding, confidence, importance, source_id, ttl_days)
+
+        Returns:
+            Created memory instances, in input order
+        """
+        default_confidence = self.settings.default_confidence
+        default_importance = self.settings.default_importance
+
+        records = []
+        for item in items:
+            confidence = item.get("confidence")
+            importance = item.get("importance")
+            records.append(
+                {
+                    "scope": scope,
+                    "fact": item["fact"],
+                    "source_type": item["source_type"],
+                    "topic": item.get("topic"),
+                    "embedding": item.get("embedding"),
+                    "confidence": default_confidence if confidence is None else confidence,
+                    "importance": default_importance if importance is None else importance,
+                    "source_id": item.get("source_id"),
+                    "expires_at": self._calculate_expires_at(item.get("ttl_days")),
+                }
+            )
+
+        return await self.memory_repo.create_memories(records)
+
+    def _calculate_expires_at(self, ttl_days: int | None) -> datetime | None:
+        """
+        Calculate memory expiration from a TTL, capped at the configured maximum.
+
+        Args:
+            ttl_days: Optional TTL in days, defaults to config
+
+        Returns:
+            Expiration timestamp, or None if memories do not expire
+        """
+        if ttl_days is not None:
+            # Cap at max TTL
+            ttl_days = min(ttl_days, self.settings.max_memory_ttl_days)
+            return datetime.now(UTC) + timedelta(days=ttl_days)
+        if self.settings.default_memory_ttl_days > 0:
+            return datetime.now(UTC) + timedelta(days=self.settings.default_memory_ttl_days)
+        return None
+
     async def get_memory(self, memory_id: UUID) -> Memory | None:
         """
         Get a memory by ID and update access tracking.
@@ -4,6 +4,8 @@ Integration tests for memories CRUD API endpoints.
 Tests all REST API operations for memory management.
 """
 
+from uuid import uuid4
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -166,6 +168,44 @@ class TestCreateMemory:
         assert response.status_code == 422
 
 
+class TestCreateMemoriesBulk:
+    """Tests for POST /api/v1/memories/bulk endpoint."""
+
+    def test_create_memories_bulk_success(self, client):
+        """Test creating several memories in one request."""
+        source_id = str(uuid4())
+        response = client.post(
+            "/api/v1/memories/bulk",
+            json={
+                "scope": {"user_id": "user_bulk"},
+                "items": [
+                    {"fact": "User likes tea", "source_type": "extracted", "source_id": source_id},
+                    {"fact": "User lives in Lisbon", "source_type": "extracted"},
+                ],
+            },
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+
+        assert data["created"] == 2
+        assert [m["fact"] for m in data["memories"]] == ["User likes tea", "User lives in Lisbon"]
+        assert data["memories"][0]["source_id"] == source_id
+        assert data["memories"][1]["source_id"] is None
+
+    def test_create_memories_bulk_invalid_source_id(self, client):
+        """Test a malformed source_id is rejected as a validation error."""
+        response = client.post(
+            "/api/v1/memories/bulk",
+            json={
+                "scope": {"user_id": "user_bulk"},
+                "items": [{"fact": "User likes tea", "source_type": "extracted", "source_id": "x"}],
+            },
+        )
+
+        assert response.status_code == 422
+
+
 class TestGetMemory:
     """Tests for GET /api/v1/memories/{memory_id} endpoint."""
 
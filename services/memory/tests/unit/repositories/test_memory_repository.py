@@ -111,6 +111,34 @@ class TestCreateMemory:
         assert result == mock_memory
 
 
+class TestCreateMemories:
+    """Tests for create_memories method."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_all_records_in_one_statement(self, memory_repo, mock_db):
+        """Test records are inserted with a single multi-row INSERT."""
+        records = [
+            {"scope": {"user_id": "user_1"}, "fact": "Fact one", "source_id": uuid4()},
+            {"scope": {"user_id": "user_1"}, "fact": "Fact two", "source_id": None},
+        ]
+        created = [MagicMock(), MagicMock()]
+        mock_result = MagicMock()
+        mock_result.all.return_value = created
+        mock_db.scalars.return_value = mock_result
+
+        result = await memory_repo.create_memories(records)
+
+        mock_db.scalars.assert_awaited_once()
+        assert mock_db.scalars.await_args.args[1] is records
+        assert result == created
+
+    @pytest.mark.asyncio
+    async def test_empty_records_skip_insert(self, memory_repo, mock_db):
+        """Test no statement is executed for an empty batch."""
+        assert await memory_repo.create_memories([]) == []
+        mock_db.scalars.assert_not_called()
+
+
 class TestGetByScope:
     """Tests for get_by_scope method."""
 
@@ -135,6 +135,43 @@ class TestCreateMemory:
         assert time_diff < 2  # Within 2 seconds
 
 
+class TestCreateMemories:
+    """Tests for create_memories method."""
+
+    @pytest.mark.asyncio
+    async def test_creates_all_items_in_one_insert(self, memory_service, sample_memory):
+        """Test bulk creation applies defaults per item and inserts once."""
+        memory_service.memory_repo.create_memories = AsyncMock(
+            return_value=[sample_memory, sample_memory]
+        )
+
+        result = await memory_service.create_memories(
+            scope={"user_id": "test_user"},
+            items=[
+                {"fact": "User likes Python", "source_type": "consolidated"},
+                {
+                    "fact": "User knows Rust",
+                    "source_type": "consolidated",
+                    "confidence": 0.8,
+                    "importance": 0.7,
+                    "ttl_days": 1000,
+                },
+            ],
+        )
+
+        memory_service.memory_repo.create_memories.assert_awaited_once()
+        records = memory_service.memory_repo.create_memories.call_args.args[0]
+
+        assert [r["scope"] for r in records] == [{"user_id": "test_user"}] * 2
+        assert records[0]["confidence"] == 1.0
+        assert records[0]["importance"] == 0.5
+        assert records[1]["confidence"] == 0.8
+        assert records[1]["importance"] == 0.7
+        expected_max = datetime.now(UTC) + timedelta(days=730)
+        assert abs((records[1]["expires_at"] - expected_max).total_seconds()) < 2
+        assert result == [sample_memory, sample_memory]
+
+
 class TestGetMemory:
     """Tests for get_memory method."""
 
@@ -201,6 +201,7 @@ async def list_events(
     event_type: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=1000)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
+    has_content: Annotated[bool, Query()] = False,
 ) -> EventListResponse:
     """List events for a specific session."""
     events = await event_repo.list_events(
@@ -208,11 +209,13 @@ async def list_events(
         event_type=event_type,
         limit=limit,
         offset=offset,
+        has_content=has_content,
     )
 
     total = await event_repo.count_events(
         session_id=session_id,
         event_type=event_type,
+        has_content=has_content,
     )
 
     return EventListResponse(
@@ -181,6 +181,7 @@ class EventRepository(BaseRepository[Event]):
         event_type: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        has_content: bool = False,
     ) -> list[Event]:
         """
         List events for a session with optional filtering.
@@ -190,6 +191,7 @@ class EventRepository(BaseRepository[Event]):
             event_type: Optional event type filter
             limit: Maximum number of events to return
             offset: Number of events to skip
+            has_content: Only include events with non-empty data["content"]
 
         Returns:
             List of events ordered by timestamp
@@ -204,6 +206,8 @@ class EventRepository(BaseRepository[Event]):
 
         if event_type:
             stmt = stmt.where(Event.event_type == event_type)
+        if has_content:
+            stmt = stmt.where(Event.data["content"].as_string() != "")
 
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
@@ -212,6 +216,7 @@ class EventRepository(BaseRepository[Event]):
         self,
         session_id: UUID,
         event_type: str | None = None,
+        has_content: bool = False,
     ) -> int:
         """
         Count events for a session with optional filtering.
@@ -219,6 +224,7 @@ class EventRepository(BaseRepository[Event]):
         Args:
             session_id: Session ID
             event_type: Optional event type filter
+            has_content: Only count events with non-empty data["content"]
 
         Returns:
             Number of events
@@ -227,6 +233,8 @@ class EventRepository(BaseRepository[Event]):
 
         if event_type:
             stmt = stmt.where(Event.event_type == event_type)
+        if has_content:
+            stmt = stmt.where(Event.data["content"].as_string() != "")
 
         result = await self.db.execute(stmt)
         return result.scalar_one()
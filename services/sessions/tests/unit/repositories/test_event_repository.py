@@ -169,6 +169,32 @@ class TestGetSessionEvents:
         assert events[0].id == events_created[2].id
 
 
+class TestListEvents:
+    """Tests for list_events."""
+
+    @pytest.mark.asyncio
+    async def test_has_content_filter(self, event_repository, test_session):
+        """Test has_content skips events without content."""
+        with_content = await event_repository.create_event(
+            session_id=test_session.id,
+            event_type="user_message",
+            data={"content": "Hello"},
+        )
+        for data in ({}, {"content": ""}):
+            await event_repository.create_event(
+                session_id=test_session.id,
+                event_type="tool_call",
+                data=data,
+            )
+
+        events = await event_repository.list_events(test_session.id, has_content=True)
+        total = await event_repository.count_events(test_session.id, has_content=True)
+
+        assert [e.id for e in events] == [with_content.id]
+        assert total == 1
+        assert await event_repository.count_events(test_session.id) == 3
+
+
 class TestGetEventsByType:
     """Tests for get_events_by_type."""
 
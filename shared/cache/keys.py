@@ -15,6 +15,7 @@ class CacheKeys:
     USER_PREFIX = "user"
     AGENT_PREFIX = "agent"
     JOB_PREFIX = "job"
+    EMBEDDING_PREFIX = "embedding"
 
     # Key separators
     SEPARATOR = ":"
@@ -163,6 +164,20 @@ class CacheKeys:
         """
         return f"{cls.JOB_PREFIX}{cls.SEPARATOR}consolidation{cls.SEPARATOR}{job_id}"
 
+    @classmethod
+    def embedding(cls, model: str, text_hash: str) -> str:
+        """
+        Generate cache key for a text embedding.
+
+        Args:
+            model: Embedding model namespace (model name and dimensions)
+            text_hash: Hash of the embedded text
+
+        Returns:
+            Cache key
+        """
+        return f"{cls.EMBEDDING_PREFIX}{cls.SEPARATOR}{model}{cls.SEPARATOR}{text_hash}"
+
     @classmethod
     def custom(cls, *parts: Any) -> str:
         """
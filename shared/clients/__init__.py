@@ -1,12 +1,13 @@
 """HTTP clients for ContextIQ services."""
 
-from shared.clients.base import BaseHTTPClient
+from shared.clients.base import BaseHTTPClient, create_http_client
 from shared.clients.config import HTTPClientSettings, http_client_settings
 from shared.clients.memory_client import MemoryServiceClient
 from shared.clients.sessions_client import SessionsServiceClient
 
 __all__ = [
     "BaseHTTPClient",
+    "create_http_client",
     "HTTPClientSettings",
     "http_client_settings",
     "SessionsServiceClient",
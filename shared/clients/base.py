@@ -7,6 +7,7 @@ from typing import Any, TypeVar
 import httpx
 from pydantic import BaseModel
 
+from shared.clients.config import HTTPClientSettings, http_client_settings
 from shared.exceptions import ServiceUnavailableError
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,28 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+def create_http_client(settings: HTTPClientSettings | None = None) -> httpx.AsyncClient:
+    """
+    Create an httpx client whose connection pool can be shared by service clients.
+
+    Args:
+        settings: HTTP client settings (uses defaults if not provided)
+
+    Returns:
+        httpx.AsyncClient with keep-alive pool limits and HTTP/2 support from settings
+    """
+    settings = settings or http_client_settings
+    return httpx.AsyncClient(
+        http2=settings.http2,
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        follow_redirects=True,
+    )
+
+
 class BaseHTTPClient:
     """Base HTTP client with retry logic, timeout handling, and error management."""
 
@@ -23,6 +46,7 @@ class BaseHTTPClient:
         timeout: int = 30,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize the HTTP client.
@@ -32,27 +56,24 @@ class BaseHTTPClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            http_client: Shared httpx client to send requests through. The
+                caller owns it and must close it; close() leaves it open.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = http_client
+        self._owns_client = http_client is None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            follow_redirects=True,
-        )
+        await self._get_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self.close()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -65,8 +86,8 @@ class BaseHTTPClient:
         return self._client
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
+        """Close the HTTP client unless it is shared."""
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -96,7 +117,10 @@ class BaseHTTPClient:
 
         for attempt in range(self.max_retries):
             try:
-                response = await client.request(method, path, **kwargs)
+                # Absolute URL and per-service timeout so a shared client works too
+                response = await client.request(
+                    method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs
+                )
                 response.raise_for_status()
                 return response
 
@@ -104,12 +128,20 @@ class BaseHTTPClient:
                 last_exception = e
                 if attempt < self.max_retries - 1:
                     logger.warning(
-                        f"Request to {self.base_url}{path} failed (attempt {attempt + 1}/{self.max_retries}): {e}"
+                        "Request to %s%s failed (attempt %d/%d): %s",
+                        self.base_url,
+                        path,
+                        attempt + 1,
+                        self.max_retries,
+                        e,
                     )
                     await asyncio.sleep(self.retry_delay * (attempt + 1))
                 else:
                     logger.error(
-                        f"Request to {self.base_url}{path} failed after {self.max_retries} attempts"
+                        "Request to %s%s failed after %d attempts",
+                        self.base_url,
+                        path,
+                        self.max_retries,
                     )
 
             except httpx.HTTPStatusError as e:
@@ -119,12 +151,21 @@ class BaseHTTPClient:
                 last_exception = e
                 if attempt < self.max_retries - 1:
                     logger.warning(
-                        f"Server error {e.response.status_code} for {self.base_url}{path} (attempt {attempt + 1}/{self.max_retries})"
+                        "Server error %d for %s%s (attempt %d/%d)",
+                        e.response.status_code,
+                        self.base_url,
+                        path,
+                        attempt + 1,
+                        self.max_retries,
                     )
                     await asyncio.sleep(self.retry_delay * (attempt + 1))
                 else:
                     logger.error(
-                        f"Server error {e.response.status_code} for {self.base_url}{path} after {self.max_retries} attempts"
+                        "Server error %d for %s%s after %d attempts",
+                        e.response.status_code,
+                        self.base_url,
+                        path,
+                        self.max_retries,
                     )
 
         raise ServiceUnavailableError(
@@ -25,6 +25,13 @@ class HTTPClientSettings(BaseSettings):
     memory_service_max_retries: int = 3
     memory_service_retry_delay: float = 1.0
 
+    # Shared connection pool
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 30.0
+    # Negotiated via ALPN on https URLs; plain http URLs stay on HTTP/1.1
+    http2: bool = True
+
     # Circuit breaker settings
     circuit_breaker_failure_threshold: int = 5
     circuit_breaker_timeout: int = 60
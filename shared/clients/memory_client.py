@@ -1,13 +1,20 @@
 """HTTP client for Memory Service."""
 
 import logging
+from collections.abc import AsyncIterator, Mapping
+from typing import Any
 from uuid import UUID
 
+import httpx
+
 from shared.clients.base import BaseHTTPClient
 from shared.clients.config import http_client_settings
 
 logger = logging.getLogger(__name__)
 
+# Largest limit the Memory Service list endpoint accepts
+_MAX_PAGE_SIZE = 1000
+
 
 class MemoryServiceClient(BaseHTTPClient):
     """HTTP client for communicating with the Memory Service."""
@@ -18,6 +25,7 @@ class MemoryServiceClient(BaseHTTPClient):
         timeout: int | None = None,
         max_retries: int | None = None,
         retry_delay: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize Memory Service client.
@@ -27,17 +35,19 @@ class MemoryServiceClient(BaseHTTPClient):
             timeout: Request timeout in seconds (defaults to config)
             max_retries: Maximum retry attempts (defaults to config)
             retry_delay: Delay between retries (defaults to config)
+            http_client: Shared httpx client (creates its own if not provided)
         """
         super().__init__(
             base_url=base_url or http_client_settings.memory_service_url,
             timeout=timeout or http_client_settings.memory_service_timeout,
             max_retries=max_retries or http_client_settings.memory_service_max_retries,
             retry_delay=retry_delay or http_client_settings.memory_service_retry_delay,
+            http_client=http_client,
         )
 
     async def create_memory(
         self,
-        scope: dict[str, str],
+        scope: Mapping[str, str],
         fact: str,
         source_type: str,
         topic: str | None = None,
@@ -94,6 +104,36 @@ class MemoryServiceClient(BaseHTTPClient):
 
         return response.json()
 
+    async def create_memories_bulk(
+        self,
+        scope: Mapping[str, str],
+        items: list[dict[str, Any]],
+    ) -> dict:
+        """
+        Create several memories in one scope with a single request.
+
+        The Memory Service inserts all items in one transaction, so either
+        every item is created or the request fails as a whole.
+
+        Args:
+            scope: Scope shared by all memories (e.g., {"user_id": "123"})
+            items: Memory fields per item (fact, source_type and optional topic,
+                embedding, confidence, importance, source_id, ttl_days)
+
+        Returns:
+            Bulk create response with created memories and count
+
+        Raises:
+            ServiceUnavailableError: If service is unavailable
+            httpx.HTTPStatusError: If API returns error status
+        """
+        response = await self.post(
+            "/api/v1/memories/bulk",
+            json={"scope": scope, "items": items},
+        )
+
+        return response.json()
+
     async def get_memory(self, memory_id: UUID | str) -> dict:
         """
         Get a memory by ID.
@@ -154,6 +194,59 @@ class MemoryServiceClient(BaseHTTPClient):
         response = await self.get("/api/v1/memories", params=params)
         return response.json()
 
+    async def list_memories_stream(
+        self,
+        scope_user_id: str | None = None,
+        scope_org_id: str | None = None,
+        topic: str | None = None,
+        limit: int = 100,
+        page_size: int | None = None,
+        include_deleted: bool = False,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream memories filtered by scope parameters, one page at a time.
+
+        Memories are yielded as each page arrives, so callers can process
+        them without holding the full result set as raw response dicts.
+
+        Args:
+            scope_user_id: Filter by user ID in scope
+            scope_org_id: Filter by organization ID in scope
+            topic: Optional topic filter
+            limit: Maximum number of memories to yield
+            page_size: Number of memories requested per page (defaults to
+                limit, capped at the endpoint maximum, so most calls fetch a
+                single page)
+            include_deleted: Include soft-deleted memories
+
+        Yields:
+            Memory response dicts
+
+        Raises:
+            ServiceUnavailableError: If service is unavailable
+            httpx.HTTPStatusError: If required scope parameter missing
+        """
+        page_size = min(page_size or limit, _MAX_PAGE_SIZE)
+        offset = 0
+        while offset < limit:
+            page_limit = min(page_size, limit - offset)
+            page = await self.list_memories(
+                scope_user_id=scope_user_id,
+                scope_org_id=scope_org_id,
+                topic=topic,
+                limit=page_limit,
+                offset=offset,
+                include_deleted=include_deleted,
+            )
+            memories = page.get("memories", [])
+            for memory in memories:
+                yield memory
+
+            offset += len(memories)
+            total = page.get("total")
+            if len(memories) < page_limit or (total is not None and offset >= total):
+                break
+
     async def update_memory(
         self,
         memory_id: UUID | str,
@@ -1,8 +1,12 @@
 """HTTP client for Sessions Service."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from uuid import UUID
 
+import httpx
+
 from shared.clients.base import BaseHTTPClient
 from shared.clients.config import http_client_settings
 
@@ -18,6 +22,7 @@ class SessionsServiceClient(BaseHTTPClient):
         timeout: int | None = None,
         max_retries: int | None = None,
         retry_delay: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize Sessions Service client.
@@ -27,12 +32,14 @@ class SessionsServiceClient(BaseHTTPClient):
             timeout: Request timeout in seconds (defaults to config)
             max_retries: Maximum retry attempts (defaults to config)
             retry_delay: Delay between retries (defaults to config)
+            http_client: Shared httpx client (creates its own if not provided)
         """
         super().__init__(
             base_url=base_url or http_client_settings.sessions_service_url,
             timeout=timeout or http_client_settings.sessions_service_timeout,
             max_retries=max_retries or http_client_settings.sessions_service_max_retries,
             retry_delay=retry_delay or http_client_settings.sessions_service_retry_delay,
+            http_client=http_client,
         )
 
     async def create_session(
@@ -261,6 +268,7 @@ class SessionsServiceClient(BaseHTTPClient):
         event_type: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        has_content: bool = False,
     ) -> dict:
         """
         List events for a session.
@@ -270,6 +278,7 @@ class SessionsServiceClient(BaseHTTPClient):
             event_type: Optional filter by event type
             limit: Maximum number of results
             offset: Offset for pagination
+            has_content: Only return events with non-empty data["content"]
 
         Returns:
             List of events
@@ -285,6 +294,8 @@ class SessionsServiceClient(BaseHTTPClient):
 
         if event_type:
             params["event_type"] = event_type
+        if has_content:
+            params["has_content"] = True
 
         response = await self.get(
             f"/api/v1/sessions/{session_id}/events",
@@ -292,3 +303,65 @@ class SessionsServiceClient(BaseHTTPClient):
         )
 
         return response.json()
+
+    async def iter_events(
+        self,
+        session_id: UUID | str,
+        event_type: str | None = None,
+        page_size: int = 200,
+        has_content: bool = False,
+        max_concurrent_pages: int = 4,
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate over all events for a session, one page at a time.
+
+        Once the first page reports the total, the following pages are
+        fetched up to max_concurrent_pages at a time and yielded in order.
+
+        Args:
+            session_id: Session UUID
+            event_type: Optional filter by event type
+            page_size: Number of events requested per page
+            has_content: Only yield events with non-empty data["content"]
+            max_concurrent_pages: Maximum pages requested concurrently
+
+        Yields:
+            Event response dicts in timestamp order
+
+        Raises:
+            ServiceUnavailableError: If service is unavailable
+            httpx.HTTPStatusError: If session not found or other error
+        """
+
+        async def fetch(offset: int) -> dict:
+            return await self.list_events(
+                session_id=session_id,
+                event_type=event_type,
+                limit=page_size,
+                offset=offset,
+                has_content=has_content,
+            )
+
+        page = await fetch(0)
+        events = page.get("events", [])
+        for event in events:
+            yield event
+
+        offset = len(events)
+        total = page.get("total")
+        while len(events) == page_size and (total is None or offset < total):
+            if total is None:
+                pages = [await fetch(offset)]
+            else:
+                window_end = min(total, offset + page_size * max_concurrent_pages)
+                pages = await asyncio.gather(
+                    *(fetch(start) for start in range(offset, window_end, page_size))
+                )
+
+            for page in pages:
+                events = page.get("events", [])
+                for event in events:
+                    yield event
+                offset += len(events)
+                if len(events) < page_size:
+                    break
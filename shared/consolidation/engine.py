@@ -6,6 +6,7 @@ and resolving conflicts between contradictory memories.
 """
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -17,12 +18,17 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class Memory:
-    """Memory representation for consolidation."""
+    """
+    Memory representation for consolidation.
+
+    The embedding may be any float sequence, e.g. a list or a packed
+    array.array("f").
+    """
 
     id: UUID
     fact: str
     confidence: float
-    embedding: list[float]
+    embedding: Sequence[float]
     source_session_id: UUID | None = None
     metadata: dict[str, Any] | None = None
 
@@ -88,6 +94,19 @@ class ConsolidationResult:
         return len(self.conflicts_detected)
 
 
+def _normalize_fact(fact: str) -> str:
+    """
+    Normalize a fact for exact-duplicate detection.
+
+    Args:
+        fact: Memory fact text
+
+    Returns:
+        Case-folded fact with collapsed whitespace and no trailing period
+    """
+    return " ".join(fact.casefold().split()).rstrip(".")
+
+
 class ConsolidationEngine:
     """
     Engine for consolidating memories.
@@ -105,9 +124,9 @@ class ConsolidationEngine:
         """
         self.settings = settings or get_consolidation_settings()
         logger.info(
-            f"Consolidation engine initialized with "
-            f"similarity_threshold={self.settings.similarity_threshold}, "
-            f"merge_strategy={self.settings.merge_strategy}"
+            "Consolidation engine initialized with similarity_threshold=%s, merge_strategy=%s",
+            self.settings.similarity_threshold,
+            self.settings.merge_strategy,
         )
 
     def consolidate_memories(
@@ -126,7 +145,7 @@ class ConsolidationEngine:
             ConsolidationResult with merged memories and conflicts
         """
         try:
-            logger.info(f"Starting consolidation for {len(memories)} memories")
+            logger.info("Starting consolidation for %d memories", len(memories))
 
             if len(memories) < 2:
                 logger.info("Not enough memories to consolidate")
@@ -155,7 +174,7 @@ class ConsolidationEngine:
                 else:
                     mergeable.append(candidate)
 
-            logger.info(f"Found {len(mergeable)} mergeable pairs and {len(conflicts)} conflicts")
+            logger.info("Found %d mergeable pairs and %d conflicts", len(mergeable), len(conflicts))
 
             # Merge similar memories
             merged_memories = []
@@ -172,14 +191,15 @@ class ConsolidationEngine:
             )
 
             logger.info(
-                f"Consolidation complete: {result.merge_count} merges, "
-                f"{result.conflict_count} conflicts"
+                "Consolidation complete: %d merges, %d conflicts",
+                result.merge_count,
+                result.conflict_count,
             )
 
             return result
 
         except Exception as e:
-            logger.exception(f"Error during consolidation: {e}")
+            logger.exception("Error during consolidation: %s", e)
             return ConsolidationResult(
                 memories_processed=len(memories),
                 success=False,
@@ -199,11 +219,33 @@ class ConsolidationEngine:
         Returns:
             List of merge candidates
         """
-        candidates = []
+        candidates: list[MergeCandidate] = []
+
+        # Index memories by normalized fact text. Exact duplicates become
+        # merge candidates without a similarity check, and only the first
+        # memory of each group goes through the pairwise comparison below.
+        groups: dict[str, list[Memory]] = {}
+        for memory in memories:
+            groups.setdefault(_normalize_fact(memory.fact), []).append(memory)
+
+        unique_memories = []
+        for group in groups.values():
+            unique_memories.append(group[0])
+            for duplicate in group[1:]:
+                if len(candidates) >= self.settings.max_merge_candidates:
+                    break
+                candidates.append(
+                    MergeCandidate(
+                        memory1=group[0],
+                        memory2=duplicate,
+                        similarity_score=1.0,
+                        is_conflict=False,
+                    )
+                )
 
-        # Compare each pair of memories
-        for i, memory1 in enumerate(memories):
-            for memory2 in memories[i + 1 :]:
+        # Compare each pair of remaining memories
+        for i, memory1 in enumerate(unique_memories):
+            for memory2 in unique_memories[i + 1 :]:
                 similarity = self._calculate_similarity(memory1, memory2)
 
                 # Check if similar enough to merge
@@ -5,6 +5,8 @@ This module provides embedding generation capabilities for converting
 text memories into vector representations for similarity search.
 """
 
+from shared.embedding.batcher import EmbeddingBatcher
+from shared.embedding.cache import CachedEmbeddingService
 from shared.embedding.config import EmbeddingSettings, get_embedding_settings
 from shared.embedding.service import EmbeddingService
 
@@ -12,4 +14,6 @@ __all__ = [
     "EmbeddingSettings",
     "get_embedding_settings",
     "EmbeddingService",
+    "CachedEmbeddingService",
+    "EmbeddingBatcher",
 ]
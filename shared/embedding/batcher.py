@@ -0,0 +1,167 @@
+"""
+Cross-request embedding batcher.
+
+Coalesces texts from concurrent generate_embeddings calls into shared
+EmbeddingService requests, so parallel in-flight messages share one API
+call instead of paying its fixed overhead each.
+"""
+
+import asyncio
+
+from shared.config.logging import get_logger
+from shared.embedding.config import EmbeddingSettings
+from shared.embedding.service import EmbeddingResult, EmbeddingService
+
+logger = get_logger(__name__)
+
+_Pending = tuple[list[str], asyncio.Future[EmbeddingResult]]
+
+
+def _cancel(batch: list[_Pending]) -> None:
+    """
+    Cancel callers still waiting on a batch that will not be embedded.
+
+    Args:
+        batch: Submitted texts with the futures awaiting them
+    """
+    for _, future in batch:
+        if not future.done():
+            future.cancel()
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batcher in front of EmbeddingService.
+
+    Callers submit texts and await their own slice of the result. A
+    background task collects submissions until embedding_batch_size texts
+    are queued or embedding_batch_wait_ms has passed since the first one,
+    then embeds them with a single call in a worker thread.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ):
+        """
+        Initialize embedding batcher.
+
+        Args:
+            embedding_service: Underlying embedding service
+            max_batch_size: Texts that trigger an immediate flush
+                (uses embedding settings if not provided)
+            max_wait_ms: Longest time to wait for more texts before flushing
+                (uses embedding settings if not provided)
+        """
+        settings = embedding_service.settings
+        self.embedding_service = embedding_service
+        self.max_batch_size = max_batch_size or settings.embedding_batch_size
+        self.max_wait = (
+            settings.embedding_batch_wait_ms if max_wait_ms is None else max_wait_ms
+        ) / 1000
+        self._queue: asyncio.Queue[_Pending] = asyncio.Queue()
+        self._collector: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    @property
+    def settings(self) -> EmbeddingSettings:
+        """Settings of the underlying embedding service."""
+        return self.embedding_service.settings
+
+    async def generate_embeddings(self, texts: list[str]) -> EmbeddingResult:
+        """
+        Generate embeddings as part of a shared batch.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            EmbeddingResult for these texts only
+
+        Raises:
+            ValueError: If texts list is empty
+        """
+        if not texts:
+            raise ValueError("texts cannot be empty")
+
+        if self._collector is None or self._collector.done():
+            self._collector = asyncio.create_task(self._collect())
+
+        future: asyncio.Future[EmbeddingResult] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((texts, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop collecting and cancel in-flight batches."""
+        tasks = [*self._flushes, *([self._collector] if self._collector else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._collector = None
+
+        _cancel([self._queue.get_nowait() for _ in range(self._queue.qsize())])
+
+    async def _collect(self) -> None:
+        """Gather pending submissions into batches and start a flush per batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+
+            try:
+                while size < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending = await asyncio.wait_for(self._queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                    batch.append(pending)
+                    size += len(pending[0])
+            except asyncio.CancelledError:
+                _cancel(batch)
+                raise
+
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[_Pending]) -> None:
+        """
+        Embed one batch and hand each caller its slice of the result.
+
+        Args:
+            batch: Submitted texts with the futures awaiting them
+        """
+        texts = [text for submitted, _ in batch for text in submitted]
+        try:
+            result = await asyncio.to_thread(self.embedding_service.generate_embeddings, texts)
+        except asyncio.CancelledError:
+            _cancel(batch)
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug("embedding_batch_flushed", requests=len(batch), texts=len(texts))
+
+        offset = 0
+        for submitted, future in batch:
+            end = offset + len(submitted)
+            if not future.done():
+                future.set_result(
+                    EmbeddingResult(
+                        embeddings=[] if result.error else result.embeddings[offset:end],
+                        texts=result.texts[offset:end],
+                        model=result.model,
+                        dimensions=result.dimensions,
+                        error=result.error,
+                    )
+                )
+            offset = end
@@ -0,0 +1,255 @@
+"""
+Redis-backed embedding cache.
+
+Wraps EmbeddingService so texts that were embedded before are served from
+Redis and only cache misses reach the OpenAI API.
+"""
+
+import asyncio
+import hashlib
+import struct
+from array import array
+
+from shared.cache.keys import CacheKeys
+from shared.cache.redis_client import RedisClient
+from shared.config.logging import get_logger
+from shared.embedding.batcher import EmbeddingBatcher
+from shared.embedding.service import EmbeddingResult, EmbeddingService
+from shared.embedding.simhash import SimHashIndex, simhash
+
+logger = get_logger(__name__)
+
+
+def _pack_float16(embedding: list[float]) -> bytes:
+    """
+    Pack a vector as little-endian float16 bytes.
+
+    Args:
+        embedding: Vector to pack
+
+    Returns:
+        Packed vector
+    """
+    return struct.pack(f"<{len(embedding)}e", *embedding)
+
+
+def _unpack_float16(value: bytes) -> list[float]:
+    """
+    Unpack a vector packed by _pack_float16.
+
+    Args:
+        value: Packed vector
+
+    Returns:
+        Vector as Python floats
+    """
+    return list(struct.unpack(f"<{len(value) // 2}e", value))
+
+
+def _pack_float32(embedding: list[float]) -> bytes:
+    """
+    Pack a vector as native float32 bytes.
+
+    Args:
+        embedding: Vector to pack
+
+    Returns:
+        Packed vector
+    """
+    return array("f", embedding).tobytes()
+
+
+def _unpack_float32(value: bytes) -> list[float]:
+    """
+    Unpack a vector packed by _pack_float32.
+
+    Args:
+        value: Packed vector
+
+    Returns:
+        Vector as Python floats
+    """
+    return array("f", value).tolist()
+
+
+class CachedEmbeddingService:
+    """
+    Embedding service with a Redis cache in front of the OpenAI API.
+
+    Vectors are stored as packed float32 (or, with embedding_cache_float16,
+    float16) bytes keyed by a hash of the text, namespaced by model,
+    dimensions and storage format. All keys for a call are read with a
+    single MGET and misses are written back with one pipeline. If Redis is
+    unavailable, embeddings are generated without the cache. When
+    embedding_near_duplicate_distance is set, misses are also looked up by
+    SimHash in an in-process index of recently seen vectors.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        redis_client: RedisClient,
+        ttl: int | None = None,
+        batcher: EmbeddingBatcher | None = None,
+    ):
+        """
+        Initialize cached embedding service.
+
+        Args:
+            embedding_service: Underlying embedding service
+            redis_client: Redis client created with decode_responses=False
+            ttl: Cache TTL in seconds (uses embedding settings if not provided)
+            batcher: Optional batcher that embeds cache misses together with
+                misses from concurrent calls
+
+        Raises:
+            ValueError: If the Redis client decodes responses to strings
+        """
+        if redis_client.decode_responses:
+            raise ValueError("CachedEmbeddingService requires decode_responses=False")
+
+        self.embedding_service = embedding_service
+        self.redis = redis_client
+        self.batcher = batcher
+        settings = embedding_service.settings
+        self._near_duplicates: SimHashIndex | None = None
+        if settings.embedding_near_duplicate_distance:
+            self._near_duplicates = SimHashIndex(
+                max_distance=settings.embedding_near_duplicate_distance,
+                max_size=settings.embedding_near_duplicate_cache_size,
+            )
+        self.ttl = embedding_service.settings.embedding_cache_ttl if ttl is None else ttl
+        self._namespace = (
+            f"{embedding_service.settings.openai_embedding_model}"
+            f"-{embedding_service.settings.openai_embedding_dimensions}"
+        )
+        # float16 entries get their own namespace so existing float32 entries
+        # are never decoded with the wrong width
+        if settings.embedding_cache_float16:
+            self._namespace += "-f16"
+            self._pack, self._unpack = _pack_float16, _unpack_float16
+        else:
+            self._pack, self._unpack = _pack_float32, _unpack_float32
+
+    def cache_key(self, text: str) -> str:
+        """
+        Build the cache key for a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Cache key
+        """
+        # Texts differing only in whitespace share one cached vector
+        normalized = " ".join(text.split())
+        # 128-bit SHA-256 prefix; hashlib's SHA-256 is hardware-accelerated on
+        # current CPUs, so it outperforms non-crypto hashes available here
+        text_hash = hashlib.sha256(normalized.encode()).hexdigest()[:32]
+        return CacheKeys.embedding(self._namespace, text_hash)
+
+    async def generate_embeddings(self, texts: list[str]) -> EmbeddingResult:
+        """
+        Generate embeddings, serving cached vectors where available.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            EmbeddingResult with embeddings in input order
+
+        Raises:
+            ValueError: If texts list is empty
+        """
+        if not texts:
+            raise ValueError("texts cannot be empty")
+
+        keys = [self.cache_key(text) for text in texts]
+        cached = await self._get_cached(keys)
+
+        embeddings: list[list[float] | None] = [
+            self._unpack(value) if value is not None else None for value in cached
+        ]
+        miss_indices = [idx for idx, embedding in enumerate(embeddings) if embedding is None]
+        near_hits = 0
+        if self._near_duplicates is not None:
+            fingerprints = [simhash(text) for text in texts]
+            for idx in miss_indices:
+                embeddings[idx] = self._near_duplicates.get(fingerprints[idx])
+            remaining = [idx for idx in miss_indices if embeddings[idx] is None]
+            near_hits = len(miss_indices) - len(remaining)
+            miss_indices = remaining
+
+        settings = self.embedding_service.settings
+        if miss_indices:
+            # Embed each distinct missing key once, even if repeated in texts
+            first_miss: dict[str, int] = {}
+            for idx in miss_indices:
+                first_miss.setdefault(keys[idx], idx)
+            miss_texts = [texts[idx] for idx in first_miss.values()]
+            if self.batcher is not None:
+                result = await self.batcher.generate_embeddings(miss_texts)
+            else:
+                result = await asyncio.to_thread(
+                    self.embedding_service.generate_embeddings, miss_texts
+                )
+            if result.error:
+                return result
+
+            missed = dict(zip(first_miss, result.embeddings, strict=True))
+            for idx in miss_indices:
+                embeddings[idx] = missed[keys[idx]]
+            await self._set_cached(list(missed), list(missed.values()))
+
+        if self._near_duplicates is not None:
+            for fingerprint, embedding in zip(fingerprints, embeddings, strict=True):
+                self._near_duplicates.add(fingerprint, embedding)  # type: ignore[arg-type]
+
+        logger.debug(
+            "embedding_cache_lookup",
+            hits=len(texts) - len(miss_indices) - near_hits,
+            near_hits=near_hits,
+            misses=len(miss_indices),
+        )
+
+        return EmbeddingResult(
+            embeddings=embeddings,  # type: ignore[arg-type]
+            texts=texts,
+            model=settings.openai_embedding_model,
+            dimensions=settings.openai_embedding_dimensions,
+        )
+
+    async def _get_cached(self, keys: list[str]) -> list[bytes | None]:
+        """
+        Read cached vectors for all keys in one round-trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Packed vectors, or None per key on a miss (all None if Redis fails)
+        """
+        try:
+            values = await self.redis.get_client().mget(keys)
+            # The client is created with decode_responses=False, so entries
+            # are bytes; anything else is treated as a miss
+            return [value if isinstance(value, bytes) else None for value in values]
+        except Exception as e:
+            logger.warning("embedding_cache_get_failed", error=str(e))
+            return [None] * len(keys)
+
+    async def _set_cached(self, keys: list[str], embeddings: list[list[float]]) -> None:
+        """
+        Write vectors for all keys in one pipelined round-trip.
+
+        Args:
+            keys: Cache keys
+            embeddings: Vectors to cache, aligned with keys
+        """
+        try:
+            async with self.redis.get_client().pipeline(transaction=False) as pipe:
+                for key, embedding in zip(keys, embeddings, strict=True):
+                    pipe.set(key, self._pack(embedding), ex=self.ttl or None)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("embedding_cache_set_failed", error=str(e))
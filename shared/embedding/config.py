@@ -55,6 +55,12 @@ class EmbeddingSettings(BaseSettings):
         le=2048,
         description="Number of texts to embed in a single batch",
     )
+    embedding_batch_wait_ms: float = Field(
+        default=20.0,
+        ge=0.0,
+        le=1000.0,
+        description="Time to collect concurrent requests into one embedding batch",
+    )
     embedding_max_input_length: int = Field(
         default=8191,
         ge=1,
@@ -62,6 +68,35 @@ class EmbeddingSettings(BaseSettings):
         description="Maximum input token length for embeddings",
     )
 
+    # Cache Configuration
+    embedding_cache_ttl: int = Field(
+        default=604800,  # 7 days
+        ge=0,
+        description="TTL for cached embeddings in seconds (0 = no expiration)",
+    )
+    embedding_cache_float16: bool = Field(
+        default=False,
+        description=(
+            "Store cached vectors as float16 instead of float32, halving Redis "
+            "memory and transfer at a small precision cost"
+        ),
+    )
+    embedding_near_duplicate_distance: int = Field(
+        default=0,
+        ge=0,
+        le=3,
+        description=(
+            "Max SimHash Hamming distance for reusing a cached vector for a "
+            "near-duplicate text (0 = disabled)"
+        ),
+    )
+    embedding_near_duplicate_cache_size: int = Field(
+        default=10000,
+        ge=1,
+        le=1000000,
+        description="Number of vectors kept in memory for near-duplicate lookups",
+    )
+
 
 @lru_cache
 def get_embedding_settings() -> EmbeddingSettings:
@@ -0,0 +1,141 @@
+"""
+SimHash fingerprints for near-duplicate text lookup.
+
+Lets the embedding cache reuse a vector for texts that differ only by
+small edits (punctuation, casing, a typo), which miss an exact-hash cache.
+"""
+
+import re
+from collections import OrderedDict
+
+_WORD_RE = re.compile(r"\w+")
+_SHINGLE_SIZE = 4
+_BITS = 64
+_HASH_MASK = (1 << _BITS) - 1
+_BAND_BITS = 16
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_BANDS = _BITS // _BAND_BITS
+
+
+def simhash(text: str) -> int:
+    """
+    Compute a 64-bit SimHash over character shingles of normalized text.
+
+    Text is casefolded and reduced to its words, so punctuation and
+    whitespace differences do not change the fingerprint. Fingerprints
+    depend on the process hash seed, so they must not be persisted or
+    compared across processes.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        64-bit fingerprint
+    """
+    normalized = " ".join(_WORD_RE.findall(text.casefold()))
+    shingles = {
+        normalized[start : start + _SHINGLE_SIZE]
+        for start in range(max(1, len(normalized) - _SHINGLE_SIZE + 1))
+    }
+
+    # Shingles are hashed with the built-in (SipHash) str hash, which is
+    # process-salted; fingerprints are only compared within one process.
+    # Set bits are counted column-wise over the hashes' bit strings, keeping
+    # the per-bit work inside C-level tuple.count
+    hashes = [f"{hash(shingle) & _HASH_MASK:064b}" for shingle in shingles]
+    majority = len(hashes) / 2
+    return int(
+        "".join(
+            "1" if column.count("1") > majority else "0" for column in zip(*hashes, strict=True)
+        ),
+        2,
+    )
+
+
+class SimHashIndex:
+    """
+    Bounded in-memory index from SimHash fingerprints to embedding vectors.
+
+    Fingerprints are split into four 16-bit bands; by the pigeonhole
+    principle two fingerprints within Hamming distance 3 share at least one
+    band exactly, so lookups only compare against entries in matching
+    bands. The oldest entries are evicted once max_size is reached.
+    """
+
+    def __init__(self, max_distance: int, max_size: int = 10000):
+        """
+        Initialize SimHash index.
+
+        Args:
+            max_distance: Maximum Hamming distance for a match (at most 3)
+            max_size: Maximum number of fingerprints kept
+
+        Raises:
+            ValueError: If max_distance is outside 0-3
+        """
+        if not 0 <= max_distance < _BANDS:
+            raise ValueError(f"max_distance must be between 0 and {_BANDS - 1}")
+
+        self.max_distance = max_distance
+        self.max_size = max_size
+        self._entries: OrderedDict[int, list[float]] = OrderedDict()
+        self._bands: list[dict[int, set[int]]] = [{} for _ in range(_BANDS)]
+
+    def __len__(self) -> int:
+        """Number of fingerprints in the index."""
+        return len(self._entries)
+
+    def get(self, fingerprint: int) -> list[float] | None:
+        """
+        Find the vector of the nearest indexed fingerprint within max_distance.
+
+        Args:
+            fingerprint: Fingerprint to look up
+
+        Returns:
+            Embedding vector, or None if no fingerprint is close enough
+        """
+        best: tuple[int, int] | None = None
+        for band, buckets in enumerate(self._bands):
+            for candidate in buckets.get((fingerprint >> band * _BAND_BITS) & _BAND_MASK, ()):
+                distance = (candidate ^ fingerprint).bit_count()
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, candidate)
+        return self._entries[best[1]] if best is not None else None
+
+    def add(self, fingerprint: int, embedding: list[float]) -> None:
+        """
+        Index a vector under its text's fingerprint.
+
+        Args:
+            fingerprint: Fingerprint of the embedded text
+            embedding: Embedding vector
+        """
+        if fingerprint in self._entries:
+            self._entries.move_to_end(fingerprint)
+            return
+
+        self._entries[fingerprint] = embedding
+        self._update_bands(fingerprint, add=True)
+
+        if len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._update_bands(evicted, add=False)
+
+    def _update_bands(self, fingerprint: int, add: bool) -> None:
+        """
+        Add a fingerprint to, or remove it from, its band buckets.
+
+        Args:
+            fingerprint: Fingerprint to update
+            add: Whether to add (True) or remove (False)
+        """
+        for band, buckets in enumerate(self._bands):
+            key = (fingerprint >> band * _BAND_BITS) & _BAND_MASK
+            if add:
+                buckets.setdefault(key, set()).add(fingerprint)
+            else:
+                bucket = buckets[key]
+                bucket.discard(fingerprint)
+                if not bucket:
+                    del buckets[key]
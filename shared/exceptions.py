@@ -148,6 +148,35 @@ class MessagePublishError(MessagingError):
         super().__init__(message, error_code="MESSAGE_PUBLISH_ERROR", details={"queue": queue})
 
 
+class MessageDecodeError(MessagingError):
+    """Message body could not be decoded."""
+
+    def __init__(self, content_type: str | None, message: str = "Failed to decode message"):
+        """
+        Initialize exception.
+
+        Args:
+            content_type: Content type of the message body
+            message: Error message
+        """
+        super().__init__(
+            message, error_code="MESSAGE_DECODE_ERROR", details={"content_type": content_type}
+        )
+
+
+class MessageRejectedError(MessagingError):
+    """Message cannot be processed and must not be redelivered."""
+
+    def __init__(self, message: str = "Message rejected by handler"):
+        """
+        Initialize exception.
+
+        Args:
+            message: Error message
+        """
+        super().__init__(message, error_code="MESSAGE_REJECTED")
+
+
 class MessageConsumeError(MessagingError):
     """Message consumption errors."""
 
@@ -55,11 +55,15 @@ class ExtractionSettings(BaseSettings):
     )
 
     # Extraction Configuration
-    extraction_batch_size: int = Field(
-        default=10,
+    extraction_batch_size: int | None = Field(
+        default=None,
         ge=1,
         le=100,
-        description="Number of events to process in a single extraction batch",
+        description=(
+            "Number of events to process in a single extraction batch (None = whole "
+            "session in one call). Smaller batches overlap extraction with embedding "
+            "but cost one LLM call each and miss facts spanning batch boundaries"
+        ),
     )
     extraction_min_events: int = Field(
         default=3,
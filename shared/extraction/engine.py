@@ -143,6 +143,35 @@ class ExtractionEngine:
                 error=f"Extraction failed: {e}",
             )
 
+    def batch_events(
+        self,
+        conversation_events: list[dict[str, str]],
+    ) -> list[list[dict[str, str]]]:
+        """
+        Split conversation events into extraction batches.
+
+        Batches hold extraction_batch_size events, or the whole conversation
+        when it is unset. A trailing batch shorter than extraction_min_events
+        is folded into the previous one so every batch can be extracted.
+
+        Args:
+            conversation_events: List of events with 'speaker' and 'content'
+
+        Returns:
+            List of event batches in conversation order
+        """
+        size = self.settings.extraction_batch_size
+        if size is None:
+            return [conversation_events]
+        batches = [
+            conversation_events[start : start + size]
+            for start in range(0, len(conversation_events), size)
+        ]
+        if len(batches) > 1 and len(batches[-1]) < self.settings.extraction_min_events:
+            tail = batches.pop()
+            batches[-1].extend(tail)
+        return batches
+
     def extract_memories_batch(
         self,
         event_batches: list[list[dict[str, str]]],
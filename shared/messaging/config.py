@@ -88,6 +88,15 @@ class MessagingSettings(BaseSettings):
         description="Default message TTL in milliseconds (0 = no expiration)",
     )
 
+    message_content_type: str = Field(
+        default="application/json",
+        pattern=r"^application/(json|msgpack)$",
+        description=(
+            "Body encoding for published messages (application/json or "
+            "application/msgpack); consumers decode either"
+        ),
+    )
+
     # Exchange settings
     default_exchange_type: str = Field(
         default="topic",
@@ -3,22 +3,129 @@ Message consumer for RabbitMQ.
 """
 
 import asyncio
-import json
 from collections.abc import Callable
 from typing import Any
 
-from aio_pika import IncomingMessage
+from aio_pika import DeliveryMode, IncomingMessage, Message
 
 from shared.config.logging import get_logger
-from shared.exceptions import MessageConsumeError
+from shared.exceptions import MessageConsumeError, MessageDecodeError, MessageRejectedError
 from shared.messaging.queues import QueueConfig
 from shared.messaging.rabbitmq_client import RabbitMQClient
+from shared.messaging.serialization import JSON_CONTENT_TYPE, decode_body, encode_body
 
 logger = get_logger(__name__)
 
 MessageHandler = Callable[[dict[str, Any]], Any]
 
 
+def _delivery_tag(message: IncomingMessage) -> int:
+    """
+    Get the delivery tag of a message consumed with manual acks.
+
+    Args:
+        message: Delivered message
+
+    Returns:
+        Delivery tag
+    """
+    tag = message.delivery_tag
+    # The broker assigns a tag to every delivery that must be acknowledged
+    assert tag is not None, "message consumed without a delivery tag"
+    return tag
+
+
+class _AckBatcher:
+    """
+    Acknowledge processed messages in batches with basic.ack(multiple=True).
+
+    Handlers finish out of order, so a batch only covers delivery tags
+    below the oldest message still being processed on the same channel.
+    Tags are tracked per channel because they restart after a reconnect.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float):
+        """
+        Initialize ack batcher.
+
+        Args:
+            batch_size: Number of processed messages that triggers a flush
+            flush_interval: Maximum seconds a processed message waits for its ack
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._in_flight: dict[Any, set[int]] = {}
+        self._ready: dict[Any, dict[int, IncomingMessage]] = {}
+        self._ready_count = 0
+        self._flush_task: asyncio.Task | None = None
+
+    def track(self, message: IncomingMessage) -> None:
+        """
+        Record a message whose handler has started.
+
+        Args:
+            message: Delivered message
+        """
+        self._in_flight.setdefault(message.channel, set()).add(_delivery_tag(message))
+
+    def ack(self, message: IncomingMessage) -> None:
+        """
+        Queue a successfully processed message for a batched ack.
+
+        Args:
+            message: Processed message
+        """
+        self._ready.setdefault(message.channel, {})[_delivery_tag(message)] = message
+        self._ready_count += 1
+
+    async def release(self, message: IncomingMessage) -> None:
+        """
+        Mark a message as no longer in flight and flush if due.
+
+        Called once per tracked message after it was queued for ack,
+        rejected, or failed.
+
+        Args:
+            message: Settled message
+        """
+        in_flight = self._in_flight.get(message.channel)
+        if in_flight is not None:
+            in_flight.discard(_delivery_tag(message))
+            if not in_flight:
+                del self._in_flight[message.channel]
+
+        if self._ready_count >= self.batch_size:
+            await self.flush()
+        elif self._ready_count and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Flush after the flush interval."""
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Ack every processed message below the oldest in-flight tag per channel."""
+        for channel, ready in list(self._ready.items()):
+            in_flight = self._in_flight.get(channel)
+            floor = min(in_flight) if in_flight else None
+            tags = [tag for tag in ready if floor is None or tag < floor]
+            if not tags:
+                continue
+
+            last = ready[max(tags)]
+            for tag in tags:
+                del ready[tag]
+            self._ready_count -= len(tags)
+            if not ready:
+                del self._ready[channel]
+
+            try:
+                await last.ack(multiple=True)
+            except Exception as e:
+                logger.error("message_batch_ack_failed", count=len(tags), error=str(e))
+
+
 class MessageConsumer:
     """Message consumer for RabbitMQ queues."""
 
@@ -31,6 +138,7 @@ class MessageConsumer:
         """
         self.client = client
         self._consumers: dict[str, Any] = {}
+        self._ack_batchers: list[_AckBatcher] = []
         self._running = False
 
     async def consume(
@@ -39,6 +147,8 @@ class MessageConsumer:
         handler: MessageHandler,
         auto_ack: bool = False,
         prefetch_count: int = 10,
+        ack_batch_size: int = 1,
+        ack_flush_interval: float = 0.05,
     ) -> None:
         """
         Start consuming messages from a queue.
@@ -48,6 +158,9 @@ class MessageConsumer:
             handler: Async message handler function
             auto_ack: Whether to auto-acknowledge messages
             prefetch_count: Number of messages to prefetch
+            ack_batch_size: Processed messages acked together with multiple=True
+                (1 = ack each message individually)
+            ack_flush_interval: Maximum seconds a processed message waits for a batched ack
 
         Raises:
             MessageConsumeError: If consumption fails
@@ -60,11 +173,18 @@ class MessageConsumer:
             channel = self.client.get_channel()
             await channel.set_qos(prefetch_count=prefetch_count)
 
+            ack_batcher = None
+            if ack_batch_size > 1 and not auto_ack:
+                ack_batcher = _AckBatcher(ack_batch_size, ack_flush_interval)
+                self._ack_batchers.append(ack_batcher)
+
             # Create message processor
             async def process_message(message: IncomingMessage) -> None:
+                if ack_batcher is not None:
+                    ack_batcher.track(message)
                 try:
                     # Parse message
-                    body = json.loads(message.body.decode())
+                    body = decode_body(message.body, message.content_type)
 
                     logger.debug(
                         "message_received",
@@ -80,7 +200,9 @@ class MessageConsumer:
                         await self._send_reply(message, result)
 
                     # Acknowledge message
-                    if not auto_ack:
+                    if ack_batcher is not None:
+                        ack_batcher.ack(message)
+                    elif not auto_ack:
                         await message.ack()
 
                     logger.debug(
@@ -89,7 +211,7 @@ class MessageConsumer:
                         correlation_id=message.correlation_id,
                     )
 
-                except json.JSONDecodeError as e:
+                except MessageDecodeError as e:
                     logger.error(
                         "message_decode_failed",
                         queue=queue_config.name,
@@ -98,6 +220,15 @@ class MessageConsumer:
                     # Reject and don't requeue malformed messages
                     await message.reject(requeue=False)
 
+                except MessageRejectedError as e:
+                    logger.error(
+                        "message_rejected",
+                        queue=queue_config.name,
+                        error=str(e),
+                    )
+                    # Retrying would fail the same way, so drop the message
+                    await message.reject(requeue=False)
+
                 except Exception as e:
                     logger.error(
                         "message_processing_failed",
@@ -107,6 +238,10 @@ class MessageConsumer:
                     # Reject and requeue for retry
                     await message.reject(requeue=True)
 
+                finally:
+                    if ack_batcher is not None:
+                        await ack_batcher.release(message)
+
             # Start consuming
             consumer_tag = await queue.consume(process_message, no_ack=auto_ack)
             self._consumers[queue_config.name] = consumer_tag
@@ -137,15 +272,15 @@ class MessageConsumer:
             result: Reply payload
         """
         try:
-            from aio_pika import DeliveryMode, Message
-
-            reply_body = json.dumps(result).encode()
+            # Reply in the same format as the request
+            content_type = message.content_type or JSON_CONTENT_TYPE
+            reply_body = encode_body(result, content_type)
 
             reply_message = Message(
                 body=reply_body,
                 correlation_id=message.correlation_id,
                 delivery_mode=DeliveryMode.NOT_PERSISTENT,
-                content_type="application/json",
+                content_type=content_type,
             )
 
             channel = self.client.get_channel()
@@ -195,6 +330,10 @@ class MessageConsumer:
             for queue_name in list(self._consumers.keys()):
                 await self.stop_consuming(queue_name)
 
+            # Ack messages that finished processing but are waiting for a batch
+            for ack_batcher in self._ack_batchers:
+                await ack_batcher.flush()
+
             logger.info("all_consumers_stopped")
 
         except Exception as e:
@@ -206,6 +345,8 @@ class MessageConsumer:
         handler: MessageHandler,
         auto_ack: bool = False,
         prefetch_count: int = 10,
+        ack_batch_size: int = 1,
+        ack_flush_interval: float = 0.05,
     ) -> None:
         """
         Run consumer in blocking mode (for worker processes).
@@ -215,6 +356,8 @@ class MessageConsumer:
             handler: Async message handler function
             auto_ack: Whether to auto-acknowledge messages
             prefetch_count: Number of messages to prefetch
+            ack_batch_size: Processed messages acked together with multiple=True
+            ack_flush_interval: Maximum seconds a processed message waits for a batched ack
         """
         try:
             self._running = True
@@ -225,6 +368,8 @@ class MessageConsumer:
                 handler=handler,
                 auto_ack=auto_ack,
                 prefetch_count=prefetch_count,
+                ack_batch_size=ack_batch_size,
+                ack_flush_interval=ack_flush_interval,
             )
 
             logger.info("consumer_running", queue=queue_config.name)
@@ -2,15 +2,18 @@
 Message publisher for RabbitMQ.
 """
 
-import json
+import asyncio
+import uuid
 from typing import Any
 
 from aio_pika import DeliveryMode, Message
 
 from shared.config.logging import get_logger
 from shared.exceptions import MessagePublishError
+from shared.messaging.config import get_messaging_settings
 from shared.messaging.queues import QueueConfig
 from shared.messaging.rabbitmq_client import RabbitMQClient
+from shared.messaging.serialization import decode_body, encode_body
 
 logger = get_logger(__name__)
 
@@ -18,14 +21,18 @@ logger = get_logger(__name__)
 class MessagePublisher:
     """Message publisher for RabbitMQ queues."""
 
-    def __init__(self, client: RabbitMQClient):
+    def __init__(self, client: RabbitMQClient, content_type: str | None = None):
         """
         Initialize message publisher.
 
         Args:
             client: RabbitMQ client instance
+            content_type: Body encoding for published messages
+                ("application/json" or "application/msgpack"; uses
+                message_content_type from messaging settings if not provided)
         """
         self.client = client
+        self.content_type = content_type or get_messaging_settings().message_content_type
 
     async def publish(
         self,
@@ -41,7 +48,7 @@ class MessagePublisher:
 
         Args:
             queue_config: Queue configuration
-            message: Message payload (will be JSON serialized)
+            message: Message payload (serialized as content_type)
             priority: Message priority (0-9, higher is more important)
             persistent: Whether message survives broker restart
             correlation_id: Correlation ID for request-response pattern
@@ -52,7 +59,7 @@ class MessagePublisher:
         """
         try:
             # Serialize message
-            body = json.dumps(message).encode()
+            body = encode_body(message, self.content_type)
 
             # Create message
             msg = Message(
@@ -63,7 +70,7 @@ class MessagePublisher:
                 priority=priority,
                 correlation_id=correlation_id,
                 reply_to=reply_to,
-                content_type="application/json",
+                content_type=self.content_type,
             )
 
             # Get exchange
@@ -173,9 +180,6 @@ class MessagePublisher:
             MessagePublishError: If publishing fails
             TimeoutError: If reply not received in time
         """
-        import asyncio
-        import uuid
-
         try:
             correlation_id = str(uuid.uuid4())
             reply_future: asyncio.Future = asyncio.Future()
@@ -186,7 +190,7 @@ class MessagePublisher:
 
             async def on_reply(msg: Any) -> None:
                 if msg.correlation_id == correlation_id:
-                    reply_data = json.loads(msg.body.decode())
+                    reply_data = decode_body(msg.body, msg.content_type)
                     reply_future.set_result(reply_data)
                     await msg.ack()
 
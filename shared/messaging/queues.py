@@ -45,6 +45,13 @@ class Queues:
         routing_key="consolidation.result",
     )
 
+    # Memory storage queue (embedded memories awaiting a Memory Service write)
+    MEMORY_STORAGE = QueueConfig(
+        name="memory.storage",
+        exchange="contextiq.memory",
+        routing_key="memory.storage",
+    )
+
     # Event queues
     SESSION_EVENTS = QueueConfig(
         name="session.events",
@@ -78,6 +85,7 @@ class Queues:
             cls.EXTRACTION_RESULTS,
             cls.CONSOLIDATION_REQUESTS,
             cls.CONSOLIDATION_RESULTS,
+            cls.MEMORY_STORAGE,
             cls.SESSION_EVENTS,
             cls.MEMORY_EVENTS,
             cls.DEAD_LETTER,
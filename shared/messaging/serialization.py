@@ -0,0 +1,103 @@
+"""
+Message body serialization for RabbitMQ.
+
+Bodies are encoded as JSON or MessagePack and tagged with their content
+type, so consumers can decode either format.
+"""
+
+import threading
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+import msgpack
+import orjson
+
+from shared.exceptions import MessageDecodeError
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """
+    Encode types MessagePack does not support natively, as JSON would.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        Encodable representation of obj
+
+    Raises:
+        TypeError: If obj has no known encoding
+    """
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, date | datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
+
+_local = threading.local()
+
+
+def _get_packer() -> msgpack.Packer:
+    """
+    Get this thread's MessagePack packer.
+
+    Packer keeps its internal buffer between calls (autoreset), so reusing
+    one per thread avoids allocating a fresh encode buffer per message.
+
+    Returns:
+        Thread-local msgpack.Packer
+    """
+    packer = getattr(_local, "packer", None)
+    if packer is None:
+        packer = _local.packer = msgpack.Packer(default=_msgpack_default)
+    return packer
+
+
+def encode_body(payload: Any, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """
+    Encode a message payload.
+
+    Args:
+        payload: Message payload
+        content_type: Target content type (JSON or MessagePack)
+
+    Returns:
+        Encoded message body
+
+    Raises:
+        ValueError: If content_type is not supported
+    """
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return _get_packer().pack(payload)
+    if content_type == JSON_CONTENT_TYPE:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    raise ValueError(f"Unsupported content type: {content_type}")
+
+
+def decode_body(body: bytes, content_type: str | None = None) -> Any:
+    """
+    Decode a message body according to its content type.
+
+    Bodies without a content type are decoded as JSON.
+
+    Args:
+        body: Encoded message body
+        content_type: Content type from the message properties
+
+    Returns:
+        Decoded message payload
+
+    Raises:
+        MessageDecodeError: If the body is malformed
+    """
+    try:
+        if content_type == MSGPACK_CONTENT_TYPE:
+            return msgpack.unpackb(body, raw=False)
+        return orjson.loads(body)
+    except (ValueError, msgpack.UnpackException) as e:
+        raise MessageDecodeError(content_type, f"Failed to decode message: {e}") from e
@@ -27,6 +27,7 @@ class CollectionConfig:
     on_disk: bool = False
     hnsw_config: dict | None = None
     optimizers_config: dict | None = None
+    quantization_config: dict | None = None
 
     def to_dict(self) -> dict:
         """Convert configuration to dictionary format for Qdrant API."""
@@ -44,6 +45,9 @@ class CollectionConfig:
         if self.optimizers_config:
             config["optimizers_config"] = self.optimizers_config
 
+        if self.quantization_config:
+            config["quantization_config"] = self.quantization_config
+
         return config
 
 
@@ -52,7 +56,9 @@ def get_memory_collection_config() -> CollectionConfig:
     Get configuration for the memories collection.
 
     Uses OpenAI text-embedding-ada-002 dimensions (1536).
-    Cosine similarity for semantic search.
+    Cosine similarity for semantic search. Vectors are scalar-quantized to
+    int8 and kept in RAM, while the original float32 vectors stay on disk
+    for rescoring.
 
     Returns:
         CollectionConfig for memories collection
@@ -61,7 +67,7 @@ def get_memory_collection_config() -> CollectionConfig:
         name="memories",
         vector_size=1536,  # OpenAI ada-002 embedding size
         distance=DistanceMetric.COSINE,
-        on_disk=False,  # Keep in memory for faster search
+        on_disk=True,  # Originals on disk; search runs on quantized vectors in RAM
         hnsw_config={
             "m": 16,  # Number of edges per node in the graph
             "ef_construct": 100,  # Size of dynamic candidate list for construction
@@ -70,6 +76,13 @@ def get_memory_collection_config() -> CollectionConfig:
         optimizers_config={
             "indexing_threshold": 20000,  # Start indexing after this many vectors
         },
+        quantization_config={
+            "scalar": {
+                "type": "int8",  # 4x smaller than float32
+                "quantile": 0.99,  # Clip outliers when computing the int8 range
+                "always_ram": True,
+            },
+        },
     )
 
 
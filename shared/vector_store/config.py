@@ -38,7 +38,7 @@ class QdrantSettings(BaseSettings):
         description="Qdrant gRPC port",
     )
     qdrant_prefer_grpc: bool = Field(
-        default=False,
+        default=True,
         description="Prefer gRPC over HTTP when available",
     )
 
@@ -65,6 +65,7 @@ class QdrantClientWrapper:
                 url=self.settings.qdrant_url,
                 api_key=self.settings.qdrant_api_key,
                 timeout=self.settings.qdrant_timeout,
+                grpc_port=self.settings.qdrant_grpc_port,
                 prefer_grpc=self.settings.qdrant_prefer_grpc,
             )
         except Exception as e:
@@ -126,6 +127,11 @@ class QdrantClientWrapper:
                     if config.optimizers_config
                     else None
                 ),
+                quantization_config=(
+                    models.ScalarQuantization(**config.quantization_config)
+                    if config.quantization_config
+                    else None
+                ),
             )
             return True
 
@@ -194,26 +200,28 @@ class QdrantClientWrapper:
 
         batch_size = batch_size or self.settings.qdrant_batch_size
 
-        # Convert points to Qdrant format
-        qdrant_points = []
+        # Convert points to columnar Qdrant format
+        ids = []
+        vectors = []
+        payloads = []
         for point in points:
             if "id" not in point or "vector" not in point:
                 raise ValueError("Each point must have 'id' and 'vector' fields")
 
-            qdrant_points.append(
-                models.PointStruct(
-                    id=str(point["id"]) if isinstance(point["id"], UUID) else point["id"],
-                    vector=point["vector"],
-                    payload=point.get("payload", {}),
-                )
-            )
+            ids.append(str(point["id"]) if isinstance(point["id"], UUID) else point["id"])
+            vectors.append(point["vector"])
+            payloads.append(point.get("payload", {}))
 
-        # Upsert in batches
+        # Upsert in batches, one Batch request (parallel id/vector/payload lists) each
         total_upserted = 0
-        for i in range(0, len(qdrant_points), batch_size):
-            batch = qdrant_points[i : i + batch_size]
+        for i in range(0, len(ids), batch_size):
+            batch = models.Batch(
+                ids=ids[i : i + batch_size],
+                vectors=vectors[i : i + batch_size],
+                payloads=payloads[i : i + batch_size],
+            )
             self.client.upsert(collection_name=collection_name, points=batch)
-            total_upserted += len(batch)
+            total_upserted += len(batch.ids)
 
         return total_upserted
 
@@ -288,13 +296,19 @@ class QdrantClientWrapper:
         self,
         collection_name: str,
         point_ids: list[str | UUID],
+        batch_size: int | None = None,
     ) -> int:
         """
         Delete points from a collection.
 
+        Large deletions are split into batches. Every batch except the last is
+        sent without waiting for the server to apply it; the last batch waits,
+        so the call returns once all deletions have been applied.
+
         Args:
             collection_name: Name of the collection
             point_ids: List of point IDs to delete
+            batch_size: Batch size for bulk operations (uses default if not provided)
 
         Returns:
             Number of points deleted
@@ -302,14 +316,22 @@ class QdrantClientWrapper:
         if not point_ids:
             return 0
 
+        batch_size = batch_size or self.settings.qdrant_batch_size
+
         ids = [str(pid) if isinstance(pid, UUID) else pid for pid in point_ids]
 
-        self.client.delete(
-            collection_name=collection_name,
-            points_selector=models.PointIdsList(points=ids),
-        )
+        # Delete in batches
+        total_deleted = 0
+        for i in range(0, len(ids), batch_size):
+            batch = ids[i : i + batch_size]
+            self.client.delete(
+                collection_name=collection_name,
+                points_selector=models.PointIdsList(points=batch),
+                wait=i + batch_size >= len(ids),
+            )
+            total_deleted += len(batch)
 
-        return len(ids)
+        return total_deleted
 
     def count_points(self, collection_name: str, exact: bool = False) -> int:
         """
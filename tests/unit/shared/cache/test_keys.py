@@ -63,6 +63,11 @@ class TestCacheKeys:
         key = CacheKeys.consolidation_job("job_666")
         assert key == "job:consolidation:job_666"
 
+    def test_embedding_key(self):
+        """Test embedding cache key."""
+        key = CacheKeys.embedding("text-embedding-3-small-1536", "abc123")
+        assert key == "embedding:text-embedding-3-small-1536:abc123"
+
     def test_custom_key(self):
         """Test custom cache key."""
         key = CacheKeys.custom("prefix", "middle", "suffix", 123)
@@ -5,7 +5,8 @@ from unittest.mock import AsyncMock, Mock, patch
 import httpx
 import pytest
 
-from shared.clients.base import BaseHTTPClient
+from shared.clients.base import BaseHTTPClient, create_http_client
+from shared.clients.config import HTTPClientSettings
 from shared.exceptions import ServiceUnavailableError
 
 
@@ -141,3 +142,38 @@ class TestBaseHTTPClient:
             async with BaseHTTPClient("http://localhost:8000") as client:
                 response = await client.put("/test/123", json={"data": "updated"})
                 assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_shared_client_not_closed(self):
+        """Test a shared client is used with absolute URLs and left open."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        shared = create_http_client()
+
+        try:
+            with patch.object(
+                shared, "request", new=AsyncMock(return_value=mock_response)
+            ) as mock_request:
+                async with BaseHTTPClient(
+                    "http://localhost:8000", timeout=5, http_client=shared
+                ) as client:
+                    await client.get("/test")
+
+            mock_request.assert_awaited_once_with(
+                "GET", "http://localhost:8000/test", timeout=5, params=None, headers=None
+            )
+            assert client._client is shared
+            assert not shared.is_closed
+        finally:
+            await shared.aclose()
+
+    def test_create_http_client_settings(self):
+        """Test the shared client is built with HTTP/2 and pool limits from settings."""
+        settings = HTTPClientSettings(http2=False, max_connections=10)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            create_http_client(settings)
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["http2"] is False
+        assert kwargs["limits"].max_connections == 10
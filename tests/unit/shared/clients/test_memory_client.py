@@ -0,0 +1,65 @@
+"""Tests for Memory Service client."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from shared.clients.memory_client import MemoryServiceClient
+
+
+class TestListMemoriesStream:
+    """Test MemoryServiceClient.list_memories_stream."""
+
+    @pytest.mark.asyncio
+    async def test_pages_until_limit(self):
+        """Test memories are fetched page by page up to the limit."""
+        client = MemoryServiceClient(base_url="http://localhost:8002")
+        pages = [
+            {"memories": [{"id": "1"}, {"id": "2"}], "total": 5},
+            {"memories": [{"id": "3"}, {"id": "4"}], "total": 5},
+            {"memories": [{"id": "5"}], "total": 5},
+        ]
+
+        with patch.object(client, "list_memories", new=AsyncMock(side_effect=pages)) as mock_list:
+            memories = [
+                m
+                async for m in client.list_memories_stream(
+                    scope_user_id="user-1", limit=10, page_size=2
+                )
+            ]
+
+        assert [m["id"] for m in memories] == ["1", "2", "3", "4", "5"]
+        assert [c.kwargs["offset"] for c in mock_list.await_args_list] == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_limit(self):
+        """Test the final page request is trimmed to the remaining limit."""
+        client = MemoryServiceClient(base_url="http://localhost:8002")
+        pages = [
+            {"memories": [{"id": "1"}, {"id": "2"}], "total": 10},
+            {"memories": [{"id": "3"}], "total": 10},
+        ]
+
+        with patch.object(client, "list_memories", new=AsyncMock(side_effect=pages)) as mock_list:
+            memories = [
+                m
+                async for m in client.list_memories_stream(
+                    scope_user_id="user-1", limit=3, page_size=2
+                )
+            ]
+
+        assert len(memories) == 3
+        assert [c.kwargs["limit"] for c in mock_list.await_args_list] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_single_page_by_default(self):
+        """Test the whole limit is requested in one page when page_size is not set."""
+        client = MemoryServiceClient(base_url="http://localhost:8002")
+        page = {"memories": [{"id": str(i)} for i in range(3)], "total": 3}
+
+        with patch.object(client, "list_memories", new=AsyncMock(return_value=page)) as mock_list:
+            memories = [m async for m in client.list_memories_stream(scope_user_id="u", limit=500)]
+
+        assert len(memories) == 3
+        mock_list.assert_awaited_once()
+        assert mock_list.await_args.kwargs["limit"] == 500
@@ -0,0 +1,61 @@
+"""Tests for Sessions Service client."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from shared.clients.sessions_client import SessionsServiceClient
+
+
+class TestIterEvents:
+    """Test SessionsServiceClient.iter_events."""
+
+    @pytest.mark.asyncio
+    async def test_pages_until_total(self):
+        """Test events are fetched page by page until the total is reached."""
+        client = SessionsServiceClient(base_url="http://localhost:8001")
+        pages = [
+            {"events": [{"id": "1"}, {"id": "2"}], "total": 4},
+            {"events": [{"id": "3"}, {"id": "4"}], "total": 4},
+        ]
+
+        with patch.object(client, "list_events", new=AsyncMock(side_effect=pages)) as mock_list:
+            events = [
+                e
+                async for e in client.iter_events(
+                    session_id="session-1", page_size=2, has_content=True
+                )
+            ]
+
+        assert [e["id"] for e in events] == ["1", "2", "3", "4"]
+        assert [c.kwargs["offset"] for c in mock_list.await_args_list] == [0, 2]
+        assert all(c.kwargs["has_content"] for c in mock_list.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_stops_on_short_page(self):
+        """Test iteration stops on a short page when no total is returned."""
+        client = SessionsServiceClient(base_url="http://localhost:8001")
+        pages = [{"events": [{"id": "1"}, {"id": "2"}]}, {"events": [{"id": "3"}]}]
+
+        with patch.object(client, "list_events", new=AsyncMock(side_effect=pages)) as mock_list:
+            events = [e async for e in client.iter_events(session_id="session-1", page_size=2)]
+
+        assert len(events) == 3
+        assert mock_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages_concurrently(self):
+        """Test pages after the first are fetched together and yielded in order."""
+        client = SessionsServiceClient(base_url="http://localhost:8001")
+
+        async def list_events(offset, limit, **_kwargs):
+            ids = range(offset, min(offset + limit, 5))
+            return {"events": [{"id": str(i)} for i in ids], "total": 5}
+
+        with patch.object(
+            client, "list_events", new=AsyncMock(side_effect=list_events)
+        ) as mock_list:
+            events = [e async for e in client.iter_events(session_id="session-1", page_size=2)]
+
+        assert [e["id"] for e in events] == ["0", "1", "2", "3", "4"]
+        assert [c.kwargs["offset"] for c in mock_list.await_args_list] == [0, 2, 4]
@@ -355,6 +355,25 @@ class TestConsolidation:
         # Might detect conflict depending on similarity threshold
         assert result.memories_processed == 2
 
+    def test_exact_duplicates_skip_similarity(self, engine, monkeypatch):
+        """Test facts equal after normalization merge without a similarity check."""
+        memory1 = Memory(id=uuid4(), fact="User loves pizza.", confidence=0.9, embedding=[1.0])
+        memory2 = Memory(id=uuid4(), fact="user  loves PIZZA", confidence=0.8, embedding=[0.0])
+        memory3 = Memory(id=uuid4(), fact="User works at Google", confidence=0.9, embedding=[1.0])
+        compared = []
+
+        def record_similarity(m1, m2):
+            compared.append({m1.id, m2.id})
+            return 0.0
+
+        monkeypatch.setattr(engine, "_calculate_similarity", record_similarity)
+
+        result = engine.consolidate_memories([memory1, memory2, memory3])
+
+        assert result.merge_count == 1
+        assert set(result.merged_memories[0].source_memory_ids) == {memory1.id, memory2.id}
+        assert compared == [{memory1.id, memory3.id}]
+
     def test_consolidate_error_handling(self, engine, monkeypatch):
         """Test consolidation handles errors gracefully."""
 
@@ -0,0 +1,86 @@
+"""
+Unit tests for the cross-request embedding batcher.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.embedding.batcher import EmbeddingBatcher
+from shared.embedding.config import EmbeddingSettings
+from shared.embedding.service import EmbeddingResult, EmbeddingService
+
+
+@pytest.fixture
+def embedding_service():
+    """Create mock embedding service."""
+    service = MagicMock(spec=EmbeddingService)
+    service.settings = EmbeddingSettings(openai_api_key="test-key")
+    service.generate_embeddings.side_effect = lambda texts: EmbeddingResult(
+        embeddings=[[float(len(text)), 0.5] for text in texts],
+        texts=texts,
+        model="text-embedding-3-small",
+        dimensions=1536,
+    )
+    return service
+
+
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self, embedding_service):
+        """Test concurrent callers are embedded together and get their own slices."""
+        batcher = EmbeddingBatcher(embedding_service, max_wait_ms=50)
+
+        first, second = await asyncio.gather(
+            batcher.generate_embeddings(["a", "bb"]),
+            batcher.generate_embeddings(["ccc"]),
+        )
+        await batcher.close()
+
+        embedding_service.generate_embeddings.assert_called_once_with(["a", "bb", "ccc"])
+        assert first.embeddings == [[1.0, 0.5], [2.0, 0.5]]
+        assert first.texts == ["a", "bb"]
+        assert second.embeddings == [[3.0, 0.5]]
+        assert second.texts == ["ccc"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_max_batch_size(self, embedding_service):
+        """Test a full batch is embedded without waiting for the deadline."""
+        batcher = EmbeddingBatcher(embedding_service, max_batch_size=2, max_wait_ms=10_000)
+
+        result = await asyncio.wait_for(batcher.generate_embeddings(["a", "b"]), timeout=1)
+        await batcher.close()
+
+        assert result.count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self, embedding_service):
+        """Test an embedding error is reported to all callers in the batch."""
+        embedding_service.generate_embeddings.side_effect = lambda texts: EmbeddingResult(
+            embeddings=[],
+            texts=texts,
+            model="text-embedding-3-small",
+            dimensions=1536,
+            error="OpenAI API error: rate limited",
+        )
+        batcher = EmbeddingBatcher(embedding_service, max_wait_ms=50)
+
+        results = await asyncio.gather(
+            batcher.generate_embeddings(["a"]),
+            batcher.generate_embeddings(["b"]),
+        )
+        await batcher.close()
+
+        assert all(result.error == "OpenAI API error: rate limited" for result in results)
+        assert all(result.embeddings == [] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_empty_texts(self, embedding_service):
+        """Test that an empty input is rejected."""
+        batcher = EmbeddingBatcher(embedding_service)
+
+        with pytest.raises(ValueError, match="texts cannot be empty"):
+            await batcher.generate_embeddings([])
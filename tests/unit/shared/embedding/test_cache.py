@@ -0,0 +1,166 @@
+"""
+Unit tests for the Redis-backed embedding cache.
+"""
+
+import struct
+from array import array
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.cache.redis_client import RedisClient
+from shared.embedding.cache import CachedEmbeddingService
+from shared.embedding.config import EmbeddingSettings
+from shared.embedding.service import EmbeddingResult, EmbeddingService
+
+
+@pytest.fixture
+def embedding_service():
+    """Create mock embedding service."""
+    service = MagicMock(spec=EmbeddingService)
+    service.settings = EmbeddingSettings(openai_api_key="test-key")
+    service.generate_embeddings.side_effect = lambda texts: EmbeddingResult(
+        embeddings=[[float(len(text)), 0.5] for text in texts],
+        texts=texts,
+        model="text-embedding-3-small",
+        dimensions=1536,
+    )
+    return service
+
+
+@pytest.fixture
+def redis():
+    """Create mock async Redis connection."""
+    connection = MagicMock()
+    connection.mget = AsyncMock(return_value=[])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    connection.pipeline.return_value.__aenter__.return_value = pipe
+    return connection
+
+
+@pytest.fixture
+def cached_service(embedding_service, redis):
+    """Create cached embedding service with mocked Redis."""
+    redis_client = RedisClient(url="redis://localhost:6379/0", decode_responses=False)
+    redis_client._client = redis
+    return CachedEmbeddingService(embedding_service, redis_client, ttl=60)
+
+
+class TestCachedEmbeddingService:
+    """Tests for CachedEmbeddingService."""
+
+    def test_requires_binary_redis_client(self, embedding_service):
+        """Test that a decoding Redis client is rejected."""
+        with pytest.raises(ValueError, match="decode_responses"):
+            CachedEmbeddingService(embedding_service, RedisClient(url="redis://localhost"))
+
+    def test_cache_key_namespaced_by_model(self, cached_service):
+        """Test cache keys include the model namespace and are stable."""
+        key = cached_service.cache_key("hello")
+
+        assert key.startswith("embedding:text-embedding-3-small-1536:")
+        assert key == cached_service.cache_key("hello")
+        assert key != cached_service.cache_key("world")
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_embedded(self, cached_service, embedding_service, redis):
+        """Test cached vectors are reused and only misses call the API."""
+        redis.mget.return_value = [array("f", [1.0, 2.0]).tobytes(), None]
+
+        result = await cached_service.generate_embeddings(["cached", "new"])
+
+        assert result.error is None
+        assert result.embeddings == [[1.0, 2.0], [3.0, 0.5]]
+        embedding_service.generate_embeddings.assert_called_once_with(["new"])
+        pipe = redis.pipeline.return_value.__aenter__.return_value
+        pipe.set.assert_called_once_with(
+            cached_service.cache_key("new"), array("f", [3.0, 0.5]).tobytes(), ex=60
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_misses_embedded_once(self, cached_service, embedding_service, redis):
+        """Test texts that normalize to the same key are embedded once."""
+        redis.mget.return_value = [None, None, None]
+
+        result = await cached_service.generate_embeddings(["a  b", "a b", "cc"])
+
+        assert result.embeddings == [[4.0, 0.5], [4.0, 0.5], [2.0, 0.5]]
+        embedding_service.generate_embeddings.assert_called_once_with(["a  b", "cc"])
+        pipe = redis.pipeline.return_value.__aenter__.return_value
+        assert pipe.set.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_reuses_vector(self, embedding_service, redis):
+        """Test a near-duplicate of an earlier text reuses its vector."""
+        embedding_service.settings = EmbeddingSettings(
+            openai_api_key="test-key", embedding_near_duplicate_distance=3
+        )
+        redis_client = RedisClient(url="redis://localhost:6379/0", decode_responses=False)
+        redis_client._client = redis
+        service = CachedEmbeddingService(embedding_service, redis_client, ttl=60)
+        redis.mget.return_value = [None]
+
+        await service.generate_embeddings(["Prefers dark mode."])
+        result = await service.generate_embeddings(["prefers dark mode"])
+
+        assert result.embeddings == [[18.0, 0.5]]
+        embedding_service.generate_embeddings.assert_called_once_with(["Prefers dark mode."])
+
+    @pytest.mark.asyncio
+    async def test_float16_storage(self, embedding_service, redis):
+        """Test float16 vectors are written and read in their own namespace."""
+        embedding_service.settings = EmbeddingSettings(
+            openai_api_key="test-key", embedding_cache_float16=True
+        )
+        redis_client = RedisClient(url="redis://localhost:6379/0", decode_responses=False)
+        redis_client._client = redis
+        service = CachedEmbeddingService(embedding_service, redis_client, ttl=60)
+        redis.mget.return_value = [struct.pack("<2e", 1.0, 0.25), None]
+
+        result = await service.generate_embeddings(["cached", "new"])
+
+        assert service.cache_key("new").startswith("embedding:text-embedding-3-small-1536-f16:")
+        assert result.embeddings == [[1.0, 0.25], [3.0, 0.5]]
+        pipe = redis.pipeline.return_value.__aenter__.return_value
+        pipe.set.assert_called_once_with(
+            service.cache_key("new"), struct.pack("<2e", 3.0, 0.5), ex=60
+        )
+
+    @pytest.mark.asyncio
+    async def test_all_hits_skip_api(self, cached_service, embedding_service, redis):
+        """Test no API call is made when every text is cached."""
+        redis.mget.return_value = [array("f", [1.0]).tobytes()]
+
+        result = await cached_service.generate_embeddings(["cached"])
+
+        assert result.embeddings == [[1.0]]
+        embedding_service.generate_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back(self, cached_service, embedding_service, redis):
+        """Test embeddings are generated uncached when Redis fails."""
+        redis.mget.side_effect = ConnectionError("redis down")
+        redis.pipeline.side_effect = ConnectionError("redis down")
+
+        result = await cached_service.generate_embeddings(["a", "bb"])
+
+        assert result.embeddings == [[1.0, 0.5], [2.0, 0.5]]
+        embedding_service.generate_embeddings.assert_called_once_with(["a", "bb"])
+
+    @pytest.mark.asyncio
+    async def test_api_error_is_returned(self, cached_service, embedding_service, redis):
+        """Test an API error result is returned as is."""
+        redis.mget.return_value = [None]
+        embedding_service.generate_embeddings.side_effect = None
+        embedding_service.generate_embeddings.return_value = EmbeddingResult(
+            embeddings=[],
+            texts=["a"],
+            model="text-embedding-3-small",
+            dimensions=1536,
+            error="OpenAI API error",
+        )
+
+        result = await cached_service.generate_embeddings(["a"])
+
+        assert result.error == "OpenAI API error"
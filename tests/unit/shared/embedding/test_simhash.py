@@ -0,0 +1,50 @@
+"""
+Unit tests for SimHash fingerprints and the near-duplicate index.
+"""
+
+import pytest
+
+from shared.embedding.simhash import SimHashIndex, simhash
+
+
+class TestSimHash:
+    """Tests for simhash."""
+
+    def test_ignores_case_and_punctuation(self):
+        """Test formatting-only differences give the same fingerprint."""
+        assert simhash("User prefers dark mode.") == simhash("user  prefers dark mode")
+
+    def test_different_texts_are_far_apart(self):
+        """Test unrelated texts differ in many bits."""
+        distance = (simhash("User prefers dark mode") ^ simhash("Lives in Berlin")).bit_count()
+
+        assert distance > 3
+
+
+class TestSimHashIndex:
+    """Tests for SimHashIndex."""
+
+    def test_finds_nearest_within_distance(self):
+        """Test lookups match fingerprints within max_distance only."""
+        index = SimHashIndex(max_distance=2)
+        index.add(0b1111, [1.0])
+        index.add(0b0011, [2.0])
+
+        assert index.get(0b1110) == [1.0]
+        assert index.get(0b1111 << 20) is None
+
+    def test_evicts_oldest(self):
+        """Test the oldest fingerprint is evicted at max_size."""
+        index = SimHashIndex(max_distance=0, max_size=2)
+        index.add(1, [1.0])
+        index.add(2, [2.0])
+        index.add(3, [3.0])
+
+        assert len(index) == 2
+        assert index.get(1) is None
+        assert index.get(3) == [3.0]
+
+    def test_rejects_distance_beyond_band_guarantee(self):
+        """Test distances the 4-band split cannot guarantee are rejected."""
+        with pytest.raises(ValueError, match="max_distance"):
+            SimHashIndex(max_distance=4)
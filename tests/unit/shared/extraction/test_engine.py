@@ -228,6 +228,33 @@ class TestMemoryExtraction:
 class TestBatchExtraction:
     """Tests for batch extraction operations."""
 
+    def test_batch_events_splits_by_size(self, extraction_engine):
+        """Test events are split into batches of extraction_batch_size."""
+        events = [{"speaker": "User", "content": str(i)} for i in range(25)]
+
+        batches = extraction_engine.batch_events(events)
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert [e for batch in batches for e in batch] == events
+
+    def test_batch_events_folds_short_tail(self, extraction_engine):
+        """Test a tail below extraction_min_events joins the previous batch."""
+        events = [{"speaker": "User", "content": str(i)} for i in range(12)]
+
+        batches = extraction_engine.batch_events(events)
+
+        assert [len(batch) for batch in batches] == [12]
+
+    def test_batch_events_whole_session_by_default(self, mock_llm_client):
+        """Test events stay in one batch when extraction_batch_size is unset."""
+        engine = ExtractionEngine(
+            settings=ExtractionSettings(anthropic_api_key="test-key"),
+            llm_client=mock_llm_client,
+        )
+        events = [{"speaker": "User", "content": str(i)} for i in range(25)]
+
+        assert engine.batch_events(events) == [events]
+
     def test_extract_batch_success(self, extraction_engine, mock_llm_client):
         """Test batch extraction processes multiple batches."""
         # Reset mock
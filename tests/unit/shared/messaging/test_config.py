@@ -2,6 +2,9 @@
 Unit tests for messaging configuration.
 """
 
+import pytest
+from pydantic import ValidationError
+
 from shared.messaging.config import MessagingSettings, get_messaging_settings
 
 
@@ -60,6 +63,15 @@ class TestMessagingSettings:
         settings = MessagingSettings(default_prefetch_count=50)
         assert settings.default_prefetch_count == 50
 
+    def test_message_content_type(self):
+        """Test message content type defaults to JSON and rejects unknown types."""
+        assert MessagingSettings().message_content_type == "application/json"
+        settings = MessagingSettings(message_content_type="application/msgpack")
+        assert settings.message_content_type == "application/msgpack"
+
+        with pytest.raises(ValidationError):
+            MessagingSettings(message_content_type="text/plain")
+
     def test_exchange_settings(self):
         """Test exchange configuration."""
         settings = MessagingSettings()
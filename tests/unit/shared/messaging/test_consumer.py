@@ -0,0 +1,99 @@
+"""
+Unit tests for message consumer ack batching and rejection.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.exceptions import MessageRejectedError
+from shared.messaging.consumer import MessageConsumer, _AckBatcher
+from shared.messaging.queues import Queues
+
+
+def _message(tag: int, channel: object) -> MagicMock:
+    """Create a mock delivered message."""
+    message = MagicMock()
+    message.delivery_tag = tag
+    message.channel = channel
+    message.ack = AsyncMock()
+    return message
+
+
+class TestAckBatcher:
+    """Tests for _AckBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_contiguous_prefix(self):
+        """Test a batch never covers a message that is still in flight."""
+        batcher = _AckBatcher(batch_size=2, flush_interval=60)
+        channel = object()
+        first, second, third = (_message(tag, channel) for tag in (1, 2, 3))
+        for message in (first, second, third):
+            batcher.track(message)
+
+        batcher.ack(second)
+        await batcher.release(second)
+        batcher.ack(third)
+        await batcher.release(third)
+
+        # Tag 1 is still in flight, so nothing can be acked yet
+        second.ack.assert_not_awaited()
+        third.ack.assert_not_awaited()
+
+        await batcher.release(first)  # rejected elsewhere
+
+        third.ack.assert_awaited_once_with(multiple=True)
+        second.ack.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_flush_acks_per_channel(self):
+        """Test tags from different channels are acked separately."""
+        batcher = _AckBatcher(batch_size=10, flush_interval=60)
+        old, new = _message(5, object()), _message(1, object())
+        for message in (old, new):
+            batcher.track(message)
+            batcher.ack(message)
+            await batcher.release(message)
+
+        await batcher.flush()
+
+        old.ack.assert_awaited_once_with(multiple=True)
+        new.ack.assert_awaited_once_with(multiple=True)
+
+
+class TestMessageConsumer:
+    """Tests for MessageConsumer message handling."""
+
+    @staticmethod
+    async def _process(handler: AsyncMock) -> MagicMock:
+        """Consume one message with the handler and return the message."""
+        client = MagicMock()
+        client.declare_queue = AsyncMock(return_value=MagicMock(consume=AsyncMock()))
+        client.get_channel.return_value.set_qos = AsyncMock()
+        consumer = MessageConsumer(client=client)
+        await consumer.consume(Queues.MEMORY_STORAGE, handler)
+        process_message = client.declare_queue.return_value.consume.await_args.args[0]
+
+        message = _message(1, object())
+        message.body = b"{}"
+        message.content_type = "application/json"
+        message.reply_to = None
+        message.reject = AsyncMock()
+        await process_message(message)
+        return message
+
+    @pytest.mark.asyncio
+    async def test_handler_error_requeues(self):
+        """Test a failing handler leaves the message for redelivery."""
+        message = await self._process(AsyncMock(side_effect=RuntimeError("boom")))
+
+        message.reject.assert_awaited_once_with(requeue=True)
+
+    @pytest.mark.asyncio
+    async def test_rejected_message_not_requeued(self):
+        """Test MessageRejectedError drops the message."""
+        message = await self._process(AsyncMock(side_effect=MessageRejectedError("bad")))
+
+        message.reject.assert_awaited_once_with(requeue=False)
+        message.ack.assert_not_awaited()
@@ -71,6 +71,14 @@ class TestQueues:
         assert queue.exchange == "contextiq.consolidation"
         assert queue.routing_key == "consolidation.result"
 
+    def test_memory_storage_queue(self):
+        """Test memory storage queue configuration."""
+        queue = Queues.MEMORY_STORAGE
+
+        assert queue.name == "memory.storage"
+        assert queue.exchange == "contextiq.memory"
+        assert queue.routing_key == "memory.storage"
+
     def test_session_events_queue(self):
         """Test session events queue configuration."""
         queue = Queues.SESSION_EVENTS
@@ -99,11 +107,12 @@ class TestQueues:
         """Test that all_queues returns all defined queues."""
         all_queues = Queues.all_queues()
 
-        assert len(all_queues) == 7
+        assert len(all_queues) == 8
         assert Queues.EXTRACTION_REQUESTS in all_queues
         assert Queues.EXTRACTION_RESULTS in all_queues
         assert Queues.CONSOLIDATION_REQUESTS in all_queues
         assert Queues.CONSOLIDATION_RESULTS in all_queues
+        assert Queues.MEMORY_STORAGE in all_queues
         assert Queues.SESSION_EVENTS in all_queues
         assert Queues.MEMORY_EVENTS in all_queues
         assert Queues.DEAD_LETTER in all_queues
@@ -0,0 +1,60 @@
+"""
+Unit tests for message body serialization.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from shared.exceptions import MessageDecodeError
+from shared.messaging.serialization import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    decode_body,
+    encode_body,
+)
+
+
+class TestSerialization:
+    """Tests for encode_body and decode_body."""
+
+    @pytest.mark.parametrize("content_type", [JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE])
+    def test_round_trip(self, content_type):
+        """Test payloads survive a round trip in both formats."""
+        payload = {"session_id": "abc", "scope": {"user_id": "u1"}, "min_events": 3}
+
+        assert decode_body(encode_body(payload, content_type), content_type) == payload
+
+    def test_msgpack_encodes_uuid_as_string(self):
+        """Test UUIDs are encoded as strings, matching JSON."""
+        value = uuid4()
+
+        body = encode_body({"id": value}, MSGPACK_CONTENT_TYPE)
+
+        assert decode_body(body, MSGPACK_CONTENT_TYPE) == {"id": str(value)}
+
+    def test_msgpack_packer_reuse(self):
+        """Test the reused packer starts clean after success and failure."""
+        with pytest.raises(TypeError):
+            encode_body({"bad": object()}, MSGPACK_CONTENT_TYPE)
+
+        first = encode_body({"a": 1}, MSGPACK_CONTENT_TYPE)
+        second = encode_body({"b": 2}, MSGPACK_CONTENT_TYPE)
+
+        assert decode_body(first, MSGPACK_CONTENT_TYPE) == {"a": 1}
+        assert decode_body(second, MSGPACK_CONTENT_TYPE) == {"b": 2}
+
+    def test_missing_content_type_decodes_json(self):
+        """Test bodies without a content type are decoded as JSON."""
+        assert decode_body(b'{"a": 1}') == {"a": 1}
+
+    @pytest.mark.parametrize("content_type", [JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE])
+    def test_malformed_body(self, content_type):
+        """Test malformed bodies raise MessageDecodeError."""
+        with pytest.raises(MessageDecodeError):
+            decode_body(b"\xc1not-a-message", content_type)
+
+    def test_unsupported_content_type(self):
+        """Test encoding to an unknown content type fails."""
+        with pytest.raises(ValueError, match="Unsupported content type"):
+            encode_body({}, "text/plain")
@@ -84,6 +84,7 @@ class TestCollectionConfig:
         assert result["vectors"]["on_disk"] is False
         assert "hnsw_config" not in result
         assert "optimizers_config" not in result
+        assert "quantization_config" not in result
 
     def test_to_dict_with_hnsw(self):
         """Test converting config with HNSW to dictionary."""
@@ -152,10 +153,13 @@ class TestGetMemoryCollectionConfig:
         config = get_memory_collection_config()
         assert config.distance == DistanceMetric.COSINE
 
-    def test_not_on_disk(self):
-        """Test collection is in-memory."""
+    def test_quantized_in_ram(self):
+        """Test int8 quantized vectors stay in RAM with originals on disk."""
         config = get_memory_collection_config()
-        assert config.on_disk is False
+        assert config.on_disk is True
+        assert config.quantization_config == {
+            "scalar": {"type": "int8", "quantile": 0.99, "always_ram": True}
+        }
 
     def test_has_hnsw_config(self):
         """Test has HNSW configuration."""
@@ -4,6 +4,7 @@ Unit tests for Qdrant client wrapper.
 Tests client initialization, connection management, and basic operations with mocked Qdrant.
 """
 
+from typing import NamedTuple
 from unittest.mock import MagicMock, Mock, patch
 from uuid import uuid4
 
@@ -14,6 +15,15 @@ from shared.vector_store.config import QdrantSettings
 from shared.vector_store.qdrant_client import QdrantClientWrapper
 
 
+class _ScoredPoint(NamedTuple):
+    """Plain stand-in for the point objects returned by the Qdrant client."""
+
+    id: str
+    score: float
+    payload: dict
+    vector: list[float] | None = None
+
+
 @pytest.fixture
 def mock_settings():
     """Create mock Qdrant settings."""
@@ -72,6 +82,7 @@ class TestInitialization:
                 url=mock_settings.qdrant_url,
                 api_key=mock_settings.qdrant_api_key,
                 timeout=mock_settings.qdrant_timeout,
+                grpc_port=mock_settings.qdrant_grpc_port,
                 prefer_grpc=mock_settings.qdrant_prefer_grpc,
             )
 
@@ -177,6 +188,27 @@ class TestCollectionOperations:
         assert result is True
         mock_qdrant_client.create_collection.assert_called_once()
 
+    def test_create_collection_with_quantization(self, qdrant_wrapper, mock_qdrant_client):
+        """Test scalar quantization config is passed to Qdrant."""
+        mock_qdrant_client.reset_mock()
+
+        config = CollectionConfig(
+            name="test_collection",
+            vector_size=128,
+            distance=DistanceMetric.COSINE,
+            quantization_config={"scalar": {"type": "int8", "always_ram": True}},
+        )
+
+        mock_collections = Mock()
+        mock_collections.collections = []
+        mock_qdrant_client.get_collections.return_value = mock_collections
+
+        qdrant_wrapper.create_collection(config)
+
+        quantization = mock_qdrant_client.create_collection.call_args.kwargs["quantization_config"]
+        assert quantization.scalar.type == "int8"
+        assert quantization.scalar.always_ram is True
+
     def test_create_collection_already_exists(self, qdrant_wrapper, mock_qdrant_client):
         """Test creating a collection that already exists."""
         # Reset mock to clear any previous calls
@@ -251,6 +283,10 @@ class TestPointOperations:
 
         assert count == 2
         mock_qdrant_client.upsert.assert_called_once()
+        batch = mock_qdrant_client.upsert.call_args.kwargs["points"]
+        assert batch.ids == ["1", "2"]
+        assert batch.vectors == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        assert batch.payloads == [{"key": "value"}, {"key": "value2"}]
 
     def test_upsert_points_with_uuid(self, qdrant_wrapper, mock_qdrant_client):
         """Test upserting points with UUID ids."""
@@ -278,14 +314,12 @@ class TestPointOperations:
         with pytest.raises(ValueError, match="must have 'id' and 'vector' fields"):
             qdrant_wrapper.upsert_points("test_collection", points)
 
+    @pytest.mark.benchmark
     def test_search_success(self, qdrant_wrapper, mock_qdrant_client):
         """Test searching for similar vectors."""
-        mock_result = Mock()
-        mock_result.id = "1"
-        mock_result.score = 0.95
-        mock_result.payload = {"key": "value"}
-
-        mock_qdrant_client.search.return_value = [mock_result]
+        mock_qdrant_client.search.return_value = [
+            _ScoredPoint(id="1", score=0.95, payload={"key": "value"})
+        ]
 
         results = qdrant_wrapper.search(
             collection_name="test_collection",
@@ -300,12 +334,9 @@ class TestPointOperations:
 
     def test_get_point_success(self, qdrant_wrapper, mock_qdrant_client):
         """Test retrieving a point by ID."""
-        mock_point = Mock()
-        mock_point.id = "1"
-        mock_point.vector = [0.1, 0.2, 0.3]
-        mock_point.payload = {"key": "value"}
-
-        mock_qdrant_client.retrieve.return_value = [mock_point]
+        mock_qdrant_client.retrieve.return_value = [
+            _ScoredPoint(id="1", score=1.0, payload={"key": "value"}, vector=[0.1, 0.2, 0.3])
+        ]
 
         result = qdrant_wrapper.get_point("test_collection", "1")
 
@@ -331,6 +362,17 @@ class TestPointOperations:
         assert count == 3
         mock_qdrant_client.delete.assert_called_once()
 
+    def test_delete_points_chunked(self, qdrant_wrapper, mock_qdrant_client):
+        """Test deleting more points than the batch size."""
+        point_ids = [str(i) for i in range(150)]
+
+        count = qdrant_wrapper.delete_points("test_collection", point_ids)
+
+        assert count == 150
+        assert mock_qdrant_client.delete.call_count == 3
+        waits = [call.kwargs["wait"] for call in mock_qdrant_client.delete.call_args_list]
+        assert waits == [False, False, True]
+
     def test_delete_points_empty(self, qdrant_wrapper, mock_qdrant_client):
         """Test deleting with empty list."""
         count = qdrant_wrapper.delete_points("test_collection", [])
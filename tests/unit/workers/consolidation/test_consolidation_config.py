@@ -0,0 +1,53 @@
+"""
+Unit tests for consolidation worker configuration.
+"""
+
+import dataclasses
+
+import pytest
+
+from workers.consolidation.config import (
+    ConsolidationWorkerSettings,
+    ConsolidationWorkerSettingsSnapshot,
+)
+
+
+class TestConsolidationWorkerSettingsSnapshot:
+    """Tests for consolidation worker settings snapshot."""
+
+    def test_snapshot_fields_match_settings(self):
+        """Test snapshot fields stay in sync with the settings model."""
+        snapshot_fields = {f.name for f in dataclasses.fields(ConsolidationWorkerSettingsSnapshot)}
+
+        assert snapshot_fields == set(ConsolidationWorkerSettings.model_fields)
+
+    def test_snapshot_copies_all_fields(self):
+        """Test snapshot carries every settings field."""
+        settings = ConsolidationWorkerSettings(max_concurrent_saves=4, embedding_chunk_size=8)
+
+        snapshot = ConsolidationWorkerSettingsSnapshot.from_settings(settings)
+
+        for name in ConsolidationWorkerSettings.model_fields:
+            assert getattr(snapshot, name) == getattr(settings, name)
+
+    def test_snapshot_is_frozen(self):
+        """Test snapshot attributes cannot be reassigned."""
+        snapshot = ConsolidationWorkerSettingsSnapshot.from_settings(ConsolidationWorkerSettings())
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.worker_concurrency = 10  # type: ignore[misc]
+
+
+class TestPrefetchCount:
+    """Tests for derived prefetch count."""
+
+    def test_prefetch_derived_from_concurrency(self):
+        """Test an unset prefetch count is derived from concurrency."""
+        assert ConsolidationWorkerSettings(worker_concurrency=3).worker_prefetch_count == 100
+        assert ConsolidationWorkerSettings(worker_concurrency=20).worker_prefetch_count == 100
+
+    def test_explicit_prefetch_kept(self):
+        """Test an explicit prefetch count is not overridden."""
+        settings = ConsolidationWorkerSettings(worker_prefetch_count=7)
+
+        assert settings.worker_prefetch_count == 7
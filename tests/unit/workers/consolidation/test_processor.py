@@ -4,14 +4,16 @@ Unit tests for consolidation processor.
 Tests processor initialization, request processing, and pipeline orchestration.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
 from shared.consolidation.engine import ConsolidationResult as EngineResult
+from shared.consolidation.engine import MergedMemory
+from shared.embedding.service import EmbeddingResult
 from workers.consolidation.models import ConsolidationRequest
-from workers.consolidation.processor import ConsolidationProcessor
+from workers.consolidation.processor import ConsolidationProcessor, _chunk_by_tokens
 
 
 @pytest.fixture
@@ -26,12 +28,31 @@ def mock_embedding_service():
     return MagicMock()
 
 
+def _stream_memories(memories):
+    """Build a list_memories_stream side effect yielding the given memories."""
+
+    async def stream(**_kwargs):
+        for memory in memories:
+            yield memory
+
+    return stream
+
+
 @pytest.fixture
-def processor(mock_consolidation_engine, mock_embedding_service):
+def mock_memory_client():
+    """Create mock Memory Service client."""
+    client = AsyncMock()
+    client.list_memories_stream = MagicMock(side_effect=_stream_memories([]))
+    return client
+
+
+@pytest.fixture
+def processor(mock_consolidation_engine, mock_embedding_service, mock_memory_client):
     """Create processor with mocked dependencies."""
     return ConsolidationProcessor(
         consolidation_engine=mock_consolidation_engine,
         embedding_service=mock_embedding_service,
+        memory_client=mock_memory_client,
     )
 
 
@@ -49,15 +70,19 @@ def sample_request():
 class TestProcessorInitialization:
     """Tests for processor initialization."""
 
-    def test_init_with_services(self, mock_consolidation_engine, mock_embedding_service):
+    def test_init_with_services(
+        self, mock_consolidation_engine, mock_embedding_service, mock_memory_client
+    ):
         """Test initialization with services."""
         processor = ConsolidationProcessor(
             consolidation_engine=mock_consolidation_engine,
             embedding_service=mock_embedding_service,
+            memory_client=mock_memory_client,
         )
 
         assert processor.consolidation_engine is mock_consolidation_engine
         assert processor.embedding_service is mock_embedding_service
+        assert processor.memory_client is mock_memory_client
 
 
 class TestRequestValidation:
@@ -156,3 +181,212 @@ class TestRequestProcessing:
 
         # With no memories, processing succeeds early
         assert result.success is True
+
+    @pytest.mark.asyncio
+    async def test_process_request_saves_merged_memories(
+        self,
+        sample_request,
+        mock_consolidation_engine,
+        mock_embedding_service,
+        mock_memory_client,
+    ):
+        """Test merged memories are saved and failed chunks are counted."""
+        processor = ConsolidationProcessor(
+            consolidation_engine=mock_consolidation_engine,
+            embedding_service=mock_embedding_service,
+            memory_client=mock_memory_client,
+            embedding_chunk_size=1,
+        )
+        mock_memory_client.list_memories_stream.side_effect = _stream_memories(
+            [
+                {"id": str(uuid4()), "fact": "User likes tea", "confidence": 0.8},
+                {"id": str(uuid4()), "fact": "User enjoys tea", "confidence": 0.9},
+            ]
+        )
+        mock_consolidation_engine.consolidate_memories.return_value = EngineResult(
+            merged_memories=[
+                MergedMemory(
+                    fact="User enjoys tea",
+                    confidence=0.95,
+                    source_memory_ids=[uuid4(), uuid4()],
+                    merge_reason="test",
+                ),
+                MergedMemory(
+                    fact="User likes green tea",
+                    confidence=0.9,
+                    source_memory_ids=[uuid4(), uuid4()],
+                    merge_reason="test",
+                ),
+            ],
+            memories_processed=2,
+            memories_merged=4,
+        )
+        mock_embedding_service.generate_embeddings.side_effect = lambda texts: EmbeddingResult(
+            embeddings=[[0.1] * 8 for _ in texts],
+            texts=texts,
+            model="text-embedding-3-small",
+            dimensions=8,
+        )
+        mock_memory_client.create_memories_bulk.side_effect = [
+            {"memories": [{}], "created": 1},
+            Exception("Service error"),
+        ]
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is True
+        assert result.memories_updated == 1
+        assert mock_memory_client.create_memories_bulk.await_count == 2
+        first_items = mock_memory_client.create_memories_bulk.await_args_list[0].kwargs["items"]
+        assert first_items == [
+            {
+                "fact": "User enjoys tea",
+                "source_type": "consolidated",
+                "embedding": [0.1] * 8,
+                "confidence": 0.95,
+                "importance": 0.7,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_process_request_embeds_in_chunks(
+        self,
+        mock_consolidation_engine,
+        mock_embedding_service,
+        mock_memory_client,
+        sample_request,
+    ):
+        """Test merged memories are embedded and saved chunk by chunk."""
+        processor = ConsolidationProcessor(
+            consolidation_engine=mock_consolidation_engine,
+            embedding_service=mock_embedding_service,
+            memory_client=mock_memory_client,
+            embedding_chunk_size=2,
+        )
+        mock_memory_client.list_memories_stream.side_effect = _stream_memories(
+            [{"id": str(uuid4()), "fact": f"Fact {i}"} for i in range(2)]
+        )
+        mock_consolidation_engine.consolidate_memories.return_value = EngineResult(
+            merged_memories=[
+                MergedMemory(
+                    fact=f"Merged fact {i}",
+                    confidence=0.9,
+                    source_memory_ids=[uuid4(), uuid4()],
+                    merge_reason="test",
+                )
+                for i in range(5)
+            ],
+        )
+        mock_embedding_service.generate_embeddings.side_effect = lambda texts: EmbeddingResult(
+            embeddings=[[0.1] * 8 for _ in texts],
+            texts=texts,
+            model="text-embedding-3-small",
+            dimensions=8,
+        )
+        mock_memory_client.create_memories_bulk.return_value = {}
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is True
+        assert result.memories_updated == 5
+        assert mock_embedding_service.generate_embeddings.call_count == 3
+        saved_chunks = [
+            len(call.kwargs["items"])
+            for call in mock_memory_client.create_memories_bulk.await_args_list
+        ]
+        assert saved_chunks == [2, 2, 1]
+
+
+class TestSaveChunk:
+    """Tests for saving merged memories in bulk."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "embeddings,expected",
+        [([[0.1], [0.2], [0.3]], [[0.1], [0.2]]), ([[0.1]], [[0.1], None])],
+    )
+    async def test_pairs_memories_with_embeddings(
+        self, processor, mock_memory_client, embeddings, expected
+    ):
+        """Test one item is saved per memory, padding missing embeddings."""
+        chunk = [
+            MergedMemory(
+                fact=f"Merged fact {i}",
+                confidence=0.9,
+                source_memory_ids=[uuid4(), uuid4()],
+                merge_reason="test",
+            )
+            for i in range(2)
+        ]
+
+        failed = await processor._save_chunk({"user_id": "1"}, 0, chunk, embeddings)
+
+        assert failed == []
+        items = mock_memory_client.create_memories_bulk.await_args.kwargs["items"]
+        assert [item["fact"] for item in items] == ["Merged fact 0", "Merged fact 1"]
+        assert [item["embedding"] for item in items] == expected
+
+
+class TestChunkByTokens:
+    """Tests for token-aware embedding chunking."""
+
+    def test_splits_on_max_items(self):
+        """Test chunks are bounded by item count."""
+        assert _chunk_by_tokens(["a"] * 5, max_tokens=1000, max_items=2) == [
+            (0, 2),
+            (2, 4),
+            (4, 5),
+        ]
+
+    def test_splits_on_token_budget(self):
+        """Test chunks are bounded by estimated tokens."""
+        facts = ["x" * 40, "x" * 40, "x" * 40]  # ~10 tokens each
+
+        assert _chunk_by_tokens(facts, max_tokens=25, max_items=10) == [(0, 2), (2, 3)]
+
+    def test_oversized_fact_gets_own_chunk(self):
+        """Test a fact over the token budget is still embedded on its own."""
+        facts = ["short", "x" * 400, "short"]
+
+        assert _chunk_by_tokens(facts, max_tokens=10, max_items=10) == [
+            (0, 1),
+            (1, 2),
+            (2, 3),
+        ]
+
+    def test_empty(self):
+        """Test no chunks for no facts."""
+        assert _chunk_by_tokens([]) == []
+
+
+class TestRecordConversion:
+    """Tests for converting Memory Service records."""
+
+    def test_to_memory_parses_ids(self):
+        """Test Memory Service records are converted with parsed IDs."""
+        memory_id, session_id = uuid4(), uuid4()
+
+        memory = ConsolidationProcessor._to_memory(
+            {"id": str(memory_id), "fact": "User likes tea", "source_session_id": str(session_id)}
+        )
+
+        assert memory.id == memory_id
+        assert memory.source_session_id == session_id
+        assert len(memory.embedding) == 0
+
+    def test_to_memory_packs_embedding(self):
+        """Test embeddings are packed into float32 arrays."""
+        memory = ConsolidationProcessor._to_memory(
+            {"id": str(uuid4()), "fact": "User likes tea", "embedding": [0.5, 0.25]}
+        )
+
+        assert memory.embedding.typecode == "f"
+        assert list(memory.embedding) == [0.5, 0.25]
+
+    def test_to_memory_null_embedding(self):
+        """Test a null embedding in the response becomes an empty array."""
+        memory = ConsolidationProcessor._to_memory(
+            {"id": str(uuid4()), "fact": "User likes tea", "embedding": None}
+        )
+
+        assert len(memory.embedding) == 0
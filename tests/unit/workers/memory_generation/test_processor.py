@@ -4,46 +4,77 @@ Unit tests for memory generation processor.
 Tests processor initialization, request processing, and pipeline orchestration.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
+from shared.clients import MemoryServiceClient, SessionsServiceClient
+from shared.embedding import CachedEmbeddingService, EmbeddingService
 from shared.embedding.service import EmbeddingResult
+from shared.extraction import ExtractionEngine
 from shared.extraction.engine import ExtractionResult
+from shared.messaging import MessagePublisher, Queues
 from workers.memory_generation.models import MemoryGenerationRequest
-from workers.memory_generation.processor import MemoryGenerationProcessor
+from workers.memory_generation.processor import MemoryGenerationProcessor, _build_scope
 
 
-@pytest.fixture
+class _StubVectorStore:
+    """Stub vector store; the processor stores memories via Memory Service."""
+
+    def upsert_points(self, *args, **kwargs) -> int:
+        return 0
+
+
+@pytest.fixture(scope="module")
 def mock_extraction_engine():
     """Create mock extraction engine."""
-    return MagicMock()
+    return MagicMock(spec=ExtractionEngine)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_embedding_service():
     """Create mock embedding service."""
-    return MagicMock()
+    return MagicMock(spec=EmbeddingService)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_vector_store():
-    """Create mock vector store."""
-    return MagicMock()
+    """Create stub vector store."""
+    return _StubVectorStore()
+
+
+@pytest.fixture(scope="module")
+def mock_sessions_client():
+    """Create mock Sessions Service client."""
+    return AsyncMock(spec=SessionsServiceClient)
+
 
+@pytest.fixture(scope="module")
+def mock_memory_client():
+    """Create mock Memory Service client."""
+    return AsyncMock(spec=MemoryServiceClient)
 
-@pytest.fixture
-def processor(mock_extraction_engine, mock_embedding_service, mock_vector_store):
+
+@pytest.fixture(scope="module")
+def processor(
+    mock_extraction_engine,
+    mock_embedding_service,
+    mock_vector_store,
+    mock_sessions_client,
+    mock_memory_client,
+):
     """Create processor with mocked dependencies."""
     return MemoryGenerationProcessor(
         extraction_engine=mock_extraction_engine,
         embedding_service=mock_embedding_service,
         vector_store=mock_vector_store,
+        sessions_client=mock_sessions_client,
+        memory_client=mock_memory_client,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_request():
     """Create sample memory generation request."""
     return MemoryGenerationRequest(
@@ -54,7 +85,7 @@ def sample_request():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_conversation():
     """Create sample conversation events."""
     return [
@@ -64,22 +95,58 @@ def sample_conversation():
     ]
 
 
+@pytest.fixture(autouse=True)
+def _reset(
+    mock_extraction_engine,
+    mock_embedding_service,
+    mock_sessions_client,
+    mock_memory_client,
+    sample_conversation,
+):
+    """Reset shared mocks between tests and serve the sample conversation."""
+    for mock in (
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_sessions_client,
+        mock_memory_client,
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    mock_extraction_engine.batch_events.side_effect = lambda events: [events]
+
+    async def iter_events(**_kwargs):
+        for event in sample_conversation:
+            yield {"event_type": event["speaker"], "data": {"content": event["content"]}}
+
+    mock_sessions_client.iter_events = MagicMock(side_effect=iter_events)
+    yield
+
+
 class TestProcessorInitialization:
     """Tests for processor initialization."""
 
     def test_init_with_services(
-        self, mock_extraction_engine, mock_embedding_service, mock_vector_store
+        self,
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_vector_store,
+        mock_sessions_client,
+        mock_memory_client,
     ):
         """Test initialization with services."""
         processor = MemoryGenerationProcessor(
             extraction_engine=mock_extraction_engine,
             embedding_service=mock_embedding_service,
             vector_store=mock_vector_store,
+            sessions_client=mock_sessions_client,
+            memory_client=mock_memory_client,
         )
 
         assert processor.extraction_engine is mock_extraction_engine
         assert processor.embedding_service is mock_embedding_service
         assert processor.vector_store is mock_vector_store
+        assert processor.sessions_client is mock_sessions_client
+        assert processor.memory_client is mock_memory_client
 
 
 class TestRequestValidation:
@@ -114,15 +181,10 @@ class TestRequestProcessing:
         self,
         processor,
         sample_request,
-        sample_conversation,
         mock_extraction_engine,
         mock_embedding_service,
     ):
         """Test successful request processing."""
-        # Reset mocks
-        mock_extraction_engine.reset_mock()
-        mock_embedding_service.reset_mock()
-
         # Mock extraction result
         mock_extraction_engine.extract_memories.return_value = ExtractionResult(
             memories=[
@@ -140,32 +202,160 @@ class TestRequestProcessing:
             dimensions=1536,
         )
 
-        result = await processor.process_request(sample_request, sample_conversation)
+        result = await processor.process_request(sample_request)
 
         assert result.success is True
         assert result.memories_extracted == 2
         assert result.embeddings_generated == 2
         assert result.error is None
 
+    @pytest.mark.asyncio
+    async def test_process_request_skips_empty_events(
+        self,
+        processor,
+        sample_request,
+        mock_extraction_engine,
+        mock_sessions_client,
+    ):
+        """Test events are fetched with has_content and empty events are skipped."""
+
+        async def iter_events(**_kwargs):
+            yield {"event_type": "user", "data": {"content": "I love pizza"}}
+            yield {"event_type": "tool_call", "data": {}}
+
+        mock_sessions_client.iter_events.side_effect = iter_events
+        mock_extraction_engine.extract_memories.return_value = ExtractionResult(
+            memories=[],
+            raw_response="test",
+        )
+
+        await processor.process_request(sample_request.model_copy(update={"min_events": 1}))
+
+        assert mock_sessions_client.iter_events.call_args.kwargs["has_content"] is True
+        conversation = mock_extraction_engine.extract_memories.call_args.kwargs[
+            "conversation_events"
+        ]
+        assert conversation == [{"speaker": "user", "content": "I love pizza"}]
+
+    @pytest.mark.asyncio
+    async def test_process_request_skips_short_sessions(
+        self,
+        processor,
+        sample_request,
+        mock_extraction_engine,
+    ):
+        """Test sessions with fewer than min_events events skip extraction."""
+        request = sample_request.model_copy(update={"min_events": 100})
+
+        result = await processor.process_request(request)
+
+        assert result.success is True
+        assert result.memories_extracted == 0
+        mock_extraction_engine.extract_memories.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_request_pipelines_batches(
+        self,
+        processor,
+        sample_request,
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_memory_client,
+    ):
+        """Test each extraction batch is embedded separately and saved together."""
+        mock_extraction_engine.batch_events.side_effect = lambda events: [events[:2], events[2:]]
+        mock_extraction_engine.extract_memories.side_effect = [
+            ExtractionResult(
+                memories=[{"fact": "User's name is Mark", "category": "fact", "confidence": 1.0}],
+                raw_response="test",
+            ),
+            ExtractionResult(
+                memories=[{"fact": "User works at Google", "category": "fact", "confidence": 1.0}],
+                raw_response="test",
+            ),
+        ]
+        mock_embedding_service.generate_embeddings.side_effect = lambda texts: EmbeddingResult(
+            embeddings=[[0.1] * 1536 for _ in texts],
+            texts=texts,
+            model="text-embedding-3-small",
+            dimensions=1536,
+        )
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is True
+        assert result.memories_extracted == 2
+        assert result.memories_saved == 2
+        assert result.embeddings_generated == 2
+        assert mock_embedding_service.generate_embeddings.call_count == 2
+        mock_memory_client.create_memories_bulk.assert_awaited_once()
+        items = mock_memory_client.create_memories_bulk.await_args.kwargs["items"]
+        assert [item["fact"] for item in items] == ["User's name is Mark", "User works at Google"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "second_batch",
+        [
+            ExtractionResult(memories=[], error="LLM API error"),
+            ExtractionResult(
+                memories=[{"fact": "User works at Google", "category": "fact"}],
+                raw_response="test",
+            ),
+        ],
+        ids=["extraction_error", "embedding_error"],
+    )
+    async def test_process_request_failure_saves_nothing(
+        self,
+        processor,
+        sample_request,
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_memory_client,
+        second_batch,
+    ):
+        """Test a failed later batch leaves no saved memories behind for the retry."""
+        mock_extraction_engine.batch_events.side_effect = lambda events: [events[:2], events[2:]]
+        mock_extraction_engine.extract_memories.side_effect = [
+            ExtractionResult(
+                memories=[{"fact": "User's name is Mark", "category": "fact"}],
+                raw_response="test",
+            ),
+            second_batch,
+        ]
+
+        def generate_embeddings(texts):
+            error = "OpenAI API error" if texts == ["User works at Google"] else None
+            return EmbeddingResult(
+                embeddings=[] if error else [[0.1] * 1536 for _ in texts],
+                texts=texts,
+                model="text-embedding-3-small",
+                dimensions=1536,
+                error=error,
+            )
+
+        mock_embedding_service.generate_embeddings.side_effect = generate_embeddings
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is False
+        assert result.memories_saved == 0
+        mock_memory_client.create_memories_bulk.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_process_request_extraction_failure(
         self,
         processor,
         sample_request,
-        sample_conversation,
         mock_extraction_engine,
     ):
         """Test processing handles extraction failure."""
-        # Reset mock
-        mock_extraction_engine.reset_mock()
-
         # Mock extraction failure
         mock_extraction_engine.extract_memories.return_value = ExtractionResult(
             memories=[],
             error="LLM API error",
         )
 
-        result = await processor.process_request(sample_request, sample_conversation)
+        result = await processor.process_request(sample_request)
 
         assert result.success is False
         assert "Extraction failed" in result.error
@@ -176,20 +366,16 @@ class TestRequestProcessing:
         self,
         processor,
         sample_request,
-        sample_conversation,
         mock_extraction_engine,
     ):
         """Test processing when no memories extracted."""
-        # Reset mock
-        mock_extraction_engine.reset_mock()
-
         # Mock empty extraction
         mock_extraction_engine.extract_memories.return_value = ExtractionResult(
             memories=[],
             raw_response="test",
         )
 
-        result = await processor.process_request(sample_request, sample_conversation)
+        result = await processor.process_request(sample_request)
 
         assert result.success is True
         assert result.memories_extracted == 0
@@ -200,15 +386,10 @@ class TestRequestProcessing:
         self,
         processor,
         sample_request,
-        sample_conversation,
         mock_extraction_engine,
         mock_embedding_service,
     ):
         """Test processing handles embedding failure."""
-        # Reset mocks
-        mock_extraction_engine.reset_mock()
-        mock_embedding_service.reset_mock()
-
         # Mock successful extraction
         mock_extraction_engine.extract_memories.return_value = ExtractionResult(
             memories=[{"fact": "User loves pizza", "category": "preference", "confidence": 0.9}],
@@ -224,7 +405,7 @@ class TestRequestProcessing:
             error="OpenAI API error",
         )
 
-        result = await processor.process_request(sample_request, sample_conversation)
+        result = await processor.process_request(sample_request)
 
         assert result.success is False
         assert "Embedding generation failed" in result.error
@@ -236,17 +417,174 @@ class TestRequestProcessing:
         self,
         processor,
         sample_request,
-        sample_conversation,
         mock_extraction_engine,
     ):
         """Test processing handles unexpected exceptions."""
-        # Reset mock
-        mock_extraction_engine.reset_mock()
-
         # Mock exception
         mock_extraction_engine.extract_memories.side_effect = Exception("Unexpected error")
 
-        result = await processor.process_request(sample_request, sample_conversation)
+        result = await processor.process_request(sample_request)
 
         assert result.success is False
         assert "Processing error" in result.error
+
+    @pytest.mark.asyncio
+    async def test_process_request_saves_in_bulk(
+        self,
+        processor,
+        sample_request,
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_memory_client,
+    ):
+        """Test memories are saved with a single bulk request."""
+        mock_extraction_engine.extract_memories.return_value = ExtractionResult(
+            memories=[
+                {"fact": "User's name is Mark", "category": "fact", "confidence": 1.0},
+                {"fact": "User loves pizza", "category": "preference", "confidence": 0.9},
+            ],
+            raw_response="test",
+        )
+        mock_embedding_service.generate_embeddings.return_value = EmbeddingResult(
+            embeddings=[[0.1] * 1536, [0.2] * 1536],
+            texts=["User's name is Mark", "User loves pizza"],
+            model="text-embedding-3-small",
+            dimensions=1536,
+        )
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is True
+        assert result.memories_saved == 2
+        mock_memory_client.create_memories_bulk.assert_awaited_once()
+        kwargs = mock_memory_client.create_memories_bulk.await_args.kwargs
+        assert kwargs["scope"] == {"user_id": str(sample_request.user_id)}
+        assert type(kwargs["scope"]) is dict
+        assert [item["fact"] for item in kwargs["items"]] == [
+            "User's name is Mark",
+            "User loves pizza",
+        ]
+        assert kwargs["items"][1]["embedding"] == [0.2] * 1536
+        assert kwargs["items"][1]["source_id"] == str(sample_request.session_id)
+
+    @pytest.mark.asyncio
+    async def test_process_request_bulk_save_failure(
+        self,
+        processor,
+        sample_request,
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_memory_client,
+    ):
+        """Test a failed bulk save is counted without failing the request."""
+        mock_extraction_engine.extract_memories.return_value = ExtractionResult(
+            memories=[{"fact": "User loves pizza", "category": "preference", "confidence": 0.9}],
+            raw_response="test",
+        )
+        mock_embedding_service.generate_embeddings.return_value = EmbeddingResult(
+            embeddings=[[0.1] * 1536],
+            texts=["User loves pizza"],
+            model="text-embedding-3-small",
+            dimensions=1536,
+        )
+        mock_memory_client.create_memories_bulk.side_effect = Exception("Service error")
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is True
+        assert result.memories_saved == 0
+        assert result.error == "Failed to save 1 memories"
+
+    @pytest.mark.asyncio
+    async def test_process_request_publishes_to_storage_queue(
+        self,
+        sample_request,
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_vector_store,
+        mock_sessions_client,
+        mock_memory_client,
+    ):
+        """Test memories are handed to the storage queue when a publisher is set."""
+        storage_publisher = AsyncMock(spec=MessagePublisher)
+        processor = MemoryGenerationProcessor(
+            extraction_engine=mock_extraction_engine,
+            embedding_service=mock_embedding_service,
+            vector_store=mock_vector_store,
+            sessions_client=mock_sessions_client,
+            memory_client=mock_memory_client,
+            storage_publisher=storage_publisher,
+        )
+        mock_extraction_engine.extract_memories.return_value = ExtractionResult(
+            memories=[{"fact": "User loves pizza", "category": "preference", "confidence": 0.9}],
+            raw_response="test",
+        )
+        mock_embedding_service.generate_embeddings.return_value = EmbeddingResult(
+            embeddings=[[0.1] * 1536],
+            texts=["User loves pizza"],
+            model="text-embedding-3-small",
+            dimensions=1536,
+        )
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is True
+        assert result.memories_saved == 1
+        mock_memory_client.create_memories_bulk.assert_not_awaited()
+        queue_config, message = storage_publisher.publish.await_args.args
+        assert queue_config is Queues.MEMORY_STORAGE
+        assert message["scope"] == {"user_id": str(sample_request.user_id)}
+        assert type(message["scope"]) is dict
+        assert message["items"][0]["fact"] == "User loves pizza"
+
+    @pytest.mark.asyncio
+    async def test_process_request_uses_embedding_cache(
+        self,
+        sample_request,
+        mock_extraction_engine,
+        mock_embedding_service,
+        mock_vector_store,
+        mock_sessions_client,
+        mock_memory_client,
+    ):
+        """Test embeddings come from the cache when one is configured."""
+        embedding_cache = AsyncMock(spec=CachedEmbeddingService)
+        embedding_cache.generate_embeddings.return_value = EmbeddingResult(
+            embeddings=[[0.1] * 1536],
+            texts=["User loves pizza"],
+            model="text-embedding-3-small",
+            dimensions=1536,
+        )
+        processor = MemoryGenerationProcessor(
+            extraction_engine=mock_extraction_engine,
+            embedding_service=mock_embedding_service,
+            vector_store=mock_vector_store,
+            sessions_client=mock_sessions_client,
+            memory_client=mock_memory_client,
+            embedding_cache=embedding_cache,
+        )
+        mock_extraction_engine.extract_memories.return_value = ExtractionResult(
+            memories=[{"fact": "User loves pizza", "category": "preference", "confidence": 0.9}],
+            raw_response="test",
+        )
+
+        result = await processor.process_request(sample_request)
+
+        assert result.success is True
+        assert result.embeddings_generated == 1
+        embedding_cache.generate_embeddings.assert_awaited_once_with(["User loves pizza"])
+        mock_embedding_service.generate_embeddings.assert_not_called()
+
+
+class TestBuildScope:
+    """Tests for cached scope building."""
+
+    def test_cached_scope_is_read_only(self):
+        """Test the scope shared between requests cannot be mutated."""
+        user_id = uuid4()
+        scope = _build_scope("user", user_id)
+
+        with pytest.raises(TypeError):
+            scope["user_id"] = "other"  # type: ignore[index]
+
+        assert _build_scope("user", user_id) == {"user_id": str(user_id)}
@@ -0,0 +1,82 @@
+"""
+Unit tests for memory storage worker.
+
+Tests message handling and which failures are retried.
+"""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from shared.exceptions import MessageRejectedError, ServiceUnavailableError
+from workers.memory_storage.worker import MemoryStorageWorker
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    """Create an HTTP status error for the bulk endpoint."""
+    request = httpx.Request("POST", "http://memory/api/v1/memories/bulk")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.fixture
+def worker():
+    """Create worker with a mocked Memory Service client."""
+    worker = MemoryStorageWorker()
+    worker.memory_client = AsyncMock()
+    return worker
+
+
+@pytest.fixture
+def message_data():
+    """Create a valid memory storage message."""
+    return {
+        "scope": {"user_id": "user_123"},
+        "items": [
+            {"fact": "User likes tea", "source_type": "extracted", "embedding": [0.1, 0.2]},
+            {"fact": "User lives in Oslo", "source_type": "extracted", "embedding": [0.3, 0.4]},
+        ],
+    }
+
+
+class TestHandleMessage:
+    """Tests for MemoryStorageWorker.handle_message."""
+
+    @pytest.mark.asyncio
+    async def test_saves_batch_in_one_request(self, worker, message_data):
+        """Test all items are written with a single bulk request."""
+        result = await worker.handle_message(message_data)
+
+        assert result == {"memories_saved": 2, "success": True}
+        worker.memory_client.create_memories_bulk.assert_awaited_once_with(
+            scope=message_data["scope"], items=message_data["items"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalid_message_rejected(self, worker):
+        """Test a message that fails validation is not retried."""
+        with pytest.raises(MessageRejectedError):
+            await worker.handle_message({"scope": {"user_id": "user_123"}, "items": []})
+
+        worker.memory_client.create_memories_bulk.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_client_error_rejected(self, worker, message_data):
+        """Test a 4xx response from the Memory Service is not retried."""
+        worker.memory_client.create_memories_bulk.side_effect = _status_error(422)
+
+        with pytest.raises(MessageRejectedError):
+            await worker.handle_message(message_data)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [ServiceUnavailableError("Memory Service is down"), _status_error(503)],
+    )
+    async def test_transient_error_reraised(self, worker, message_data, error):
+        """Test transient failures propagate so the message is requeued."""
+        worker.memory_client.create_memories_bulk.side_effect = error
+
+        with pytest.raises(type(error)):
+            await worker.handle_message(message_data)
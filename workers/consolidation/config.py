@@ -5,9 +5,10 @@ Defines worker configuration including queue names, batch sizes,
 and consolidation scheduling.
 """
 
+from dataclasses import dataclass, fields
 from functools import lru_cache
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -35,10 +36,47 @@ class ConsolidationWorkerSettings(BaseSettings):
     )
 
     worker_prefetch_count: int = Field(
-        default=5,
+        default=0,
+        ge=0,
+        le=1000,
+        description=(
+            "Number of messages to prefetch from queue (0 = max(100, 2 * worker_concurrency))"
+        ),
+    )
+
+    worker_ack_batch_size: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Processed messages acked together with one multi-ack (1 = ack each)",
+    )
+
+    worker_ack_flush_ms: int = Field(
+        default=50,
+        ge=1,
+        le=10000,
+        description="Maximum milliseconds a processed message waits for a batched ack",
+    )
+
+    max_concurrent_saves: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum concurrent save requests to Memory Service per consolidation",
+    )
+
+    embedding_chunk_size: int = Field(
+        default=16,
+        ge=1,
+        le=256,
+        description="Number of merged memories embedded per chunk while saves are in flight",
+    )
+
+    embedding_chunk_max_tokens: int = Field(
+        default=8000,
         ge=1,
-        le=50,
-        description="Number of messages to prefetch from queue",
+        le=300000,
+        description="Estimated token budget per embedding request chunk",
     )
 
     # Queue configuration
@@ -90,6 +128,18 @@ class ConsolidationWorkerSettings(BaseSettings):
         description="Interval in hours for periodic consolidation",
     )
 
+    @model_validator(mode="after")
+    def derive_prefetch_count(self) -> "ConsolidationWorkerSettings":
+        """
+        Derive the prefetch count from concurrency when not set explicitly.
+
+        Returns:
+            Settings with worker_prefetch_count resolved
+        """
+        if self.worker_prefetch_count == 0:
+            self.worker_prefetch_count = max(100, 2 * self.worker_concurrency)
+        return self
+
 
 @lru_cache
 def get_consolidation_worker_settings() -> ConsolidationWorkerSettings:
@@ -100,3 +150,55 @@ def get_consolidation_worker_settings() -> ConsolidationWorkerSettings:
         ConsolidationWorkerSettings: Cached settings instance
     """
     return ConsolidationWorkerSettings()
+
+
+@dataclass(slots=True, frozen=True)
+class ConsolidationWorkerSettingsSnapshot:
+    """
+    Immutable copy of ConsolidationWorkerSettings taken at worker startup.
+
+    Hot paths read plain slot attributes instead of going through pydantic
+    model attribute access. Fields mirror ConsolidationWorkerSettings.
+    """
+
+    worker_name: str
+    worker_concurrency: int
+    worker_prefetch_count: int
+    worker_ack_batch_size: int
+    worker_ack_flush_ms: int
+    max_concurrent_saves: int
+    embedding_chunk_size: int
+    embedding_chunk_max_tokens: int
+    consolidation_queue: str
+    max_retry_attempts: int
+    retry_backoff_seconds: int
+    max_memories_per_batch: int
+    consolidation_timeout_seconds: int
+    enable_periodic_consolidation: bool
+    consolidation_interval_hours: int
+
+    @classmethod
+    def from_settings(
+        cls, settings: ConsolidationWorkerSettings
+    ) -> "ConsolidationWorkerSettingsSnapshot":
+        """
+        Create a snapshot from validated settings.
+
+        Args:
+            settings: Validated consolidation worker settings
+
+        Returns:
+            ConsolidationWorkerSettingsSnapshot with each field copied once
+        """
+        return cls(**{f.name: getattr(settings, f.name) for f in fields(cls)})
+
+
+@lru_cache
+def get_consolidation_worker_settings_snapshot() -> ConsolidationWorkerSettingsSnapshot:
+    """
+    Get cached snapshot of consolidation worker settings.
+
+    Returns:
+        ConsolidationWorkerSettingsSnapshot: Cached settings snapshot
+    """
+    return ConsolidationWorkerSettingsSnapshot.from_settings(get_consolidation_worker_settings())
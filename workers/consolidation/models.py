@@ -7,12 +7,16 @@ Defines message formats and processing results for the consolidation pipeline.
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from shared.utils.datetime_utils import get_utc_now
 
 
 class ConsolidationRequest(BaseModel):
     """Request to consolidate memories for a scope."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     scope: dict[str, str] = Field(..., description="Scope for consolidation (user/org/global)")
     user_id: UUID | None = Field(None, description="User ID (for user scope)")
     max_memories: int = Field(
@@ -26,13 +30,20 @@ class ConsolidationRequest(BaseModel):
         description="Whether to detect conflicts during consolidation",
     )
     requested_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=get_utc_now,
         description="When consolidation was requested",
     )
 
 
 class ConsolidationResult(BaseModel):
-    """Result of consolidation processing."""
+    """
+    Result of consolidation processing.
+
+    Built by the processor from trusted internal data, so success paths may
+    use model_construct() to skip validation.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
 
     scope: dict[str, str] = Field(..., description="Scope that was consolidated")
     memories_processed: int = Field(default=0, description="Number of memories processed")
@@ -42,6 +53,6 @@ class ConsolidationResult(BaseModel):
     success: bool = Field(default=False, description="Whether consolidation succeeded")
     error: str | None = Field(None, description="Error message if failed")
     processed_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=get_utc_now,
         description="When processing completed",
     )
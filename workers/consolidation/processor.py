@@ -5,17 +5,64 @@ Orchestrates the memory consolidation pipeline: fetch memories,
 run consolidation engine, update database with merged results.
 """
 
+import asyncio
 import logging
+from array import array
+from collections.abc import Mapping
+from itertools import chain, repeat
 from typing import Any
 from uuid import UUID
 
 from shared.clients import MemoryServiceClient
 from shared.consolidation import ConsolidationEngine
+from shared.consolidation.engine import Memory, MergedMemory
 from shared.embedding import EmbeddingService
 from workers.consolidation.models import ConsolidationRequest, ConsolidationResult
 
 logger = logging.getLogger(__name__)
 
+_VALID_SCOPES = frozenset({"user", "org", "global"})
+
+# Shared validate_request results
+_OK: tuple[bool, str | None] = (True, None)
+_ERR_NO_TYPE: tuple[bool, str | None] = (False, "scope must contain 'type' field")
+_ERR_NO_USER: tuple[bool, str | None] = (False, "user_id is required for user scope")
+
+
+def _chunk_by_tokens(
+    facts: list[str],
+    max_tokens: int = 8000,
+    max_items: int = 256,
+) -> list[tuple[int, int]]:
+    """
+    Split facts into embedding request chunks bounded by size and tokens.
+
+    Tokens are estimated as len(fact) // 4. A single fact over the token
+    budget is placed in a chunk of its own.
+
+    Args:
+        facts: Texts to embed
+        max_tokens: Maximum estimated tokens per chunk
+        max_items: Maximum number of facts per chunk
+
+    Returns:
+        List of (start, stop) index bounds, one per chunk
+    """
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    chunk_tokens = 0
+    for idx, fact in enumerate(facts):
+        fact_tokens = len(fact) // 4
+        if idx > start and (idx - start >= max_items or chunk_tokens + fact_tokens > max_tokens):
+            bounds.append((start, idx))
+            start = idx
+            chunk_tokens = 0
+        chunk_tokens += fact_tokens
+
+    if start < len(facts):
+        bounds.append((start, len(facts)))
+    return bounds
+
 
 class ConsolidationProcessor:
     """
@@ -29,6 +76,9 @@ class ConsolidationProcessor:
         consolidation_engine: ConsolidationEngine,
         embedding_service: EmbeddingService,
         memory_client: MemoryServiceClient,
+        max_concurrent_saves: int = 10,
+        embedding_chunk_size: int = 16,
+        embedding_chunk_max_tokens: int = 8000,
     ):
         """
         Initialize consolidation processor.
@@ -37,10 +87,16 @@ class ConsolidationProcessor:
             consolidation_engine: Engine for consolidating memories
             embedding_service: Service for embedding operations
             memory_client: HTTP client for Memory Service
+            max_concurrent_saves: Maximum concurrent save requests to Memory Service
+            embedding_chunk_size: Number of merged memories embedded per pipeline chunk
+            embedding_chunk_max_tokens: Estimated token budget per embedding chunk
         """
         self.consolidation_engine = consolidation_engine
         self.embedding_service = embedding_service
         self.memory_client = memory_client
+        self.max_concurrent_saves = max_concurrent_saves
+        self.embedding_chunk_size = embedding_chunk_size
+        self.embedding_chunk_max_tokens = embedding_chunk_max_tokens
 
     async def process_request(
         self,
@@ -55,31 +111,38 @@ class ConsolidationProcessor:
         Returns:
             ConsolidationResult with processing details
         """
-        logger.info(f"Processing consolidation for scope {request.scope}")
+        logger.info("Processing consolidation for scope %s", request.scope)
+
+        # Scope fields used for both the fetch filters and the saved memories
+        scope_type = request.scope.get("type")
+        org_id = request.scope.get("org_id")
 
         try:
             # Step 1: Fetch memories for the scope from Memory Service
-            logger.info(f"Fetching memories for scope {request.scope}")
+            logger.info("Fetching memories for scope %s", request.scope)
 
             try:
                 # Build query parameters based on scope
-                scope_type = request.scope.get("type")
                 query_params: dict[str, Any] = {"limit": request.max_memories}
 
                 if scope_type == "user" and request.user_id:
                     query_params["scope_user_id"] = str(request.user_id)
-                elif scope_type == "org" and request.scope.get("org_id"):
-                    query_params["scope_org_id"] = request.scope["org_id"]
+                elif scope_type == "org" and org_id:
+                    query_params["scope_org_id"] = org_id
                 # For global scope, no additional filters needed
 
-                # Fetch memories from Memory Service
-                memories_response = await self.memory_client.list_memories(**query_params)
-                memories = memories_response.get("memories", [])
+                # Stream memories from Memory Service, converting each page to
+                # consolidation Memory format as it arrives
+                to_memory = self._to_memory
+                memories = [
+                    to_memory(mem)
+                    async for mem in self.memory_client.list_memories_stream(**query_params)
+                ]
 
-                logger.info(f"Retrieved {len(memories)} memories from Memory Service")
+                logger.info("Retrieved %d memories from Memory Service", len(memories))
 
             except Exception as e:
-                logger.error(f"Failed to fetch memories from Memory Service: {e}")
+                logger.error("Failed to fetch memories from Memory Service: %s", e)
                 return ConsolidationResult(
                     scope=request.scope,
                     memories_processed=0,
@@ -88,42 +151,28 @@ class ConsolidationProcessor:
                 )
 
             if not memories:
-                logger.info(f"No memories found for scope {request.scope}")
-                return ConsolidationResult(
+                logger.info("No memories found for scope %s", request.scope)
+                return ConsolidationResult.model_construct(
                     scope=request.scope,
                     memories_processed=0,
                     success=True,
                 )
 
-            logger.info(f"Fetched {len(memories)} memories for consolidation")
-
-            # Step 2: Run consolidation engine
-            from shared.consolidation.engine import Memory
-
-            # Convert to consolidation Memory format
-            consolidation_memories = [
-                Memory(
-                    id=UUID(mem.get("id")),
-                    fact=mem.get("fact", ""),
-                    confidence=mem.get("confidence", 0.0),
-                    embedding=mem.get("embedding", []),
-                    source_session_id=(
-                        UUID(mem["source_session_id"]) if mem.get("source_session_id") else None
-                    ),
-                    metadata=mem.get("metadata"),
-                )
-                for mem in memories
-            ]
+            logger.info("Fetched %d memories for consolidation", len(memories))
 
-            consolidation_result = self.consolidation_engine.consolidate_memories(
-                memories=consolidation_memories,
+            # Step 2: Run consolidation engine off the event loop; similarity
+            # scoring is CPU-bound and would stall other handlers
+            consolidation_result = await asyncio.to_thread(
+                self.consolidation_engine.consolidate_memories,
+                memories=memories,
                 detect_conflicts=request.detect_conflicts,
             )
 
             if not consolidation_result.success:
                 logger.error(
-                    f"Consolidation failed for scope {request.scope}: "
-                    f"{consolidation_result.error}"
+                    "Consolidation failed for scope %s: %s",
+                    request.scope,
+                    consolidation_result.error,
                 )
                 return ConsolidationResult(
                     scope=request.scope,
@@ -132,72 +181,43 @@ class ConsolidationProcessor:
                     error=f"Consolidation failed: {consolidation_result.error}",
                 )
 
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Consolidation complete: %d merges, %d conflicts",
+                    consolidation_result.merge_count,
+                    consolidation_result.conflict_count,
+                )
+
+            # Step 3: Embed and save consolidated memories to Memory Service
             logger.info(
-                f"Consolidation complete: {consolidation_result.merge_count} merges, "
-                f"{consolidation_result.conflict_count} conflicts"
+                "Saving %d consolidated memories", len(consolidation_result.merged_memories)
             )
 
-            # Step 3: Generate embeddings for merged memories
-            merged_embeddings: list[list[float]] = []
-            if consolidation_result.merged_memories:
-                merged_facts = [m.fact for m in consolidation_result.merged_memories]
-                embedding_result = self.embedding_service.generate_embeddings(merged_facts)
-
-                if embedding_result.error:
-                    logger.warning(
-                        f"Embedding generation failed for merged memories: "
-                        f"{embedding_result.error}"
-                    )
-                else:
-                    logger.info(
-                        f"Generated {embedding_result.count} embeddings for merged memories"
-                    )
-                    merged_embeddings = embedding_result.embeddings
-
-            # Step 4: Save consolidated memories to Memory Service
-            logger.info(f"Saving {len(consolidation_result.merged_memories)} consolidated memories")
-
-            memories_updated = 0
-            failed_updates = []
-
-            # Build scope dict for Memory Service
+            # Build scope dict for Memory Service once; every save shares it read-only
             scope_dict: dict[str, str] = {}
-            scope_type = request.scope.get("type")
             if scope_type == "user" and request.user_id:
                 scope_dict["user_id"] = str(request.user_id)
-            elif scope_type == "org" and request.scope.get("org_id"):
-                scope_dict["org_id"] = request.scope["org_id"]
-
-            # Save each merged memory
-            for idx, merged_memory in enumerate(consolidation_result.merged_memories):
-                try:
-                    # Get embedding for this merged memory
-                    embedding = merged_embeddings[idx] if idx < len(merged_embeddings) else None
-
-                    # Create consolidated memory via Memory Service
-                    await self.memory_client.create_memory(
-                        scope=scope_dict,
-                        fact=merged_memory.fact,
-                        source_type="consolidated",
-                        embedding=embedding,
-                        confidence=merged_memory.confidence,
-                        importance=0.7,  # Consolidated memories are typically important
-                    )
-                    memories_updated += 1
+            elif scope_type == "org" and org_id:
+                scope_dict["org_id"] = org_id
 
-                    # TODO: Mark superseded memories as soft-deleted
-                    # This would require additional Memory Service API to update memory status
+            memories_updated = 0
+            failed_updates: list[int] = []
+            if consolidation_result.merged_memories:
+                memories_updated, failed_updates = await self._embed_and_save(
+                    merged_memories=consolidation_result.merged_memories,
+                    scope=scope_dict,
+                )
 
-                except Exception as e:
-                    logger.error(f"Failed to save consolidated memory {idx + 1}: {e}")
-                    failed_updates.append(idx)
+            # TODO: Mark superseded memories as soft-deleted
+            # This would require additional Memory Service API to update memory status
 
             logger.info(
-                f"Successfully saved {memories_updated}/{len(consolidation_result.merged_memories)} "
-                f"consolidated memories"
+                "Successfully saved %d/%d consolidated memories",
+                memories_updated,
+                len(consolidation_result.merged_memories),
             )
 
-            return ConsolidationResult(
+            return ConsolidationResult.model_construct(
                 scope=request.scope,
                 memories_processed=consolidation_result.memories_processed,
                 memories_merged=consolidation_result.memories_merged,
@@ -207,13 +227,183 @@ class ConsolidationProcessor:
             )
 
         except Exception as e:
-            logger.exception(f"Unexpected error processing consolidation: {e}")
+            logger.exception("Unexpected error processing consolidation: %s", e)
             return ConsolidationResult(
                 scope=request.scope,
                 success=False,
                 error=f"Processing error: {str(e)}",
             )
 
+    @staticmethod
+    def _to_memory(mem: dict[str, Any]) -> Memory:
+        """
+        Convert a Memory Service record into a consolidation Memory.
+
+        Each field is looked up once; optional fields missing from the record
+        fall back to their defaults. The embedding is packed into a float32 array
+        (4 bytes per value instead of a boxed Python float per value).
+
+        Args:
+            mem: Memory record returned by Memory Service
+
+        Returns:
+            Memory for the consolidation engine
+        """
+        get = mem.get
+        source_session_id = get("source_session_id")
+        return Memory(
+            UUID(get("id")),
+            get("fact", ""),
+            get("confidence", 0.0),
+            array("f", get("embedding") or ()),
+            UUID(source_session_id) if source_session_id else None,
+            get("metadata"),
+        )
+
+    async def _embed_and_save(
+        self,
+        merged_memories: list[MergedMemory],
+        scope: Mapping[str, str],
+    ) -> tuple[int, list[int]]:
+        """
+        Embed and save merged memories as a two-stage pipeline.
+
+        Merged memories are split into chunks bounded by item count and
+        estimated tokens, so no embedding request exceeds the model's input
+        limits. While earlier chunks are being saved, the next chunk is
+        embedded, so embedding and save round-trips overlap. A bounded queue
+        between the stages keeps at most two embedded chunks waiting, and at
+        most max_concurrent_saves bulk save requests are in flight.
+
+        Args:
+            merged_memories: Merged memories to embed and save
+            scope: Scope dict for the memories
+
+        Returns:
+            Tuple of (saved_count, failed_indices)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_saves)
+        queue: asyncio.Queue[tuple[int, list[MergedMemory], list[list[float]]] | None] = (
+            asyncio.Queue(maxsize=2)
+        )
+        failed_indices: list[int] = []
+
+        chunk_bounds = _chunk_by_tokens(
+            [m.fact for m in merged_memories],
+            max_tokens=self.embedding_chunk_max_tokens,
+            max_items=self.embedding_chunk_size,
+        )
+
+        async def embed_chunks() -> None:
+            for start, stop in chunk_bounds:
+                chunk = merged_memories[start:stop]
+                embeddings = await self._embed_merged_memories(chunk)
+                await queue.put((start, chunk, embeddings))
+            await queue.put(None)
+
+        async def save_chunk(
+            start: int, chunk: list[MergedMemory], embeddings: list[list[float]]
+        ) -> None:
+            try:
+                failed_indices.extend(
+                    await self._save_chunk(
+                        scope=scope,
+                        start=start,
+                        chunk=chunk,
+                        embeddings=embeddings,
+                    )
+                )
+            finally:
+                semaphore.release()
+
+        async with asyncio.TaskGroup() as tg:
+
+            async def save_chunks() -> None:
+                while (item := await queue.get()) is not None:
+                    await semaphore.acquire()
+                    tg.create_task(save_chunk(*item))
+
+            tg.create_task(embed_chunks())
+            tg.create_task(save_chunks())
+
+        failed_indices.sort()
+        return len(merged_memories) - len(failed_indices), failed_indices
+
+    async def _embed_merged_memories(self, chunk: list[MergedMemory]) -> list[list[float]]:
+        """
+        Generate embeddings for a chunk of merged memories.
+
+        The embedding service is synchronous, so it runs in a worker thread to
+        keep the event loop free for in-flight saves.
+
+        Args:
+            chunk: Merged memories to embed
+
+        Returns:
+            Embeddings for the chunk, or an empty list if generation failed
+        """
+        merged_facts = [m.fact for m in chunk]
+        embedding_result = await asyncio.to_thread(
+            self.embedding_service.generate_embeddings, merged_facts
+        )
+
+        if embedding_result.error:
+            logger.warning(
+                "Embedding generation failed for merged memories: %s", embedding_result.error
+            )
+            return []
+
+        logger.info("Generated %d embeddings for merged memories", embedding_result.count)
+        return embedding_result.embeddings
+
+    async def _save_chunk(
+        self,
+        scope: Mapping[str, str],
+        start: int,
+        chunk: list[MergedMemory],
+        embeddings: list[list[float]],
+    ) -> list[int]:
+        """
+        Save a chunk of merged memories with one bulk request.
+
+        The Memory Service creates the chunk atomically, so a failed request
+        marks every memory in the chunk as failed.
+
+        Args:
+            scope: Scope dict for the memories
+            start: Index of the first memory of the chunk in the full list
+            chunk: Merged memories to save
+            embeddings: Embeddings for the chunk (may be shorter than chunk)
+
+        Returns:
+            Indices (in the full list) of memories that failed to save
+        """
+        items = [
+            {
+                "fact": merged_memory.fact,
+                "source_type": "consolidated",
+                "embedding": embedding,
+                "confidence": merged_memory.confidence,
+                "importance": 0.7,  # Consolidated memories are typically important
+            }
+            for merged_memory, embedding in zip(
+                chunk, chain(embeddings, repeat(None)), strict=False
+            )
+        ]
+
+        try:
+            await self.memory_client.create_memories_bulk(scope=scope, items=items)
+        except Exception as e:
+            logger.error(
+                "Failed to save consolidated memories %d-%d: %s",
+                start + 1,
+                start + len(chunk),
+                e,
+            )
+            return list(range(start, start + len(chunk)))
+
+        return []
+
     def validate_request(
         self,
         request: ConsolidationRequest,
@@ -228,18 +418,18 @@ class ConsolidationProcessor:
             Tuple of (is_valid, error_message)
         """
         # Validate scope format (even if empty dict)
-        if "type" not in request.scope:
-            return False, "scope must contain 'type' field"
-
         scope_type = request.scope.get("type")
-        if scope_type not in ["user", "org", "global"]:
+        if scope_type is None:
+            return _ERR_NO_TYPE
+
+        if scope_type not in _VALID_SCOPES:
             return False, f"Invalid scope type: {scope_type}"
 
         # For user scope, user_id is required
         if scope_type == "user" and not request.user_id:
-            return False, "user_id is required for user scope"
+            return _ERR_NO_USER
 
         # Note: max_memories validation is handled by Pydantic (ge=10)
         # No need to validate here as invalid values will fail at model construction
 
-        return True, None
+        return _OK
@@ -9,7 +9,7 @@ import asyncio
 import logging
 from typing import Any
 
-from shared.clients import MemoryServiceClient
+from shared.clients import MemoryServiceClient, create_http_client
 from shared.clients.config import HTTPClientSettings
 from shared.consolidation import ConsolidationEngine, ConsolidationSettings
 from shared.embedding import EmbeddingService, EmbeddingSettings
@@ -18,7 +18,8 @@ from shared.messaging.config import MessagingSettings
 from shared.messaging.queues import Queues
 from workers.consolidation.config import (
     ConsolidationWorkerSettings,
-    get_consolidation_worker_settings,
+    ConsolidationWorkerSettingsSnapshot,
+    get_consolidation_worker_settings_snapshot,
 )
 from workers.consolidation.models import ConsolidationRequest
 from workers.consolidation.processor import ConsolidationProcessor
@@ -51,19 +52,25 @@ class ConsolidationWorker:
             messaging_settings: RabbitMQ messaging settings
             http_client_settings: HTTP client configuration
         """
-        self.worker_settings = worker_settings or get_consolidation_worker_settings()
+        self.worker_settings = (
+            ConsolidationWorkerSettingsSnapshot.from_settings(worker_settings)
+            if worker_settings
+            else get_consolidation_worker_settings_snapshot()
+        )
         self.http_client_settings = http_client_settings or HTTPClientSettings()
 
         # Initialize services
         self.consolidation_engine = ConsolidationEngine(settings=consolidation_settings)
         self.embedding_service = EmbeddingService(settings=embedding_settings)
 
-        # Initialize HTTP service client
+        # Initialize HTTP service client over a pooled connection
+        self.http_client = create_http_client(self.http_client_settings)
         self.memory_client = MemoryServiceClient(
             base_url=self.http_client_settings.memory_service_url,
             timeout=self.http_client_settings.memory_service_timeout,
             max_retries=self.http_client_settings.memory_service_max_retries,
             retry_delay=self.http_client_settings.memory_service_retry_delay,
+            http_client=self.http_client,
         )
 
         # Initialize processor with HTTP client
@@ -71,6 +78,9 @@ class ConsolidationWorker:
             consolidation_engine=self.consolidation_engine,
             embedding_service=self.embedding_service,
             memory_client=self.memory_client,
+            max_concurrent_saves=self.worker_settings.max_concurrent_saves,
+            embedding_chunk_size=self.worker_settings.embedding_chunk_size,
+            embedding_chunk_max_tokens=self.worker_settings.embedding_chunk_max_tokens,
         )
 
         # Initialize RabbitMQ client and consumer
@@ -78,13 +88,17 @@ class ConsolidationWorker:
         self.rabbitmq_client = RabbitMQClient(url=self.messaging_settings.rabbitmq_url)
         self.consumer = MessageConsumer(client=self.rabbitmq_client)
 
+        # Bounds in-flight processing; prefetch only controls buffering
+        self._concurrency = asyncio.Semaphore(self.worker_settings.worker_concurrency)
+
         self._is_running = False
 
     async def start(self) -> None:
         """Start the worker and begin consuming messages."""
         logger.info(
-            f"Starting {self.worker_settings.worker_name} "
-            f"(concurrency: {self.worker_settings.worker_concurrency})"
+            "Starting %s (concurrency: %d)",
+            self.worker_settings.worker_name,
+            self.worker_settings.worker_concurrency,
         )
 
         self._is_running = True
@@ -99,18 +113,20 @@ class ConsolidationWorker:
                 handler=self.handle_message,
                 auto_ack=False,
                 prefetch_count=self.worker_settings.worker_prefetch_count,
+                ack_batch_size=self.worker_settings.worker_ack_batch_size,
+                ack_flush_interval=self.worker_settings.worker_ack_flush_ms / 1000,
             )
 
-            logger.info(f"{self.worker_settings.worker_name} started successfully")
+            logger.info("%s started successfully", self.worker_settings.worker_name)
 
         except Exception as e:
-            logger.exception(f"Error starting worker: {e}")
+            logger.exception("Error starting worker: %s", e)
             self._is_running = False
             raise
 
     async def stop(self) -> None:
         """Stop the worker and cleanup resources."""
-        logger.info(f"Stopping {self.worker_settings.worker_name}")
+        logger.info("Stopping %s", self.worker_settings.worker_name)
 
         self._is_running = False
 
@@ -121,11 +137,12 @@ class ConsolidationWorker:
 
         # Close HTTP client
         await self.memory_client.close()
+        await self.http_client.aclose()
 
         self.consolidation_engine.close()
         self.embedding_service.close()
 
-        logger.info(f"{self.worker_settings.worker_name} stopped")
+        logger.info("%s stopped", self.worker_settings.worker_name)
 
     async def handle_message(
         self,
@@ -142,24 +159,27 @@ class ConsolidationWorker:
         """
         try:
             # Parse request
-            request = ConsolidationRequest(**message_data)
+            request = ConsolidationRequest.model_validate(message_data)
 
-            logger.info(f"Received consolidation request for scope {request.scope}")
+            logger.info("Received consolidation request for scope %s", request.scope)
 
             # Validate request
             is_valid, error = self.processor.validate_request(request)
             if not is_valid:
-                logger.error(f"Invalid request for scope {request.scope}: {error}")
+                logger.error("Invalid request for scope %s: %s", request.scope, error)
                 raise ValueError(f"Invalid request: {error}")
 
-            # Process the request
-            result = await self.processor.process_request(request)
+            # Process the request. Prefetched messages wait here, so at most
+            # worker_concurrency requests are processed at once
+            async with self._concurrency:
+                result = await self.processor.process_request(request)
 
             if result.success:
                 logger.info(
-                    f"Successfully processed scope {request.scope}: "
-                    f"{result.memories_merged} merged, "
-                    f"{result.conflicts_detected} conflicts"
+                    "Successfully processed scope %s: %d merged, %d conflicts",
+                    request.scope,
+                    result.memories_merged,
+                    result.conflicts_detected,
                 )
                 # Return result for potential reply queue
                 return {
@@ -171,11 +191,11 @@ class ConsolidationWorker:
                     "success": True,
                 }
             else:
-                logger.error(f"Failed to process scope {request.scope}: {result.error}")
+                logger.error("Failed to process scope %s: %s", request.scope, result.error)
                 raise RuntimeError(f"Processing failed: {result.error}")
 
         except Exception as e:
-            logger.exception(f"Error handling message: {e}")
+            logger.exception("Error handling message: %s", e)
             # Re-raise to trigger message requeue
             raise
 
@@ -208,4 +228,11 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based event loop for faster socket I/O (RabbitMQ, HTTP, Qdrant gRPC);
+    # uvloop is not installed on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
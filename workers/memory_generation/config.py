@@ -6,7 +6,7 @@ Settings for worker behavior, queue configuration, and processing parameters.
 
 from functools import lru_cache
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,10 +32,12 @@ class WorkerSettings(BaseSettings):
         description="Number of concurrent message handlers",
     )
     worker_prefetch_count: int = Field(
-        default=10,
-        ge=1,
-        le=100,
-        description="Number of messages to prefetch from queue",
+        default=0,
+        ge=0,
+        le=1000,
+        description=(
+            "Number of messages to prefetch from queue (0 = max(100, 2 * worker_concurrency))"
+        ),
     )
 
     # Queue Configuration
@@ -52,6 +54,14 @@ class WorkerSettings(BaseSettings):
         description="Routing key for memory generation requests",
     )
 
+    async_storage: bool = Field(
+        default=False,
+        description=(
+            "Publish embedded memories to the memory storage queue instead of "
+            "saving them before acknowledging (requires the memory storage worker)"
+        ),
+    )
+
     # Processing Configuration
     max_retry_attempts: int = Field(
         default=3,
@@ -72,6 +82,21 @@ class WorkerSettings(BaseSettings):
         description="Message time-to-live in seconds",
     )
 
+    @model_validator(mode="after")
+    def derive_prefetch_count(self) -> "WorkerSettings":
+        """
+        Derive the prefetch count from concurrency when not set explicitly.
+
+        A deep prefetch keeps messages buffered locally while handlers await
+        HTTP and LLM I/O, instead of waiting a broker round-trip per message.
+
+        Returns:
+            Settings with worker_prefetch_count resolved
+        """
+        if self.worker_prefetch_count == 0:
+            self.worker_prefetch_count = max(100, 2 * self.worker_concurrency)
+        return self
+
 
 @lru_cache
 def get_worker_settings() -> WorkerSettings:
@@ -7,18 +7,22 @@ Defines message formats and processing results for the memory generation pipelin
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from shared.utils.datetime_utils import get_utc_now
 
 
 class MemoryGenerationRequest(BaseModel):
     """Request to generate memories from session events."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     session_id: UUID = Field(..., description="Session ID to process")
     user_id: UUID = Field(..., description="User ID who owns the session")
     scope: str = Field(default="user", description="Scope for memory (user/org/global)")
     min_events: int = Field(default=3, description="Minimum events required for extraction")
     requested_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=get_utc_now,
         description="When generation was requested",
     )
 
@@ -26,6 +30,8 @@ class MemoryGenerationRequest(BaseModel):
 class ExtractedMemory(BaseModel):
     """Memory extracted from conversation."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     fact: str = Field(..., description="Atomic fact extracted")
     category: str = Field(..., description="Memory category")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
@@ -35,6 +41,8 @@ class ExtractedMemory(BaseModel):
 class MemoryGenerationResult(BaseModel):
     """Result of memory generation processing."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     session_id: UUID = Field(..., description="Session ID processed")
     user_id: UUID = Field(..., description="User ID")
     memories_extracted: int = Field(default=0, description="Number of memories extracted")
@@ -43,6 +51,6 @@ class MemoryGenerationResult(BaseModel):
     success: bool = Field(default=False, description="Whether processing succeeded")
     error: str | None = Field(None, description="Error message if failed")
     processed_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=get_utc_now,
         description="When processing completed",
     )
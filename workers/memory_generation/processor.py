@@ -4,11 +4,20 @@ Memory generation processor.
 Orchestrates the memory extraction and embedding pipeline for a session.
 """
 
+import asyncio
 import logging
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any
+from uuid import UUID
 
 from shared.clients import MemoryServiceClient, SessionsServiceClient
-from shared.embedding import EmbeddingService
+from shared.embedding import CachedEmbeddingService, EmbeddingBatcher, EmbeddingService
 from shared.extraction import ExtractionEngine
+from shared.messaging import MessagePublisher, Queues
 from shared.vector_store import QdrantClientWrapper
 from workers.memory_generation.models import (
     MemoryGenerationRequest,
@@ -17,6 +26,44 @@ from workers.memory_generation.models import (
 
 logger = logging.getLogger(__name__)
 
+_get_fact = itemgetter("fact")
+
+# Shared stand-in for events without a data payload
+_NO_DATA: MappingProxyType[str, Any] = MappingProxyType({})
+
+# Memory Service accepts at most this many items per bulk create request
+_MAX_BULK_ITEMS = 500
+
+
+# Memory scope builders per request scope type; the keys are the valid
+# scopes. Only user scope is supported properly for now; org and global
+# scopes would need additional fields in the request
+_SCOPE_BUILDERS: MappingProxyType[str, Callable[[UUID], dict[str, str]]] = MappingProxyType(
+    {
+        "user": lambda user_id: {"user_id": str(user_id)},
+        "org": lambda _user_id: {},
+        "global": lambda _user_id: {},
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _build_scope(scope_type: str, user_id: UUID) -> MappingProxyType[str, str]:
+    """
+    Build the memory scope for a request.
+
+    Results are cached per (scope_type, user_id) and shared between
+    requests, so they are returned as read-only mappings.
+
+    Args:
+        scope_type: Request scope type (user/org/global)
+        user_id: User who owns the session
+
+    Returns:
+        Read-only scope for Memory Service requests
+    """
+    return MappingProxyType(_SCOPE_BUILDERS[scope_type](user_id))
+
 
 class MemoryGenerationProcessor:
     """
@@ -33,6 +80,10 @@ class MemoryGenerationProcessor:
         vector_store: QdrantClientWrapper,
         sessions_client: SessionsServiceClient,
         memory_client: MemoryServiceClient,
+        embedding_cache: CachedEmbeddingService | None = None,
+        max_concurrent_saves: int = 5,
+        embedding_batcher: EmbeddingBatcher | None = None,
+        storage_publisher: MessagePublisher | None = None,
     ):
         """
         Initialize memory generation processor.
@@ -43,12 +94,22 @@ class MemoryGenerationProcessor:
             vector_store: Vector store client for storing embeddings
             sessions_client: HTTP client for Sessions Service
             memory_client: HTTP client for Memory Service
+            embedding_cache: Optional Redis-backed cache in front of embedding_service
+            max_concurrent_saves: Maximum concurrent save requests to Memory Service
+            embedding_batcher: Optional batcher that shares embedding calls
+                across concurrent requests
+            storage_publisher: Optional publisher that hands embedded memories
+                to the memory storage queue instead of saving them directly
         """
         self.extraction_engine = extraction_engine
         self.embedding_service = embedding_service
         self.vector_store = vector_store
         self.sessions_client = sessions_client
         self.memory_client = memory_client
+        self.embedding_cache = embedding_cache
+        self.max_concurrent_saves = max_concurrent_saves
+        self.embedding_batcher = embedding_batcher
+        self.storage_publisher = storage_publisher
 
     async def process_request(
         self,
@@ -64,35 +125,35 @@ class MemoryGenerationProcessor:
             MemoryGenerationResult with processing details
         """
         logger.info(
-            f"Processing memory generation for session {request.session_id}, "
-            f"user {request.user_id}"
+            "Processing memory generation for session %s, user %s",
+            request.session_id,
+            request.user_id,
         )
 
         try:
             # Step 1: Fetch conversation events from Sessions Service
-            logger.info(f"Fetching events for session {request.session_id}")
+            logger.info("Fetching events for session %s", request.session_id)
 
             try:
-                events_response = await self.sessions_client.list_events(
-                    session_id=request.session_id, limit=1000  # Get all events for the session
-                )
-
-                # Transform events into format expected by extraction engine
+                # Page through events, letting Sessions Service drop events
+                # without content, and transform them into the format expected
+                # by the extraction engine
                 conversation_events = [
-                    {
-                        "speaker": event.get("event_type", "user"),
-                        "content": event.get("data", {}).get("content", ""),
-                    }
-                    for event in events_response.get("events", [])
-                    if event.get("data", {}).get("content")
+                    {"speaker": event.get("event_type", "user"), "content": content}
+                    async for event in self.sessions_client.iter_events(
+                        session_id=request.session_id, has_content=True
+                    )
+                    if (content := event.get("data", _NO_DATA).get("content"))
                 ]
 
                 logger.info(
-                    f"Retrieved {len(conversation_events)} events from session {request.session_id}"
+                    "Retrieved %d events from session %s",
+                    len(conversation_events),
+                    request.session_id,
                 )
 
             except Exception as e:
-                logger.error(f"Failed to fetch events from Sessions Service: {e}")
+                logger.error("Failed to fetch events from Sessions Service: %s", e)
                 return MemoryGenerationResult(
                     session_id=request.session_id,
                     user_id=request.user_id,
@@ -100,28 +161,80 @@ class MemoryGenerationProcessor:
                     error=f"Failed to fetch session events: {str(e)}",
                 )
 
-            # Step 2: Extract memories from conversation
-            extraction_result = self.extraction_engine.extract_memories(
-                conversation_events=conversation_events,
-                min_confidence=0.5,
-            )
+            # Skip extraction, an LLM call per batch, for sessions too short
+            # to yield memories
+            if len(conversation_events) < request.min_events:
+                logger.info(
+                    "Skipping session %s: %d events, need at least %d",
+                    request.session_id,
+                    len(conversation_events),
+                    request.min_events,
+                )
+                return MemoryGenerationResult(
+                    session_id=request.session_id,
+                    user_id=request.user_id,
+                    success=True,
+                    memories_extracted=0,
+                )
 
-            # Check for extraction errors first
-            if extraction_result.error:
+            # Build scope based on request scope type (shared, read-only)
+            scope = _build_scope(request.scope, request.user_id)
+
+            # Step 2: Extract memories batch by batch. Each extracted batch is
+            # embedded in a background task while the next batch is extracted,
+            # so LLM and embedding latency overlap. Nothing is saved until every
+            # batch has been extracted and embedded, so a failed request leaves
+            # no memories behind and can be retried without duplicates.
+            session_id = str(request.session_id)
+            memories_extracted = 0
+            extraction_error = None
+            pending: list[asyncio.Task[tuple[list[dict[str, Any]], int, str | None]]] = []
+            try:
+                for events in self.extraction_engine.batch_events(conversation_events):
+                    extraction_result = await asyncio.to_thread(
+                        self.extraction_engine.extract_memories,
+                        conversation_events=events,
+                        min_confidence=0.5,
+                    )
+                    if extraction_result.error:
+                        extraction_error = extraction_result.error
+                        break
+                    if extraction_result.memory_count:
+                        memories_extracted += extraction_result.memory_count
+                        pending.append(
+                            asyncio.create_task(
+                                self._embed_memories(session_id, extraction_result.memories)
+                            )
+                        )
+            except BaseException:
+                for task in pending:
+                    task.cancel()
+                raise
+
+            if extraction_error:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
                 logger.error(
-                    f"Memory extraction failed for session {request.session_id}: "
-                    f"{extraction_result.error}"
+                    "Memory extraction failed for session %s: %s",
+                    request.session_id,
+                    extraction_error,
                 )
                 return MemoryGenerationResult(
                     session_id=request.session_id,
                     user_id=request.user_id,
+                    memories_extracted=memories_extracted,
                     success=False,
-                    error=f"Extraction failed: {extraction_result.error}",
+                    error=f"Extraction failed: {extraction_error}",
                 )
 
+            results = await asyncio.gather(*pending)
+            embeddings_generated = sum(result[1] for result in results)
+            embedding_error = next((result[2] for result in results if result[2]), None)
+
             # If no error but also no memories, that's still success
-            if extraction_result.memory_count == 0:
-                logger.info(f"No memories extracted for session {request.session_id}")
+            if memories_extracted == 0:
+                logger.info("No memories extracted for session %s", request.session_id)
                 return MemoryGenerationResult(
                     session_id=request.session_id,
                     user_id=request.user_id,
@@ -129,95 +242,43 @@ class MemoryGenerationProcessor:
                     memories_extracted=0,
                 )
 
-            logger.info(
-                f"Extracted {extraction_result.memory_count} memories "
-                f"for session {request.session_id}"
-            )
-
-            # Step 2: Generate embeddings for extracted memories
-            memory_texts = [mem["fact"] for mem in extraction_result.memories]
-            embedding_result = self.embedding_service.generate_embeddings(memory_texts)
-
-            # Check for embedding errors
-            if embedding_result.error:
-                logger.error(
-                    f"Embedding generation failed for session {request.session_id}: "
-                    f"{embedding_result.error}"
-                )
+            if embedding_error:
                 return MemoryGenerationResult(
                     session_id=request.session_id,
                     user_id=request.user_id,
-                    memories_extracted=extraction_result.memory_count,
+                    memories_extracted=memories_extracted,
+                    embeddings_generated=embeddings_generated,
                     success=False,
-                    error=f"Embedding generation failed: {embedding_result.error}",
+                    error=f"Embedding generation failed: {embedding_error}",
                 )
 
-            logger.info(
-                f"Generated {embedding_result.count} embeddings "
-                f"for session {request.session_id}"
-            )
-
-            # Step 3: Store memories to Memory Service
-            logger.info(f"Saving {extraction_result.memory_count} memories to Memory Service")
-
-            saved_count = 0
-            failed_saves = []
-
-            # Build scope based on request scope type
-            # For user scope, include user_id
-            # For org or global scope, we'd need additional fields in the request
-            # For now, we only support user scope properly
-            scope = {}
-            if request.scope == "user":
-                scope["user_id"] = str(request.user_id)
-
-            # Save each memory with its embedding
-            for idx, memory_data in enumerate(extraction_result.memories):
-                try:
-                    # Get corresponding embedding
-                    embedding = (
-                        embedding_result.embeddings[idx]
-                        if idx < len(embedding_result.embeddings)
-                        else None
-                    )
-
-                    # Create memory via Memory Service
-                    await self.memory_client.create_memory(
-                        scope=scope,
-                        fact=memory_data["fact"],
-                        source_type="extracted",
-                        source_id=str(request.session_id),
-                        topic=memory_data.get("topic"),
-                        embedding=embedding,
-                        confidence=memory_data.get("confidence", 1.0),
-                        importance=memory_data.get("importance", 0.5),
-                    )
-                    saved_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to save memory {idx + 1}/{extraction_result.memory_count}: {e}"
-                    )
-                    failed_saves.append(idx)
+            # Step 3: Save all memories in bulk batches. Failed batches are
+            # reported without failing the request, since a retry would save
+            # the successful batches again.
+            items = list(chain.from_iterable(result[0] for result in results))
+            saved_count = await self._save_memories(scope, items)
 
+            failed_count = memories_extracted - saved_count
             logger.info(
-                f"Successfully saved {saved_count}/{extraction_result.memory_count} memories "
-                f"for session {request.session_id}"
+                "Successfully saved %d/%d memories for session %s",
+                saved_count,
+                memories_extracted,
+                request.session_id,
             )
 
             # Return result with actual counts
             return MemoryGenerationResult(
                 session_id=request.session_id,
                 user_id=request.user_id,
-                memories_extracted=extraction_result.memory_count,
+                memories_extracted=memories_extracted,
                 memories_saved=saved_count,
-                embeddings_generated=embedding_result.count,
+                embeddings_generated=embeddings_generated,
                 success=True,
-                error=f"Failed to save {len(failed_saves)} memories" if failed_saves else None,
+                error=f"Failed to save {failed_count} memories" if failed_count else None,
             )
 
         except Exception as e:
-            logger.exception(f"Unexpected error processing session {request.session_id}: {e}")
+            logger.exception("Unexpected error processing session %s: %s", request.session_id, e)
             return MemoryGenerationResult(
                 session_id=request.session_id,
                 user_id=request.user_id,
@@ -225,6 +286,147 @@ class MemoryGenerationProcessor:
                 error=f"Processing error: {str(e)}",
             )
 
+    async def _embed_memories(
+        self,
+        session_id: str,
+        memories: list[dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], int, str | None]:
+        """
+        Embed one batch of extracted memories into Memory Service items.
+
+        Args:
+            session_id: Source session ID
+            memories: Extracted memories
+
+        Returns:
+            Tuple of (items, embeddings_generated, embedding_error)
+        """
+        # Split extracted memories into per-field columns once; facts feed
+        # the embedding call and all columns feed the bulk save
+        facts = list(map(_get_fact, memories))
+        topics = [mem.get("topic") for mem in memories]
+        confidences = [mem.get("confidence", 1.0) for mem in memories]
+        importances = [mem.get("importance", 0.5) for mem in memories]
+
+        try:
+            if self.embedding_cache is not None:
+                embedding_result = await self.embedding_cache.generate_embeddings(facts)
+            elif self.embedding_batcher is not None:
+                embedding_result = await self.embedding_batcher.generate_embeddings(facts)
+            else:
+                embedding_result = await asyncio.to_thread(
+                    self.embedding_service.generate_embeddings, facts
+                )
+        except Exception as e:
+            logger.error("Embedding generation failed for session %s: %s", session_id, e)
+            return [], 0, str(e)
+
+        if embedding_result.error:
+            logger.error(
+                "Embedding generation failed for session %s: %s",
+                session_id,
+                embedding_result.error,
+            )
+            return [], 0, embedding_result.error
+
+        logger.info("Generated %d embeddings for session %s", embedding_result.count, session_id)
+
+        if embedding_result.count != len(facts):
+            # Memories beyond the returned embeddings are saved without one
+            logger.warning(
+                "Embedding count mismatch for session %s: %d embeddings for %d memories",
+                session_id,
+                embedding_result.count,
+                len(facts),
+            )
+
+        source = {"source_type": "extracted", "source_id": session_id}
+        items = [
+            {
+                **source,
+                "fact": fact,
+                "topic": topic,
+                "embedding": embedding,
+                "confidence": confidence,
+                "importance": importance,
+            }
+            for fact, topic, confidence, importance, embedding in zip(
+                facts,
+                topics,
+                confidences,
+                importances,
+                chain(embedding_result.embeddings, repeat(None)),
+                strict=False,
+            )
+        ]
+        return items, embedding_result.count, None
+
+    async def _save_memories(
+        self,
+        scope: Mapping[str, str],
+        items: list[dict[str, Any]],
+    ) -> int:
+        """
+        Save memories in bulk batches, bounded by max_concurrent_saves.
+
+        Args:
+            scope: Memory scope
+            items: Memory fields per item
+
+        Returns:
+            Number of memories saved
+        """
+        logger.info("Saving %d memories to Memory Service", len(items))
+        semaphore = asyncio.Semaphore(self.max_concurrent_saves)
+        batch_starts = range(0, len(items), _MAX_BULK_ITEMS)
+        results = await asyncio.gather(
+            *(
+                self._save_batch(semaphore, scope, items[start : start + _MAX_BULK_ITEMS])
+                for start in batch_starts
+            ),
+            return_exceptions=True,
+        )
+
+        saved_count = len(items)
+        for start, result in zip(batch_starts, results, strict=True):
+            if isinstance(result, BaseException):
+                end = min(start + _MAX_BULK_ITEMS, len(items))
+                logger.error(
+                    "Failed to save memories %d-%d/%d: %s", start + 1, end, len(items), result
+                )
+                saved_count -= end - start
+
+        return saved_count
+
+    async def _save_batch(
+        self,
+        semaphore: asyncio.Semaphore,
+        scope: Mapping[str, str],
+        items: list[dict[str, Any]],
+    ) -> None:
+        """
+        Save a batch of extracted memories with one bulk request.
+
+        The Memory Service inserts a batch in a single transaction, so a
+        failure means none of its memories were saved. With a storage
+        publisher the batch is published to the memory storage queue instead
+        and counts as saved once the broker accepts it.
+
+        Args:
+            semaphore: Semaphore bounding concurrent save requests
+            scope: Memory scope
+            items: Memory fields per item
+        """
+        # Serializers only accept plain dicts, not the shared read-only scope
+        payload_scope = dict(scope)
+        async with semaphore:
+            if self.storage_publisher is not None:
+                await self.storage_publisher.publish(
+                    Queues.MEMORY_STORAGE, {"scope": payload_scope, "items": items}
+                )
+            else:
+                await self.memory_client.create_memories_bulk(scope=payload_scope, items=items)
+
     def validate_request(self, request: MemoryGenerationRequest) -> tuple[bool, str | None]:
         """
         Validate memory generation request.
@@ -241,7 +443,7 @@ class MemoryGenerationProcessor:
         if not request.user_id:
             return False, "user_id is required"
 
-        if request.scope not in ["user", "org", "global"]:
+        if request.scope not in _SCOPE_BUILDERS:
             return False, f"Invalid scope: {request.scope}"
 
         return True, None
@@ -9,11 +9,17 @@ import asyncio
 import logging
 from typing import Any
 
-from shared.clients import MemoryServiceClient, SessionsServiceClient
+from shared.cache import RedisCacheSettings, RedisClient
+from shared.clients import MemoryServiceClient, SessionsServiceClient, create_http_client
 from shared.clients.config import HTTPClientSettings
-from shared.embedding import EmbeddingService, EmbeddingSettings
+from shared.embedding import (
+    CachedEmbeddingService,
+    EmbeddingBatcher,
+    EmbeddingService,
+    EmbeddingSettings,
+)
 from shared.extraction import ExtractionEngine, ExtractionSettings
-from shared.messaging import MessageConsumer, RabbitMQClient
+from shared.messaging import MessageConsumer, MessagePublisher, RabbitMQClient
 from shared.messaging.config import MessagingSettings
 from shared.messaging.queues import Queues
 from shared.vector_store import QdrantClientWrapper, QdrantSettings
@@ -40,6 +46,7 @@ class MemoryGenerationWorker:
         qdrant_settings: QdrantSettings | None = None,
         messaging_settings: MessagingSettings | None = None,
         http_client_settings: HTTPClientSettings | None = None,
+        redis_settings: RedisCacheSettings | None = None,
     ):
         """
         Initialize memory generation worker.
@@ -51,6 +58,7 @@ class MemoryGenerationWorker:
             qdrant_settings: Qdrant client settings
             messaging_settings: RabbitMQ messaging settings
             http_client_settings: HTTP client configuration
+            redis_settings: Redis settings for the embedding cache
         """
         self.worker_settings = worker_settings or get_worker_settings()
         self.http_client_settings = http_client_settings or HTTPClientSettings()
@@ -60,20 +68,55 @@ class MemoryGenerationWorker:
         self.embedding_service = EmbeddingService(settings=embedding_settings)
         self.vector_store = QdrantClientWrapper(settings=qdrant_settings)
 
-        # Initialize HTTP service clients
+        # Coalesce embedding calls from concurrently processed sessions
+        self.embedding_batcher = EmbeddingBatcher(self.embedding_service)
+
+        # Initialize embedding cache (vectors are stored as raw bytes)
+        self.redis_settings = redis_settings or RedisCacheSettings()
+        self.redis_client: RedisClient | None = None
+        self.embedding_cache: CachedEmbeddingService | None = None
+        if self.redis_settings.enable_cache:
+            self.redis_client = RedisClient(
+                url=self.redis_settings.get_effective_url(),
+                max_connections=self.redis_settings.max_connections,
+                decode_responses=False,
+                socket_timeout=self.redis_settings.socket_timeout,
+                socket_connect_timeout=self.redis_settings.socket_connect_timeout,
+            )
+            self.embedding_cache = CachedEmbeddingService(
+                embedding_service=self.embedding_service,
+                redis_client=self.redis_client,
+                batcher=self.embedding_batcher,
+            )
+
+        # Initialize HTTP service clients over one shared connection pool
+        self.http_client = create_http_client(self.http_client_settings)
         self.sessions_client = SessionsServiceClient(
             base_url=self.http_client_settings.sessions_service_url,
             timeout=self.http_client_settings.sessions_service_timeout,
             max_retries=self.http_client_settings.sessions_service_max_retries,
             retry_delay=self.http_client_settings.sessions_service_retry_delay,
+            http_client=self.http_client,
         )
         self.memory_client = MemoryServiceClient(
             base_url=self.http_client_settings.memory_service_url,
             timeout=self.http_client_settings.memory_service_timeout,
             max_retries=self.http_client_settings.memory_service_max_retries,
             retry_delay=self.http_client_settings.memory_service_retry_delay,
+            http_client=self.http_client,
         )
 
+        # Initialize RabbitMQ client and consumer
+        self.messaging_settings = messaging_settings or MessagingSettings()
+        self.rabbitmq_client = RabbitMQClient(url=self.messaging_settings.rabbitmq_url)
+        self.consumer = MessageConsumer(client=self.rabbitmq_client)
+
+        # With async storage, saves are handed to the memory storage worker so
+        # requests are acknowledged without waiting on Memory Service writes
+        self.storage_publisher: MessagePublisher | None = None
+        if self.worker_settings.async_storage:
+            self.storage_publisher = MessagePublisher(client=self.rabbitmq_client)
+
         # Initialize processor with HTTP clients
         self.processor = MemoryGenerationProcessor(
             extraction_engine=self.extraction_engine,
@@ -81,25 +124,35 @@ class MemoryGenerationWorker:
             vector_store=self.vector_store,
             sessions_client=self.sessions_client,
             memory_client=self.memory_client,
+            embedding_cache=self.embedding_cache,
+            max_concurrent_saves=self.worker_settings.worker_concurrency,
+            embedding_batcher=self.embedding_batcher,
+            storage_publisher=self.storage_publisher,
         )
 
-        # Initialize RabbitMQ client and consumer
-        self.messaging_settings = messaging_settings or MessagingSettings()
-        self.rabbitmq_client = RabbitMQClient(url=self.messaging_settings.rabbitmq_url)
-        self.consumer = MessageConsumer(client=self.rabbitmq_client)
+        # Bounds in-flight processing; prefetch only controls buffering
+        self._concurrency = asyncio.Semaphore(self.worker_settings.worker_concurrency)
 
         self._is_running = False
 
     async def start(self) -> None:
         """Start the worker and begin consuming messages."""
         logger.info(
-            f"Starting {self.worker_settings.worker_name} "
-            f"(concurrency: {self.worker_settings.worker_concurrency})"
+            "Starting %s (concurrency: %d)",
+            self.worker_settings.worker_name,
+            self.worker_settings.worker_concurrency,
         )
 
         self._is_running = True
 
         try:
+            # Connect to Redis; the embedding cache falls back to uncached on failure
+            if self.redis_client is not None:
+                try:
+                    await self.redis_client.connect()
+                except Exception as e:
+                    logger.warning("Embedding cache unavailable, continuing without it: %s", e)
+
             # Connect to RabbitMQ
             await self.rabbitmq_client.connect()
 
@@ -111,16 +164,16 @@ class MemoryGenerationWorker:
                 prefetch_count=self.worker_settings.worker_prefetch_count,
             )
 
-            logger.info(f"{self.worker_settings.worker_name} started successfully")
+            logger.info("%s started successfully", self.worker_settings.worker_name)
 
         except Exception as e:
-            logger.exception(f"Error starting worker: {e}")
+            logger.exception("Error starting worker: %s", e)
             self._is_running = False
             raise
 
     async def stop(self) -> None:
         """Stop the worker and cleanup resources."""
-        logger.info(f"Stopping {self.worker_settings.worker_name}")
+        logger.info("Stopping %s", self.worker_settings.worker_name)
 
         self._is_running = False
 
@@ -132,12 +185,17 @@ class MemoryGenerationWorker:
         # Close HTTP clients
         await self.sessions_client.close()
         await self.memory_client.close()
+        await self.http_client.aclose()
+
+        await self.embedding_batcher.close()
+        if self.redis_client is not None:
+            await self.redis_client.disconnect()
 
         self.extraction_engine.close()
         self.embedding_service.close()
         self.vector_store.close()
 
-        logger.info(f"{self.worker_settings.worker_name} stopped")
+        logger.info("%s stopped", self.worker_settings.worker_name)
 
     async def handle_message(
         self,
@@ -154,40 +212,46 @@ class MemoryGenerationWorker:
         """
         try:
             # Parse request
-            request = MemoryGenerationRequest(**message_data)
+            request = MemoryGenerationRequest.model_validate(message_data)
 
-            logger.info(f"Received memory generation request for session {request.session_id}")
+            logger.info("Received memory generation request for session %s", request.session_id)
 
             # Validate request
             is_valid, error = self.processor.validate_request(request)
             if not is_valid:
-                logger.error(f"Invalid request for session {request.session_id}: {error}")
+                logger.error("Invalid request for session %s: %s", request.session_id, error)
                 raise ValueError(f"Invalid request: {error}")
 
-            # Process the request (processor now fetches events from Sessions Service)
-            result = await self.processor.process_request(request)
+            # Process the request (processor fetches events from Sessions Service).
+            # Prefetched messages wait here, so at most worker_concurrency
+            # requests are processed at once
+            async with self._concurrency:
+                result = await self.processor.process_request(request)
 
             if result.success:
                 logger.info(
-                    f"Successfully processed session {request.session_id}: "
-                    f"{result.memories_extracted} memories extracted, "
-                    f"{result.embeddings_generated} embeddings generated"
+                    "Successfully processed session %s: %d memories extracted, "
+                    "%d embeddings generated",
+                    request.session_id,
+                    result.memories_extracted,
+                    result.embeddings_generated,
                 )
-                # Return result for potential reply queue
+                # Return result for potential reply queue; the reply encoder
+                # serializes UUIDs as strings
                 return {
-                    "session_id": str(result.session_id),
-                    "user_id": str(result.user_id),
+                    "session_id": result.session_id,
+                    "user_id": result.user_id,
                     "memories_extracted": result.memories_extracted,
                     "memories_saved": result.memories_saved,
                     "embeddings_generated": result.embeddings_generated,
                     "success": True,
                 }
             else:
-                logger.error(f"Failed to process session {request.session_id}: {result.error}")
+                logger.error("Failed to process session %s: %s", request.session_id, result.error)
                 raise RuntimeError(f"Processing failed: {result.error}")
 
         except Exception as e:
-            logger.exception(f"Error handling message: {e}")
+            logger.exception("Error handling message: %s", e)
             # Re-raise to trigger message requeue
             raise
 
@@ -220,4 +284,11 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based event loop for faster socket I/O (RabbitMQ, HTTP, Qdrant gRPC);
+    # uvloop is not installed on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -0,0 +1,6 @@
+"""
+Memory storage worker for ContextIQ.
+
+This worker consumes embedded memories from RabbitMQ and writes them to
+the Memory Service, decoupling storage from memory generation.
+"""
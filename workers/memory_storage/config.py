@@ -0,0 +1,64 @@
+"""
+Configuration for memory storage worker.
+
+Settings for worker concurrency and queue prefetching.
+"""
+
+from functools import lru_cache
+
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MemoryStorageWorkerSettings(BaseSettings):
+    """Settings for memory storage worker."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="MEMORY_STORAGE_WORKER_",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    # Worker Configuration
+    worker_name: str = Field(
+        default="memory-storage-worker",
+        description="Worker instance name for logging",
+    )
+    worker_concurrency: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Number of concurrent Memory Service writes",
+    )
+    worker_prefetch_count: int = Field(
+        default=0,
+        ge=0,
+        le=1000,
+        description=(
+            "Number of messages to prefetch from queue (0 = max(100, 2 * worker_concurrency))"
+        ),
+    )
+
+    @model_validator(mode="after")
+    def derive_prefetch_count(self) -> "MemoryStorageWorkerSettings":
+        """
+        Derive the prefetch count from concurrency when not set explicitly.
+
+        Returns:
+            Settings with worker_prefetch_count resolved
+        """
+        if self.worker_prefetch_count == 0:
+            self.worker_prefetch_count = max(100, 2 * self.worker_concurrency)
+        return self
+
+
+@lru_cache
+def get_memory_storage_worker_settings() -> MemoryStorageWorkerSettings:
+    """
+    Get cached memory storage worker settings instance.
+
+    Returns:
+        Cached MemoryStorageWorkerSettings instance
+    """
+    return MemoryStorageWorkerSettings()
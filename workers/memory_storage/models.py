@@ -0,0 +1,20 @@
+"""
+Data models for memory storage worker.
+
+Defines the message format published by the memory generation worker.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MemoryStorageRequest(BaseModel):
+    """Batch of embedded memories to write to the Memory Service."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
+    scope: dict[str, str] = Field(..., description="Scope shared by all memories")
+    items: list[dict[str, Any]] = Field(
+        ..., min_length=1, description="Memory fields per item, including embeddings"
+    )
@@ -0,0 +1,205 @@
+"""
+Memory storage worker.
+
+Background worker that consumes embedded memories from RabbitMQ and
+writes them to the Memory Service, so memory generation can acknowledge
+requests without waiting on storage.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+from pydantic import ValidationError
+
+from shared.clients import MemoryServiceClient, create_http_client
+from shared.clients.config import HTTPClientSettings
+from shared.exceptions import MessageRejectedError
+from shared.messaging import MessageConsumer, RabbitMQClient
+from shared.messaging.config import MessagingSettings
+from shared.messaging.queues import Queues
+from workers.memory_storage.config import (
+    MemoryStorageWorkerSettings,
+    get_memory_storage_worker_settings,
+)
+from workers.memory_storage.models import MemoryStorageRequest
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryStorageWorker:
+    """
+    Worker for writing embedded memories to the Memory Service.
+
+    Consumes batches published by the memory generation worker and saves
+    each with one bulk request.
+    """
+
+    def __init__(
+        self,
+        worker_settings: MemoryStorageWorkerSettings | None = None,
+        messaging_settings: MessagingSettings | None = None,
+        http_client_settings: HTTPClientSettings | None = None,
+    ):
+        """
+        Initialize memory storage worker.
+
+        Args:
+            worker_settings: Worker configuration
+            messaging_settings: RabbitMQ messaging settings
+            http_client_settings: HTTP client configuration
+        """
+        self.worker_settings = worker_settings or get_memory_storage_worker_settings()
+        self.http_client_settings = http_client_settings or HTTPClientSettings()
+
+        # Initialize HTTP service client over a pooled connection
+        self.http_client = create_http_client(self.http_client_settings)
+        self.memory_client = MemoryServiceClient(
+            base_url=self.http_client_settings.memory_service_url,
+            timeout=self.http_client_settings.memory_service_timeout,
+            max_retries=self.http_client_settings.memory_service_max_retries,
+            retry_delay=self.http_client_settings.memory_service_retry_delay,
+            http_client=self.http_client,
+        )
+
+        # Initialize RabbitMQ client and consumer
+        self.messaging_settings = messaging_settings or MessagingSettings()
+        self.rabbitmq_client = RabbitMQClient(url=self.messaging_settings.rabbitmq_url)
+        self.consumer = MessageConsumer(client=self.rabbitmq_client)
+
+        # Bounds in-flight writes; prefetch only controls buffering
+        self._concurrency = asyncio.Semaphore(self.worker_settings.worker_concurrency)
+
+        self._is_running = False
+
+    async def start(self) -> None:
+        """Start the worker and begin consuming messages."""
+        logger.info(
+            "Starting %s (concurrency: %d)",
+            self.worker_settings.worker_name,
+            self.worker_settings.worker_concurrency,
+        )
+
+        self._is_running = True
+
+        try:
+            # Connect to RabbitMQ
+            await self.rabbitmq_client.connect()
+
+            # Start consuming messages from memory storage queue
+            await self.consumer.run_consumer(
+                queue_config=Queues.MEMORY_STORAGE,
+                handler=self.handle_message,
+                auto_ack=False,
+                prefetch_count=self.worker_settings.worker_prefetch_count,
+            )
+
+            logger.info("%s started successfully", self.worker_settings.worker_name)
+
+        except Exception as e:
+            logger.exception("Error starting worker: %s", e)
+            self._is_running = False
+            raise
+
+    async def stop(self) -> None:
+        """Stop the worker and cleanup resources."""
+        logger.info("Stopping %s", self.worker_settings.worker_name)
+
+        self._is_running = False
+
+        # Stop consumer and close RabbitMQ connection
+        self.consumer.stop()
+        await self.consumer.stop_all()
+        await self.rabbitmq_client.disconnect()
+
+        # Close HTTP client
+        await self.memory_client.close()
+        await self.http_client.aclose()
+
+        logger.info("%s stopped", self.worker_settings.worker_name)
+
+    async def handle_message(
+        self,
+        message_data: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """
+        Handle incoming memory storage message.
+
+        Args:
+            message_data: Parsed message data
+
+        Returns:
+            Result dict if successful
+
+        Raises:
+            MessageRejectedError: If the message or its batch is invalid, so
+                redelivering it would fail the same way
+        """
+        try:
+            request = MemoryStorageRequest.model_validate(message_data)
+
+            # The Memory Service inserts the batch in one transaction, so a
+            # failed write is retried as a whole
+            async with self._concurrency:
+                await self.memory_client.create_memories_bulk(
+                    scope=request.scope, items=request.items
+                )
+
+            logger.info("Saved %d memories to Memory Service", len(request.items))
+            return {"memories_saved": len(request.items), "success": True}
+
+        except ValidationError as e:
+            logger.error("Invalid memory storage message: %s", e)
+            raise MessageRejectedError(f"Invalid memory storage message: {e}") from e
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                logger.exception("Error handling message: %s", e)
+                raise
+            # A 4xx means the batch itself was refused, so a retry cannot succeed
+            logger.error("Memory Service rejected batch: %s", e)
+            raise MessageRejectedError(f"Memory Service rejected batch: {e}") from e
+
+        except Exception as e:
+            logger.exception("Error handling message: %s", e)
+            # Re-raise to trigger message requeue
+            raise
+
+    @property
+    def is_running(self) -> bool:
+        """Check if worker is currently running."""
+        return self._is_running
+
+
+async def main() -> None:
+    """Main entry point for the worker."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    worker = MemoryStorageWorker()
+
+    try:
+        await worker.start()
+
+        # Keep worker running
+        while worker.is_running:
+            await asyncio.sleep(1)
+
+    except KeyboardInterrupt:
+        logger.info("Received shutdown signal")
+    finally:
+        await worker.stop()
+
+
+if __name__ == "__main__":
+    # libuv-based event loop for faster socket I/O (RabbitMQ, HTTP);
+    # uvloop is not installed on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())